@@ -22,6 +22,7 @@ import time
 from typing import List, Dict, Any, Tuple
 from datetime import datetime, date
 from django.db import transaction
+from django.core.cache import cache
 from django.db.models import Q, Count
 from django.utils import timezone
 from difflib import SequenceMatcher
@@ -983,12 +984,12 @@ class JobMatcher:
                         existing_match.location_match = match_data.get('location_match', False)
                         existing_match.work_policy_match = match_data.get('work_policy_match', False)
                         existing_match.skill_match = match_data.get('skill_match', False)
-                        existing_match.matched_skills = json.dumps(match_data.get('matched_skills', []))
+                        existing_match.matched_skills = match_data.get('matched_skills', [])
                         existing_match.match_reason = match_data.get('match_reason', '')
                         existing_match.industry_1_match = match_data.get('industry_1_match', False)
                         existing_match.industry_2_match = match_data.get('industry_2_match', False)
-                        existing_match.matched_industry_1 = json.dumps(match_data.get('matched_industry_1', []))
-                        existing_match.matched_industry_2 = json.dumps(match_data.get('matched_industry_2', []))
+                        existing_match.matched_industry_1 = match_data.get('matched_industry_1', [])
+                        existing_match.matched_industry_2 = match_data.get('matched_industry_2', [])
                         existing_match.status = 'active'
                         existing_match.save()
                     else:
@@ -1001,12 +1002,12 @@ class JobMatcher:
                             location_match=match_data.get('location_match', False),
                             work_policy_match=match_data.get('work_policy_match', False),
                             skill_match=match_data.get('skill_match', False),
-                            matched_skills=json.dumps(match_data.get('matched_skills', [])),
+                            matched_skills=match_data.get('matched_skills', []),
                             match_reason=match_data.get('match_reason', ''),
                             industry_1_match=match_data.get('industry_1_match', False),
                             industry_2_match=match_data.get('industry_2_match', False),
-                            matched_industry_1=json.dumps(match_data.get('matched_industry_1', [])),
-                            matched_industry_2=json.dumps(match_data.get('matched_industry_2', [])),
+                            matched_industry_1=match_data.get('matched_industry_1', []),
+                            matched_industry_2=match_data.get('matched_industry_2', []),
                             status='active'
                         )
                     
@@ -1030,6 +1031,7 @@ class JobMatcher:
             
             # Store matches
             stored_count = self.store_matches(matches)
+            invalidate_job_matches_cache(contact_id)
             
             return {
                 'contact_id': contact_id,
@@ -1106,6 +1108,34 @@ class JobMatcher:
             return []
 
 
+def get_job_matches_cache_version(contact_id: str) -> int:
+    """
+    Get the current version of a contact's cached job matches responses
+    
+    Args:
+        contact_id: Zoho contact ID
+        
+    Returns:
+        Version stamp to include in the response cache keys (0 if never invalidated)
+    """
+    return cache.get(f"jm:{contact_id}:version", 0)
+
+
+def invalidate_job_matches_cache(contact_id: str):
+    """
+    Invalidate every cached job matches response for a contact
+    
+    Bumping the version retires the responses cached for all page sizes at once.
+    
+    Args:
+        contact_id: Zoho contact ID
+    """
+    try:
+        cache.set(f"jm:{contact_id}:version", time.time_ns(), None)
+    except Exception as e:
+        logger.warning(f"Could not invalidate cached job matches for contact {contact_id}: {e}")
+
+
 def match_jobs_for_contact(contact_id: str, min_score: float = 0.2) -> Dict[str, Any]:
     """
     Enhanced standalone function to match jobs for a specific contact
@@ -1156,9 +1186,9 @@ def match_jobs_for_contact(contact_id: str, min_score: float = 0.2) -> Dict[str,
                         industry_1_match=match['industry_1_match'],
                         industry_2_match=match['industry_2_match'],
                         skill_match=match['skill_match'],
-                        matched_industry_1=json.dumps(match['matched_industry_1']),
-                        matched_industry_2=json.dumps(match['matched_industry_2']),
-                        matched_skills=json.dumps(match['matched_skills']),
+                        matched_industry_1=match['matched_industry_1'],
+                        matched_industry_2=match['matched_industry_2'],
+                        matched_skills=match['matched_skills'],
                         match_reason=match['match_reason'],
                         status='active'
                     )
@@ -1169,6 +1199,8 @@ def match_jobs_for_contact(contact_id: str, min_score: float = 0.2) -> Dict[str,
                     logger.error(f"Error creating match for role {match['intern_role_id']}: {e}")
                     continue
         
+        invalidate_job_matches_cache(contact_id)
+        
         result = {
             'contact_id': contact_id,
             'total_matches': len(matches),
@@ -2,9 +2,9 @@ import logging
 import json
 import time
 import requests
-from datetime import datetime, timezone, date
+from datetime import datetime, timedelta, timezone, date
 from django.utils import timezone as django_timezone
-from django.db import transaction
+from django.db import connection, transaction
 from django.db.utils import IntegrityError
 
 from zoho_app.models import Contact, Account, InternRole, SyncTracker, Deal, RoleDealSync
@@ -14,6 +14,13 @@ from zoho.api_client import ZohoClient
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Number of mapped records written per bulk upsert during module syncs
+SYNC_BATCH_SIZE = 1000
+
+# If-Modified-Since is exclusive, so incremental syncs ask for a little before the
+# watermark to include records modified at the same second
+INCREMENTAL_SYNC_OVERLAP = timedelta(seconds=1)
+
 
 def get_sync_tracker(entity_type):
     """Get sync tracker for a specific entity type"""
@@ -34,17 +41,19 @@ def update_sync_tracker(entity_type, last_timestamp, records_count):
         if last_timestamp and hasattr(last_timestamp, 'tzinfo') and last_timestamp.tzinfo is None:
             last_timestamp = last_timestamp.replace(tzinfo=timezone.utc)
         
-        tracker, created = SyncTracker.objects.get_or_create(
-            entity_type=entity_type,
-            defaults={
-                'last_sync_timestamp': last_timestamp,
-                'records_synced': records_count
-            }
-        )
-        if not created:
-            tracker.last_sync_timestamp = last_timestamp
-            tracker.records_synced += records_count
-            tracker.save()
+        # Savepoint so a failed tracker write does not break an enclosing batch transaction
+        with transaction.atomic():
+            tracker, created = SyncTracker.objects.get_or_create(
+                entity_type=entity_type,
+                defaults={
+                    'last_sync_timestamp': last_timestamp,
+                    'records_synced': records_count
+                }
+            )
+            if not created:
+                tracker.last_sync_timestamp = last_timestamp
+                tracker.records_synced += records_count
+                tracker.save()
         
         logger.info(f"Updated sync tracker for {entity_type}: {records_count} records, last_timestamp: {last_timestamp}")
         
@@ -71,7 +80,9 @@ def build_incremental_criteria(last_sync_timestamp):
     if formatted_time_str.endswith('+0000'):
         formatted_time_str = formatted_time_str[:-5] + '+00:00'
     
-    criteria = f"(Modified_Time:greater_than:{formatted_time_str})"
+    # Inclusive so records sharing the watermark's timestamp (e.g. after a mass edit)
+    # are fetched again on resume; the upserts are idempotent
+    criteria = f"(Modified_Time:greater_equal:{formatted_time_str})"
     logger.info(f"Built incremental criteria: {criteria}")
     return criteria
 
@@ -148,19 +159,129 @@ def extract_nested_email(obj):
     return None
 
 
+def iter_zoho_records(zoho_client, module, fields, criteria=None, modified_since=None):
+    """
+    Stream records from a Zoho module page by page, oldest modification first
+    
+    Args:
+        zoho_client: ZohoClient instance
+        module: CRM module name (Contacts, Accounts, etc.)
+        fields: List of fields to fetch
+        criteria: Filter criteria for incremental syncs
+        modified_since: Sync watermark sent to Zoho as If-Modified-Since
+        
+    Yields:
+        Individual record dictionaries
+    """
+    for page in zoho_client.iter_pages(
+        module=module,
+        fields=fields,
+        criteria=criteria,
+        sort_by='Modified_Time',
+        sort_order='asc',
+        modified_since=modified_since
+    ):
+        yield from page
+
+
+def flush_sync_batch(model, batch, label):
+    """
+    Upsert a batch of mapped records keyed by Zoho record id
+    
+    Args:
+        model: Django model class whose primary key is the Zoho record id
+        batch: Dictionary of record id -> mapped field dictionary
+        label: Entity label used in log messages
+        
+    Returns:
+        Number of records written
+    """
+    if not batch:
+        return 0
+    
+    rows = list(batch.values())
+    update_fields = [name for name in rows[0] if name != 'id']
+    # MySQL upserts on any unique key and rejects an explicit conflict target
+    unique_fields = ['id'] if connection.features.supports_update_conflicts_with_target else None
+    
+    try:
+        with transaction.atomic():
+            model.objects.bulk_create(
+                [model(**row) for row in rows],
+                update_conflicts=True,
+                unique_fields=unique_fields,
+                update_fields=update_fields,
+                batch_size=SYNC_BATCH_SIZE
+            )
+        return len(rows)
+    except Exception as e:
+        logger.warning(f"Bulk upsert of {len(rows)} {label} records failed, retrying row by row: {str(e)}")
+    
+    # Fall back to per-record writes so one bad row does not drop the whole batch
+    written = 0
+    for row in rows:
+        try:
+            with transaction.atomic():
+                model.objects.update_or_create(id=row['id'], defaults=row)
+            written += 1
+        except Exception as e:
+            logger.error(f"Error processing {label} {row.get('id')}: {str(e)}")
+    return written
+
+
+def flush_sync_checkpoint(model, batch, label, entity_type, latest_modified, progress):
+    """
+    Upsert a batch and checkpoint the sync watermark, committing both at once
+    
+    Records arrive oldest first, so the checkpoint lets a failed sync resume after
+    this batch. The watermark only advances while every row so far has been
+    written; after a failed row it stays put, so the next incremental sync fetches
+    that row again.
+    
+    The shared transaction saves a commit per batch; it is not all-or-nothing.
+    flush_sync_batch and update_sync_tracker each log and absorb their own
+    failures, so a failed tracker write keeps the rows and leaves the watermark at
+    the previous checkpoint, which only means they are fetched again.
+    
+    Args:
+        model: Django model class whose primary key is the Zoho record id
+        batch: Dictionary of record id -> mapped field dictionary; cleared once written
+        label: Entity label used in log messages
+        entity_type: SyncTracker entity type
+        latest_modified: Latest Modified_Time seen so far in this sync
+        progress: Counters for this sync ('synced', 'checkpointed', 'failed'), updated in place
+        
+    Returns:
+        Number of records written
+    """
+    with transaction.atomic():
+        written = flush_sync_batch(model, batch, label)
+        progress['synced'] += written
+        if written < len(batch):
+            progress['failed'] += len(batch) - written
+            logger.warning(f"{len(batch) - written} {label} records failed; {entity_type} watermark held back")
+        elif latest_modified and not progress['failed']:
+            update_sync_tracker(entity_type, latest_modified, progress['synced'] - progress['checkpointed'])
+            progress['checkpointed'] = progress['synced']
+    batch.clear()
+    return written
+
+
 def sync_contacts(incremental=True):
     """Sync contacts from Zoho CRM to Django database"""
     logger.info("Starting contact sync...")
     zoho = ZohoClient()
     
-    # Determine sync criteria
+    # Determine sync criteria; the tracker's watermark also goes to Zoho as If-Modified-Since
     criteria = None
+    modified_since = None
     last_sync_info = ""
     
     if incremental:
         tracker = get_sync_tracker('contacts')
         if tracker.last_sync_timestamp:
             criteria = build_incremental_criteria(tracker.last_sync_timestamp)
+            modified_since = tracker.last_sync_timestamp - INCREMENTAL_SYNC_OVERLAP
             last_sync_info = f" (incremental since {tracker.last_sync_timestamp})"
         else:
             last_sync_info = " (full sync - no previous sync found)"
@@ -252,243 +373,224 @@ def sync_contacts(incremental=True):
     ]
     
     try:
-        # Fetch data from Zoho
-        zoho_contacts = zoho.get_paginated_data(
-            module='Contacts',
-            fields=contact_fields,
-            criteria=criteria,
-            sort_by='Modified_Time',
-            sort_order='asc'
-        )
-        
-        logger.info(f"Retrieved {len(zoho_contacts)} contacts from Zoho")
-        
-        if not zoho_contacts:
-            logger.info("No contacts to sync")
-            return
-        
-        # Process contacts
-        synced_count = 0
+        # Stream contacts from Zoho and upsert them in fixed-size batches
+        progress = {'synced': 0, 'checkpointed': 0, 'failed': 0}
         latest_modified = None
+        batch = {}
         
-        for contact_data in zoho_contacts:
+        for contact_data in iter_zoho_records(zoho, 'Contacts', contact_fields, criteria, modified_since):
             try:
-                with transaction.atomic():
-                    contact_fields_mapped = {
-                        # Core fields
-                        'id': contact_data.get('id'),
-                        'email': contact_data.get('Email'),
-                        'first_name': contact_data.get('First_Name'),
-                        'last_name': contact_data.get('Last_Name'),
-                        'phone': contact_data.get('Phone'),
-                        'account_name': extract_nested_name(contact_data.get('Account_Name')),
-                        'title': contact_data.get('Title'),
-                        'department': contact_data.get('Department'),
-                        'updated_time': parse_datetime_field(contact_data.get('Modified_Time')),
-                        'created_time': parse_datetime_field(contact_data.get('Created_Time')),
-                        'full_name': contact_data.get('Full_Name'),
-                        
-                        # Location and Industry fields
-                        'location': contact_data.get('Location'),
-                        'industry': contact_data.get('Industry'),
-                        'industry_choice_1': contact_data.get('Industry_Choice_1'),
-                        'industry_choice_2': contact_data.get('Industry_choice_2'),  # Note: lowercase 'choice'
-                        'industry_choice_3': contact_data.get('Industry_Choice_3'),
-                        'industry_1_areas': contact_data.get('Industry_1_Areas'),
-                        'industry_2_areas': contact_data.get('Industry_2_Areas'),
-                        'current_location_v2': contact_data.get('Current_Location_V2'),
-                        'location_other': contact_data.get('Location_Other'),
-                        'alternative_location1': contact_data.get('Alternative_Location1'),
-                        'country_city_of_residence': contact_data.get('Country_city_of_residence'),
-                        
-                        # Student and Academic fields
-                        'skills': contact_data.get('Skills'),
-                        'student_status': contact_data.get('Student_Status'),
-                        'university_name': contact_data.get('University_Name'),
-                        'graduation_date': parse_datetime_field(contact_data.get('Graduation_Date')),
-                        'student_bio': contact_data.get('Student_Bio'),
-                        'placement_automation': contact_data.get('Placement_Automation'),
-                        'uni_start_date': parse_datetime_field(contact_data.get('Uni_Start_Date')),
-                        'english_level': contact_data.get('English_Level'),
-                        'age_on_start_date': contact_data.get('Age_on_Start_Date'),
-                        'date_of_birth': parse_datetime_field(contact_data.get('Date_of_Birth')),
-                        
-                        # Placement and Role fields
-                        'placement_status': contact_data.get('Placement_status'),
-                        'start_date': parse_datetime_field(contact_data.get('Start_date')),
-                        'end_date': parse_datetime_field(contact_data.get('End_date')),
-                        'role_success_stage': contact_data.get('Role_Success_Stage'),
-                        'role_owner': extract_nested_name(contact_data.get('Role_Owner')),
-                        'role_success_notes': contact_data.get('Role_Success_Notes'),
-                        'role_confirmed_date': parse_datetime_field(contact_data.get('Role_confirmed_date')),
-                        'paid_role': contact_data.get('Paid_Role'),
-                        'likelihood_to_convert': contact_data.get('Likelihood_to_convert'),
-                        'job_title': contact_data.get('Job_Title'),
-                        'job_offered_after': contact_data.get('Job_offered_after'),
-                        
-                        # Contact and Communication fields
-                        'link_to_cv': contact_data.get('Link_to_CV'),
-                        'contact_email': contact_data.get('Contact_Email'),
-                        'secondary_email': contact_data.get('Secondary_Email'),
-                        'do_not_contact': contact_data.get('Do_Not_Contact', False),
-                        'email_opt_out': contact_data.get('Email_Opt_Out', False),
-                        'unsubscribed_time': parse_datetime_field(contact_data.get('Unsubscribed_Time')),
-                        'follow_up_date': parse_datetime_field(contact_data.get('Follow_up_Date')),
-                        
-                        # Personal Information
-                        'gender': contact_data.get('Gender'),
-                        'nationality': contact_data.get('Nationality'),
-                        'timezone': contact_data.get('Timezone'),
-                        'contact_last_name': contact_data.get('Contact_Last_Name'),
-                        
-                        # Visa and Travel fields
-                        'visa_eligible': contact_data.get('Visa_Eligible'),
-                        'requires_a_visa': contact_data.get('Requires_a_visa'),
-                        'visa_type_exemption': contact_data.get('Visa_Type_Exemption'),
-                        'visa_successful': contact_data.get('Visa_successful'),
-                        'visa_alt_options': list_to_json_string(contact_data.get('Visa_Alt_Options')),
-                        'visa_notes': contact_data.get('Visa_Note_s'),
-                        'visa_owner': extract_nested_name(contact_data.get('Visa_Owner')),
-                        'visa_f_u_date': parse_datetime_field(contact_data.get('Visa_F_U_Date')),
-                        'arrival_date_time': parse_datetime_field(contact_data.get('Arrival_date_time')),
-                        'departure_date_time': parse_datetime_field(contact_data.get('Departure_date_time')),
-                        'departure_flight_number': contact_data.get('Departure_flight_number'),
-                        'arrival_drop_off_address': contact_data.get('Arrival_drop_off_address'),
-                        
-                        # Interview and Assessment fields
-                        'interview': contact_data.get('Interview'),
-                        'interview_successful': contact_data.get('Interview_successful'),
-                        'interviewer': extract_nested_name(contact_data.get('Interviewer')),
-                        'myinterview_url': contact_data.get('MyInterview_URL'),
-                        'intro_call_date': parse_datetime_field(contact_data.get('Intro_Call_Date')),
-                        'call_scheduled_date_time': parse_datetime_field(contact_data.get('Call_Scheduled_Date_Time')),
-                        'call_booked_date_time': parse_datetime_field(contact_data.get('Call_Booked_Date_Time')),
-                        'call_to_conversion_time_days': contact_data.get('Call_to_Conversion_Time_days'),
-                        'enrolment_to_intro_call_lead_time': contact_data.get('Enrolment_to_Intro_Call_Lead_Time'),
-                        
-                        # Approval and Process fields (using $ prefixes for system fields)
-                        'approval': json.dumps(contact_data.get('$approval')) if contact_data.get('$approval') else None,
-                        'approval_date': parse_datetime_field(contact_data.get('Approval_date')),
-                        'approval_state': contact_data.get('$approval_state'),
-                        'process_flow': contact_data.get('$process_flow', False),
-                        'review': json.dumps(contact_data.get('$review')) if contact_data.get('$review') else None,
-                        'review_process': json.dumps(contact_data.get('$review_process')) if contact_data.get('$review_process') else None,
-                        'student_decision': contact_data.get('Student_decision'),
-                        'company_decision': contact_data.get('Company_decision'),
-                        
-                        # Administrative fields (using proper field names with suffixes)
-                        'layout_id': extract_nested_id(contact_data.get('Layout')),
-                        'layout_display_label': contact_data.get('Layout', {}).get('display_label') if contact_data.get('Layout') else None,
-                        'layout_name': contact_data.get('Layout', {}).get('name') if contact_data.get('Layout') else None,
-                        'field_states': json.dumps(contact_data.get('$field_states')) if contact_data.get('$field_states') else None,
-                        'record_status': contact_data.get('Record_Status__s'),
-                        'last_activity_time': parse_datetime_field(contact_data.get('Last_Activity_Time')),
-                        'last_enriched_time': parse_datetime_field(contact_data.get('Last_Enriched_Time__s')),
-                        'lead_created_time': parse_datetime_field(contact_data.get('Lead_Created_Time')),
-                        'change_log_time': parse_datetime_field(contact_data.get('Change_Log_Time__s')),
-                        'created_by_email': extract_nested_email(contact_data.get('Created_By')),
-                        
-                        # Partnership and Organization fields
-                        'partner_organisation': contact_data.get('Partner_Organisation'),
-                        'from_university_partner': contact_data.get('From_University_partner'),
-                        'community_owner': extract_nested_name(contact_data.get('Community_Owner')),
-                        'admission_member': contact_data.get('Admission_Member'),
-                        'ps_assigned_date': parse_datetime_field(contact_data.get('PS_Assigned_Date')),
-                        'partnership_specialist_id': extract_nested_id(contact_data.get('Partner_Track_Owner1')),
-                        # Accommodation fields
-                        'accommodation_finalised': contact_data.get('Accommodation_finalised'),
-                        'house_rules': contact_data.get('House_rules'),
-                        
-                        # Financial and Agreement fields
-                        'signed_agreement': contact_data.get('Signed_Agreement'),
-                        'agreement_finalised': contact_data.get('Agreement_finalised'),
-                        'books_cust_id': contact_data.get('books_cust_id'),
-                        'other_payment_status': contact_data.get('Other_Payment_Status'),
-                        'total': contact_data.get('Total'),
-                        't_c_link': contact_data.get('T_C_Link'),
-                        'send_mail2': contact_data.get('Send_Mail2', False),
-                        
-                        # Duration and Timeline fields
-                        'duration': contact_data.get('Duration'),
-                        'number_of_days': contact_data.get('Number_of_Days'),
-                        'days_count': contact_data.get('Days_Count'),
-                        'days_since_conversion': contact_data.get('Days_Since_Conversion'),
-                        'average_no_of_days': contact_data.get('Average_no_of_days'),
-                        'placement_lead_time_days': contact_data.get('Placement_Lead_Time_days'),
-                        'placement_deadline': parse_datetime_field(contact_data.get('Placement_Deadline')),
-                        'placement_urgency': contact_data.get('Placement_Urgency'),
-                        'decision_date': parse_datetime_field(contact_data.get('Decision_Date')),
-                        'cohort_start_date': parse_datetime_field(contact_data.get('Cohort_Start_Date')),
-                        
-                        # Cancellation and Issues
-                        'reason_for_cancellation': contact_data.get('Reason_for_Cancellation'),
-                        'cancellation_notes': contact_data.get('Cancellation_Notes'),
-                        'cancelled_date_time': parse_datetime_field(contact_data.get('Cancelled_Date_Time')),
-                        'date_of_cancellation': parse_datetime_field(contact_data.get('Date_of_Cancellation')),
-                        'refund_date': parse_datetime_field(contact_data.get('Refund_date')),
-                        
-                        # Rating and Feedback
-                        'rating': list_to_json_string(contact_data.get('Rating')),
-                        'rating_new': contact_data.get('Rating_New'),
-                        'warm_call': contact_data.get('Warm_Call'),
-                        
-                        # Marketing and UTM fields
-                        'utm_campaign': contact_data.get('UTM_Campaign'),
-                        'utm_medium': contact_data.get('UTM_Medium'),
-                        'utm_content': contact_data.get('UTM_Content'),
-                        'utm_gclid': contact_data.get('UTM_GCLID'),
-                        
-                        # Other fields
-                        'description': contact_data.get('Description'),
-                        'additional_information': contact_data.get('Additional_Information'),
-                        'notes1': contact_data.get('Notes1'),
-                        'name1': contact_data.get('Name1'),
-                        'other_industry': contact_data.get('Other_industry'),
-                        'token': contact_data.get('Token'),
-                        'tag': list_to_json_string(contact_data.get('Tag')),
-                        'type': contact_data.get('Type'),
-                        'enrich_status': contact_data.get('Enrich_Status__s'),
-                        'is_duplicate': contact_data.get('$is_duplicate', False),
-                        'locked': contact_data.get('Locked__s', False),
-                        'locked_for_me': contact_data.get('$locked_for_me', False),
-                        'in_merge': contact_data.get('$in_merge', False),
-                        
-                        # Additional field from your working ETL
-                        'end_date_auto_populated': parse_datetime_field(contact_data.get('End_date_Auto_populated')),
-                        
-                        
-                        # Account ID relationship
-                        'account_id': extract_nested_id(contact_data.get('Account_Name')),
-                    }
+                contact_fields_mapped = {
+                    # Core fields
+                    'id': contact_data.get('id'),
+                    'email': contact_data.get('Email'),
+                    'first_name': contact_data.get('First_Name'),
+                    'last_name': contact_data.get('Last_Name'),
+                    'phone': contact_data.get('Phone'),
+                    'account_name': extract_nested_name(contact_data.get('Account_Name')),
+                    'title': contact_data.get('Title'),
+                    'department': contact_data.get('Department'),
+                    'updated_time': parse_datetime_field(contact_data.get('Modified_Time')),
+                    'created_time': parse_datetime_field(contact_data.get('Created_Time')),
+                    'full_name': contact_data.get('Full_Name'),
                     
-                    # Create or update contact
-                    contact, created = Contact.objects.update_or_create(
-                        id=contact_fields_mapped['id'],
-                        defaults=contact_fields_mapped
-                    )
+                    # Location and Industry fields
+                    'location': contact_data.get('Location'),
+                    'industry': contact_data.get('Industry'),
+                    'industry_choice_1': contact_data.get('Industry_Choice_1'),
+                    'industry_choice_2': contact_data.get('Industry_choice_2'),  # Note: lowercase 'choice'
+                    'industry_choice_3': contact_data.get('Industry_Choice_3'),
+                    'industry_1_areas': contact_data.get('Industry_1_Areas'),
+                    'industry_2_areas': contact_data.get('Industry_2_Areas'),
+                    'current_location_v2': contact_data.get('Current_Location_V2'),
+                    'location_other': contact_data.get('Location_Other'),
+                    'alternative_location1': contact_data.get('Alternative_Location1'),
+                    'country_city_of_residence': contact_data.get('Country_city_of_residence'),
                     
-                    # Sync contact deals for this contact
-                    # deals_count = sync_deals_for_contact(zoho, contact_fields_mapped['id'])
+                    # Student and Academic fields
+                    'skills': contact_data.get('Skills'),
+                    'student_status': contact_data.get('Student_Status'),
+                    'university_name': contact_data.get('University_Name'),
+                    'graduation_date': parse_datetime_field(contact_data.get('Graduation_Date')),
+                    'student_bio': contact_data.get('Student_Bio'),
+                    'placement_automation': contact_data.get('Placement_Automation'),
+                    'uni_start_date': parse_datetime_field(contact_data.get('Uni_Start_Date')),
+                    'english_level': contact_data.get('English_Level'),
+                    'age_on_start_date': contact_data.get('Age_on_Start_Date'),
+                    'date_of_birth': parse_datetime_field(contact_data.get('Date_of_Birth')),
                     
-                    synced_count += 1
+                    # Placement and Role fields
+                    'placement_status': contact_data.get('Placement_status'),
+                    'start_date': parse_datetime_field(contact_data.get('Start_date')),
+                    'end_date': parse_datetime_field(contact_data.get('End_date')),
+                    'role_success_stage': contact_data.get('Role_Success_Stage'),
+                    'role_owner': extract_nested_name(contact_data.get('Role_Owner')),
+                    'role_success_notes': contact_data.get('Role_Success_Notes'),
+                    'role_confirmed_date': parse_datetime_field(contact_data.get('Role_confirmed_date')),
+                    'paid_role': contact_data.get('Paid_Role'),
+                    'likelihood_to_convert': contact_data.get('Likelihood_to_convert'),
+                    'job_title': contact_data.get('Job_Title'),
+                    'job_offered_after': contact_data.get('Job_offered_after'),
                     
-                    # Track latest modified time
-                    if contact_fields_mapped['updated_time']:
-                        if latest_modified is None or contact_fields_mapped['updated_time'] > latest_modified:
-                            latest_modified = contact_fields_mapped['updated_time']
+                    # Contact and Communication fields
+                    'link_to_cv': contact_data.get('Link_to_CV'),
+                    'contact_email': contact_data.get('Contact_Email'),
+                    'secondary_email': contact_data.get('Secondary_Email'),
+                    'do_not_contact': contact_data.get('Do_Not_Contact', False),
+                    'email_opt_out': contact_data.get('Email_Opt_Out', False),
+                    'unsubscribed_time': parse_datetime_field(contact_data.get('Unsubscribed_Time')),
+                    'follow_up_date': parse_datetime_field(contact_data.get('Follow_up_Date')),
                     
-                    if synced_count % 100 == 0:
-                        logger.info(f"Processed {synced_count} contacts...")
-                        
+                    # Personal Information
+                    'gender': contact_data.get('Gender'),
+                    'nationality': contact_data.get('Nationality'),
+                    'timezone': contact_data.get('Timezone'),
+                    'contact_last_name': contact_data.get('Contact_Last_Name'),
+                    
+                    # Visa and Travel fields
+                    'visa_eligible': contact_data.get('Visa_Eligible'),
+                    'requires_a_visa': contact_data.get('Requires_a_visa'),
+                    'visa_type_exemption': contact_data.get('Visa_Type_Exemption'),
+                    'visa_successful': contact_data.get('Visa_successful'),
+                    'visa_alt_options': list_to_json_string(contact_data.get('Visa_Alt_Options')),
+                    'visa_notes': contact_data.get('Visa_Note_s'),
+                    'visa_owner': extract_nested_name(contact_data.get('Visa_Owner')),
+                    'visa_f_u_date': parse_datetime_field(contact_data.get('Visa_F_U_Date')),
+                    'arrival_date_time': parse_datetime_field(contact_data.get('Arrival_date_time')),
+                    'departure_date_time': parse_datetime_field(contact_data.get('Departure_date_time')),
+                    'departure_flight_number': contact_data.get('Departure_flight_number'),
+                    'arrival_drop_off_address': contact_data.get('Arrival_drop_off_address'),
+                    
+                    # Interview and Assessment fields
+                    'interview': contact_data.get('Interview'),
+                    'interview_successful': contact_data.get('Interview_successful'),
+                    'interviewer': extract_nested_name(contact_data.get('Interviewer')),
+                    'myinterview_url': contact_data.get('MyInterview_URL'),
+                    'intro_call_date': parse_datetime_field(contact_data.get('Intro_Call_Date')),
+                    'call_scheduled_date_time': parse_datetime_field(contact_data.get('Call_Scheduled_Date_Time')),
+                    'call_booked_date_time': parse_datetime_field(contact_data.get('Call_Booked_Date_Time')),
+                    'call_to_conversion_time_days': contact_data.get('Call_to_Conversion_Time_days'),
+                    'enrolment_to_intro_call_lead_time': contact_data.get('Enrolment_to_Intro_Call_Lead_Time'),
+                    
+                    # Approval and Process fields (using $ prefixes for system fields)
+                    'approval': json.dumps(contact_data.get('$approval')) if contact_data.get('$approval') else None,
+                    'approval_date': parse_datetime_field(contact_data.get('Approval_date')),
+                    'approval_state': contact_data.get('$approval_state'),
+                    'process_flow': contact_data.get('$process_flow', False),
+                    'review': json.dumps(contact_data.get('$review')) if contact_data.get('$review') else None,
+                    'review_process': json.dumps(contact_data.get('$review_process')) if contact_data.get('$review_process') else None,
+                    'student_decision': contact_data.get('Student_decision'),
+                    'company_decision': contact_data.get('Company_decision'),
+                    
+                    # Administrative fields (using proper field names with suffixes)
+                    'layout_id': extract_nested_id(contact_data.get('Layout')),
+                    'layout_display_label': contact_data.get('Layout', {}).get('display_label') if contact_data.get('Layout') else None,
+                    'layout_name': contact_data.get('Layout', {}).get('name') if contact_data.get('Layout') else None,
+                    'field_states': json.dumps(contact_data.get('$field_states')) if contact_data.get('$field_states') else None,
+                    'record_status': contact_data.get('Record_Status__s'),
+                    'last_activity_time': parse_datetime_field(contact_data.get('Last_Activity_Time')),
+                    'last_enriched_time': parse_datetime_field(contact_data.get('Last_Enriched_Time__s')),
+                    'lead_created_time': parse_datetime_field(contact_data.get('Lead_Created_Time')),
+                    'change_log_time': parse_datetime_field(contact_data.get('Change_Log_Time__s')),
+                    'created_by_email': extract_nested_email(contact_data.get('Created_By')),
+                    
+                    # Partnership and Organization fields
+                    'partner_organisation': contact_data.get('Partner_Organisation'),
+                    'from_university_partner': contact_data.get('From_University_partner'),
+                    'community_owner': extract_nested_name(contact_data.get('Community_Owner')),
+                    'admission_member': contact_data.get('Admission_Member'),
+                    'ps_assigned_date': parse_datetime_field(contact_data.get('PS_Assigned_Date')),
+                    'partnership_specialist_id': extract_nested_id(contact_data.get('Partner_Track_Owner1')),
+                    # Accommodation fields
+                    'accommodation_finalised': contact_data.get('Accommodation_finalised'),
+                    'house_rules': contact_data.get('House_rules'),
+                    
+                    # Financial and Agreement fields
+                    'signed_agreement': contact_data.get('Signed_Agreement'),
+                    'agreement_finalised': contact_data.get('Agreement_finalised'),
+                    'books_cust_id': contact_data.get('books_cust_id'),
+                    'other_payment_status': contact_data.get('Other_Payment_Status'),
+                    'total': contact_data.get('Total'),
+                    't_c_link': contact_data.get('T_C_Link'),
+                    'send_mail2': contact_data.get('Send_Mail2', False),
+                    
+                    # Duration and Timeline fields
+                    'duration': contact_data.get('Duration'),
+                    'number_of_days': contact_data.get('Number_of_Days'),
+                    'days_count': contact_data.get('Days_Count'),
+                    'days_since_conversion': contact_data.get('Days_Since_Conversion'),
+                    'average_no_of_days': contact_data.get('Average_no_of_days'),
+                    'placement_lead_time_days': contact_data.get('Placement_Lead_Time_days'),
+                    'placement_deadline': parse_datetime_field(contact_data.get('Placement_Deadline')),
+                    'placement_urgency': contact_data.get('Placement_Urgency'),
+                    'decision_date': parse_datetime_field(contact_data.get('Decision_Date')),
+                    'cohort_start_date': parse_datetime_field(contact_data.get('Cohort_Start_Date')),
+                    
+                    # Cancellation and Issues
+                    'reason_for_cancellation': contact_data.get('Reason_for_Cancellation'),
+                    'cancellation_notes': contact_data.get('Cancellation_Notes'),
+                    'cancelled_date_time': parse_datetime_field(contact_data.get('Cancelled_Date_Time')),
+                    'date_of_cancellation': parse_datetime_field(contact_data.get('Date_of_Cancellation')),
+                    'refund_date': parse_datetime_field(contact_data.get('Refund_date')),
+                    
+                    # Rating and Feedback
+                    'rating': list_to_json_string(contact_data.get('Rating')),
+                    'rating_new': contact_data.get('Rating_New'),
+                    'warm_call': contact_data.get('Warm_Call'),
+                    
+                    # Marketing and UTM fields
+                    'utm_campaign': contact_data.get('UTM_Campaign'),
+                    'utm_medium': contact_data.get('UTM_Medium'),
+                    'utm_content': contact_data.get('UTM_Content'),
+                    'utm_gclid': contact_data.get('UTM_GCLID'),
+                    
+                    # Other fields
+                    'description': contact_data.get('Description'),
+                    'additional_information': contact_data.get('Additional_Information'),
+                    'notes1': contact_data.get('Notes1'),
+                    'name1': contact_data.get('Name1'),
+                    'other_industry': contact_data.get('Other_industry'),
+                    'token': contact_data.get('Token'),
+                    'tag': list_to_json_string(contact_data.get('Tag')),
+                    'type': contact_data.get('Type'),
+                    'enrich_status': contact_data.get('Enrich_Status__s'),
+                    'is_duplicate': contact_data.get('$is_duplicate', False),
+                    'locked': contact_data.get('Locked__s', False),
+                    'locked_for_me': contact_data.get('$locked_for_me', False),
+                    'in_merge': contact_data.get('$in_merge', False),
+                    
+                    # Additional field from your working ETL
+                    'end_date_auto_populated': parse_datetime_field(contact_data.get('End_date_Auto_populated')),
+                    
+                    
+                    # Account ID relationship
+                    'account_id': extract_nested_id(contact_data.get('Account_Name')),
+                }
             except Exception as e:
                 logger.error(f"Error processing contact {contact_data.get('id')}: {str(e)}")
                 continue
+            
+            if not contact_fields_mapped['id']:
+                continue
+            batch[contact_fields_mapped['id']] = contact_fields_mapped
+            
+            # Track latest modified time
+            if contact_fields_mapped['updated_time']:
+                if latest_modified is None or contact_fields_mapped['updated_time'] > latest_modified:
+                    latest_modified = contact_fields_mapped['updated_time']
+            
+            if len(batch) >= SYNC_BATCH_SIZE:
+                flush_sync_checkpoint(Contact, batch, 'contact', 'contacts', latest_modified, progress)
+                logger.info(f"Processed {progress['synced']} contacts...")
+        
+        # The last, partial batch checkpoints the records written since the previous one
+        flush_sync_checkpoint(Contact, batch, 'contact', 'contacts', latest_modified, progress)
+        
+        if not progress['synced']:
+            logger.info("No contacts to sync")
+            return
         
-        # Update sync tracker
-        if latest_modified:
-            update_sync_tracker('contacts', latest_modified, synced_count)
-        
-        logger.info(f"Contacts sync completed successfully. Synced {synced_count} contacts")
+        logger.info(f"Contacts sync completed successfully. Synced {progress['synced']} contacts")
         
     except Exception as e:
         logger.error(f"Error in contact sync: {str(e)}")
@@ -619,14 +721,16 @@ def sync_accounts(incremental=True):
     logger.info("Starting account sync...")
     zoho = ZohoClient()
     
-    # Determine sync criteria
+    # Determine sync criteria; the tracker's watermark also goes to Zoho as If-Modified-Since
     criteria = None
+    modified_since = None
     last_sync_info = ""
     
     if incremental:
         tracker = get_sync_tracker('accounts')
         if tracker.last_sync_timestamp:
             criteria = build_incremental_criteria(tracker.last_sync_timestamp)
+            modified_since = tracker.last_sync_timestamp - INCREMENTAL_SYNC_OVERLAP
             last_sync_info = f" (incremental since {tracker.last_sync_timestamp})"
         else:
             last_sync_info = " (full sync - no previous sync found)"
@@ -638,7 +742,7 @@ def sync_accounts(incremental=True):
     # Define fields to fetch - comprehensive account fields using exact field names from your working ETL
     account_fields = [
         # Core fields
-        'id', 'Account_Name', 'Industry', 'Billing_Address', 'Shipping_Address',
+        'id', 'Account_Name', 'Industry', 'Billing_Street', 'Billing_City', 'Billing_State', 'Shipping_Address',
         'Owner', 'Modified_Time', 'Created_Time',
         
         # Company and Business fields  
@@ -678,150 +782,134 @@ def sync_accounts(incremental=True):
     ]
     
     try:
-        # Fetch data from Zoho
-        zoho_accounts = zoho.get_paginated_data(
-            module='Accounts',
-            fields=account_fields,
-            criteria=criteria,
-            sort_by='Modified_Time',
-            sort_order='asc'
-        )
-        
-        logger.info(f"Retrieved {len(zoho_accounts)} accounts from Zoho")
-        
-        if not zoho_accounts:
-            logger.info("No accounts to sync")
-            return
-        
-        # Process accounts
-        synced_count = 0
+        # Stream accounts from Zoho and upsert them in fixed-size batches
+        progress = {'synced': 0, 'checkpointed': 0, 'failed': 0}
         latest_modified = None
+        batch = {}
         
-        for account_data in zoho_accounts:
+        for account_data in iter_zoho_records(zoho, 'Accounts', account_fields, criteria, modified_since):
             try:
-                with transaction.atomic():
-                    # Parse and prepare account data - using field names from your working ETL
-                    owner_data = account_data.get('Owner', {})
-                    tag_data = account_data.get('Tag')
-                    tag = list_to_json_string(tag_data) if tag_data else None
-                    account_fields_mapped = {
-                        # Core fields
-                        'id': account_data.get('id'),
-                        'name': account_data.get('Account_Name'),
-                        'industry': account_data.get('Industry'),
-                        'billing_address': json.dumps(account_data.get('Billing_Address')) if account_data.get('Billing_Address') else None,
-                        'shipping_address': json.dumps(account_data.get('Shipping_Address')) if account_data.get('Shipping_Address') else None,
-                        'owner_id': extract_nested_id(owner_data),
-                        'owner_name': extract_nested_name(owner_data),
-                        'owner_email': extract_nested_email(owner_data),
-                        
-                        # Company and Business fields (using exact field names from your working ETL)
-                        'company_work_policy': list_to_json_string(account_data.get('Company_Work_Policy')),
-                        'company_industry': account_data.get('Company_Industry'),
-                        'company_description': account_data.get('Company_Desciption'),
-                        'company_industry_other': account_data.get('Company_Industry_Other'),
-                        'no_employees': account_data.get('No_Employees'),
-                        'standard_working_hours': account_data.get('Standard_working_hours'),
-                        'company_address': account_data.get('Company_Address'),
-                        'industry_areas': account_data.get('Industry_areas'),
-                        
-                        # Location fields (using exact field names)
-                        'location': account_data.get('Location'),
-                        'location_other': account_data.get('Location_other'),
-                        'city': account_data.get('City'),
-                        'postcode': account_data.get('Postcode'),
-                        'country': account_data.get('Country'),
-                        'street': account_data.get('Street'),
-                        'state_region': account_data.get('State_Region'),
-                        
-                        # University fields
-                        'uni_region': account_data.get('Uni_Region'),
-                        'uni_country': account_data.get('Uni_Country'),
-                        'uni_state_if_in_us': account_data.get('Uni_State_if_in_US'),
-                        'uni_timezone': account_data.get('Uni_Timezone'),
-                        
-                        # Status and Management fields (using correct field names with suffixes)
-                        'management_status': account_data.get('Management_Status'),
-                        'approval_status': account_data.get('Approval_status'),
-                        'account_status': account_data.get('Account_Status'),
-                        'record_status': account_data.get('Record_Status__s'),
-                        'cleanup_status': account_data.get('Cleanup_Status'),
-                        'cleanup_phase': account_data.get('Cleanup_Phase'),
-                        'uni_outreach_status': account_data.get('Uni_Outreach_Status'),
-                        'placement_revision_required': account_data.get('Placement_s_Revision_Required'),
-                        'due_diligence_fields_to_revise': list_to_json_string(account_data.get('Due_Diligence_Fields_to_Revise')),
-                        
-                        # Process and Review fields (using $ prefixes for system fields)
-                        'process_flow': account_data.get('$process_flow', False),
-                        'review': account_data.get('$review'),
-                        'review_process': json.dumps(account_data.get('$review_process')) if account_data.get('$review_process') else None,
-                        'approval_state': account_data.get('$approval_state'),
-                        'enrich_status': account_data.get('Enrich_Status__s'),
-                        'gold_rating': account_data.get('Gold_Rating', False),
-                        'classic_partnership': account_data.get('Classic_Partnership'),
-                        'pathfinder': account_data.get('$pathfinder', False),
-                        
-                        # Dates and Timeline
-                        'cleanup_start_date': parse_datetime_field(account_data.get('Cleanup_Start_Date')),
-                        'last_activity_time': parse_datetime_field(account_data.get('Last_Activity_Time')),
-                        'last_full_due_diligence_date': parse_datetime_field(account_data.get('Last_Full_Due_Diligence_Date')),
-                        'follow_up_date': parse_datetime_field(account_data.get('Follow_up_Date')),
-                        'next_reply_date': parse_datetime_field(account_data.get('Next_Reply_Date')),
-                        
-                        # Administrative fields (using proper system field prefixes and suffixes)
-                        'layout_id': extract_nested_id(account_data.get('Layout')),
-                        'layout_display_label': account_data.get('Layout', {}).get('display_label') if account_data.get('Layout') else None,
-                        'layout_name': account_data.get('Layout', {}).get('name') if account_data.get('Layout') else None,
-                        'field_states': json.dumps(account_data.get('$field_states')) if account_data.get('$field_states') else None,
-                        'locked': account_data.get('Locked__s', False),
-                        'locked_for_me': account_data.get('$locked_for_me', False),
-                        'is_duplicate': account_data.get('$is_duplicate', False),
-                        'in_merge': account_data.get('$in_merge', False),
-                        'tag': tag,
-                        'is_dnc': any("DNC" in str(item.get("name", "")) for item in tag_data if isinstance(item, dict)) if tag_data and isinstance(tag_data, list) else False,
-                        'type': account_data.get('Type'),
-                        
-                        # Role and Opportunity fields (using correct field names)
-                        'roles_available': account_data.get('Roles_available'),
-                        'roles': account_data.get('Roles'),
-                        'upon_to_remote_interns': account_data.get('Upon_to_Remote_interns', False),
-                        
-                        # Notes and Documentation (using correct field names)
-                        'outreach_notes': account_data.get('Outreach_Notes'),
-                        'account_notes': account_data.get('Account_Notes'),
-                        'cleanup_notes': account_data.get('Cleanup_Notes'),
-                        'approval': json.dumps(account_data.get('$approval')) if account_data.get('$approval') else None,
-                    }
+                # Parse and prepare account data - using field names from your working ETL
+                owner_data = account_data.get('Owner', {})
+                tag_data = account_data.get('Tag')
+                tag = list_to_json_string(tag_data) if tag_data else None
+                account_fields_mapped = {
+                    # Core fields
+                    'id': account_data.get('id'),
+                    'name': account_data.get('Account_Name'),
+                    'industry': account_data.get('Industry'),
+                    'billing_street': account_data.get('Billing_Street'),
+                    'billing_city': account_data.get('Billing_City'),
+                    'billing_state': account_data.get('Billing_State'),
+                    'shipping_address': json.dumps(account_data.get('Shipping_Address')) if account_data.get('Shipping_Address') else None,
+                    'owner_id': extract_nested_id(owner_data),
+                    'owner_name': extract_nested_name(owner_data),
+                    'owner_email': extract_nested_email(owner_data),
+                    'modified_time': parse_datetime_field(account_data.get('Modified_Time')),
                     
-                    # Create or update account
-                    account, created = Account.objects.update_or_create(
-                        id=account_fields_mapped['id'],
-                        defaults=account_fields_mapped
-                    )
+                    # Company and Business fields (using exact field names from your working ETL)
+                    'company_work_policy': list_to_json_string(account_data.get('Company_Work_Policy')),
+                    'company_industry': account_data.get('Company_Industry'),
+                    'company_description': account_data.get('Company_Desciption'),
+                    'company_industry_other': account_data.get('Company_Industry_Other'),
+                    'no_employees': account_data.get('No_Employees'),
+                    'standard_working_hours': account_data.get('Standard_working_hours'),
+                    'company_address': account_data.get('Company_Address'),
+                    'industry_areas': account_data.get('Industry_areas'),
                     
-                    # Sync deals for this account
-                    # deals_count = sync_deals_for_account(zoho, account_fields_mapped['id'])
+                    # Location fields (using exact field names)
+                    'location': account_data.get('Location'),
+                    'location_other': account_data.get('Location_other'),
+                    'city': account_data.get('City'),
+                    'postcode': account_data.get('Postcode'),
+                    'country': account_data.get('Country'),
+                    'street': account_data.get('Street'),
+                    'state_region': account_data.get('State_Region'),
                     
-                    synced_count += 1
+                    # University fields
+                    'uni_region': account_data.get('Uni_Region'),
+                    'uni_country': account_data.get('Uni_Country'),
+                    'uni_state_if_in_us': account_data.get('Uni_State_if_in_US'),
+                    'uni_timezone': account_data.get('Uni_Timezone'),
                     
-                    # Track latest modified time
-                    modified_time = parse_datetime_field(account_data.get('Modified_Time'))
-                    if modified_time:
-                        if latest_modified is None or modified_time > latest_modified:
-                            latest_modified = modified_time
+                    # Status and Management fields (using correct field names with suffixes)
+                    'management_status': account_data.get('Management_Status'),
+                    'approval_status': account_data.get('Approval_status'),
+                    'account_status': account_data.get('Account_Status'),
+                    'record_status': account_data.get('Record_Status__s'),
+                    'cleanup_status': account_data.get('Cleanup_Status'),
+                    'cleanup_phase': account_data.get('Cleanup_Phase'),
+                    'uni_outreach_status': account_data.get('Uni_Outreach_Status'),
+                    'placement_revision_required': account_data.get('Placement_s_Revision_Required'),
+                    'due_diligence_fields_to_revise': list_to_json_string(account_data.get('Due_Diligence_Fields_to_Revise')),
                     
-                    if synced_count % 100 == 0:
-                        logger.info(f"Processed {synced_count} accounts...")
-                        
+                    # Process and Review fields (using $ prefixes for system fields)
+                    'process_flow': account_data.get('$process_flow', False),
+                    'review': account_data.get('$review'),
+                    'review_process': json.dumps(account_data.get('$review_process')) if account_data.get('$review_process') else None,
+                    'approval_state': account_data.get('$approval_state'),
+                    'enrich_status': account_data.get('Enrich_Status__s'),
+                    'gold_rating': account_data.get('Gold_Rating', False),
+                    'classic_partnership': account_data.get('Classic_Partnership'),
+                    'pathfinder': account_data.get('$pathfinder', False),
+                    
+                    # Dates and Timeline
+                    'cleanup_start_date': parse_datetime_field(account_data.get('Cleanup_Start_Date')),
+                    'last_activity_time': parse_datetime_field(account_data.get('Last_Activity_Time')),
+                    'last_full_due_diligence_date': parse_datetime_field(account_data.get('Last_Full_Due_Diligence_Date')),
+                    'follow_up_date': parse_datetime_field(account_data.get('Follow_up_Date')),
+                    'next_reply_date': parse_datetime_field(account_data.get('Next_Reply_Date')),
+                    
+                    # Administrative fields (using proper system field prefixes and suffixes)
+                    'layout_id': extract_nested_id(account_data.get('Layout')),
+                    'layout_display_label': account_data.get('Layout', {}).get('display_label') if account_data.get('Layout') else None,
+                    'layout_name': account_data.get('Layout', {}).get('name') if account_data.get('Layout') else None,
+                    'field_states': json.dumps(account_data.get('$field_states')) if account_data.get('$field_states') else None,
+                    'locked': account_data.get('Locked__s', False),
+                    'locked_for_me': account_data.get('$locked_for_me', False),
+                    'is_duplicate': account_data.get('$is_duplicate', False),
+                    'in_merge': account_data.get('$in_merge', False),
+                    'tag': tag,
+                    'is_dnc': any("DNC" in str(item.get("name", "")) for item in tag_data if isinstance(item, dict)) if tag_data and isinstance(tag_data, list) else False,
+                    'type': account_data.get('Type'),
+                    
+                    # Role and Opportunity fields (using correct field names)
+                    'roles_available': account_data.get('Roles_available'),
+                    'roles': account_data.get('Roles'),
+                    'upon_to_remote_interns': account_data.get('Upon_to_Remote_interns', False),
+                    
+                    # Notes and Documentation (using correct field names)
+                    'outreach_notes': account_data.get('Outreach_Notes'),
+                    'account_notes': account_data.get('Account_Notes'),
+                    'cleanup_notes': account_data.get('Cleanup_Notes'),
+                    'approval': json.dumps(account_data.get('$approval')) if account_data.get('$approval') else None,
+                }
             except Exception as e:
                 logger.error(f"Error processing account {account_data.get('id')}: {str(e)}")
                 continue
+            
+            if not account_fields_mapped['id']:
+                continue
+            batch[account_fields_mapped['id']] = account_fields_mapped
+            
+            # Track latest modified time
+            modified_time = parse_datetime_field(account_data.get('Modified_Time'))
+            if modified_time:
+                if latest_modified is None or modified_time > latest_modified:
+                    latest_modified = modified_time
+            
+            if len(batch) >= SYNC_BATCH_SIZE:
+                flush_sync_checkpoint(Account, batch, 'account', 'accounts', latest_modified, progress)
+                logger.info(f"Processed {progress['synced']} accounts...")
+        
+        # The last, partial batch checkpoints the records written since the previous one
+        flush_sync_checkpoint(Account, batch, 'account', 'accounts', latest_modified, progress)
+        
+        if not progress['synced']:
+            logger.info("No accounts to sync")
+            return
         
-        # Update sync tracker
-        if latest_modified:
-            update_sync_tracker('accounts', latest_modified, synced_count)
-        
-        logger.info(f"Accounts sync completed successfully. Synced {synced_count} accounts")
+        logger.info(f"Accounts sync completed successfully. Synced {progress['synced']} accounts")
         
     except Exception as e:
         logger.error(f"Error in account sync: {str(e)}")
@@ -836,14 +924,16 @@ def sync_intern_roles(incremental=True):
     # Custom module - using the exact module name from your working ETL
     module_name = 'Intern_Roles'
     
-    # Determine sync criteria
+    # Determine sync criteria; the tracker's watermark also goes to Zoho as If-Modified-Since
     criteria = None
+    modified_since = None
     last_sync_info = ""
     
     if incremental:
         tracker = get_sync_tracker('intern_roles')
         if tracker.last_sync_timestamp:
             criteria = build_incremental_criteria(tracker.last_sync_timestamp)
+            modified_since = tracker.last_sync_timestamp - INCREMENTAL_SYNC_OVERLAP
             last_sync_info = f" (incremental since {tracker.last_sync_timestamp})"
         else:
             last_sync_info = " (full sync - no previous sync found)"
@@ -872,90 +962,75 @@ def sync_intern_roles(incremental=True):
     ]
     
     try:
-        # Fetch data from Zoho
-        zoho_roles = zoho.get_paginated_data(
-            module=module_name,
-            fields=role_fields,
-            criteria=criteria,
-            sort_by='Modified_Time',
-            sort_order='asc'
-        )
-        
-        logger.info(f"Retrieved {len(zoho_roles)} intern roles from Zoho")
-        
-        if not zoho_roles:
-            logger.info("No intern roles to sync")
-            return
-        
-        # Process intern roles
-        synced_count = 0
+        # Stream intern roles from Zoho and upsert them in fixed-size batches
+        progress = {'synced': 0, 'checkpointed': 0, 'failed': 0}
         latest_modified = None
+        batch = {}
         
-        for role_data in zoho_roles:
+        for role_data in iter_zoho_records(zoho, module_name, role_fields, criteria, modified_since):
             try:
-                with transaction.atomic():
-                    # Parse and prepare role data - using exact field mapping from your working ETL
-                    intern_company_data = role_data.get('Intern_Company', {})
-                    role_fields_mapped = {
-                        # Core fields (using exact field names from your working ETL)
-                        'id': role_data.get('id'),
-                        'name': role_data.get('Name'),
-                        'role_title': role_data.get('Role_Title'),
-                        'role_description_requirements': role_data.get('Role_Description_Requirements'),
-                        'role_status': role_data.get('Role_Status'),
-                        'role_function': role_data.get('Role_Function'),
-                        'role_department_size': role_data.get('Role_Department_Size'),
-                        'role_attachments_jd': list_to_json_string(role_data.get('Role_Attachments_JD')),
-                        'role_tags': list_to_json_string(role_data.get('Role_Tags')),
-                        'start_date': parse_datetime_field(role_data.get('Start_Date')),
-                        'end_date': parse_datetime_field(role_data.get('End_Date')),
-                        'created_time': parse_datetime_field(role_data.get('Created_Time')),
-                        
-                        # Company relationship fields (using exact field names)
-                        'intern_company_id': extract_nested_id(intern_company_data),
-                        'intern_company_name': extract_nested_name(intern_company_data),
-                        'company_work_policy': list_to_json_string(role_data.get('Company_Work_Policy')),
-                        'location': role_data.get('Location'),
-                        'open_to_remote': role_data.get('Open_to_Remote'),
-                        
-                        # Status and Management fields (using exact field names with suffixes)
-                        'due_diligence_status_2': role_data.get('Due_Diligence_Status_2'),
-                        'account_outreach_status': role_data.get('Account_Outreach_Status'),
-                        'record_status': role_data.get('Record_Status__s'),
-                        'approval_state': role_data.get('Approval_State'),
-                        'management_status': role_data.get('Management_Status'),
-                        'placement_fields_to_revise': list_to_json_string(role_data.get('Placement_Fields_to_Revise')),
-                        'placement_revision_notes': role_data.get('Placement_Revision_Notes'),
-                        'gold_rating': role_data.get('Gold_Rating', False),
-                        'locked': role_data.get('Locked__s', False),
-                    }
-                    
-                    # Create or update intern role
-                    role, created = InternRole.objects.update_or_create(
-                        id=role_fields_mapped['id'],
-                        defaults=role_fields_mapped
-                    )
+                # Parse and prepare role data - using exact field mapping from your working ETL
+                intern_company_data = role_data.get('Intern_Company', {})
+                role_fields_mapped = {
+                    # Core fields (using exact field names from your working ETL)
+                    'id': role_data.get('id'),
+                    'name': role_data.get('Name'),
+                    'role_title': role_data.get('Role_Title'),
+                    'role_description_requirements': role_data.get('Role_Description_Requirements'),
+                    'role_status': role_data.get('Role_Status'),
+                    'role_function': role_data.get('Role_Function'),
+                    'role_department_size': role_data.get('Role_Department_Size'),
+                    'role_attachments_jd': list_to_json_string(role_data.get('Role_Attachments_JD')),
+                    'role_tags': list_to_json_string(role_data.get('Role_Tags')),
+                    'start_date': parse_datetime_field(role_data.get('Start_Date')),
+                    'end_date': parse_datetime_field(role_data.get('End_Date')),
+                    'created_time': parse_datetime_field(role_data.get('Created_Time')),
+                    'modified_time': parse_datetime_field(role_data.get('Modified_Time')),
                     
-                    synced_count += 1
-                    
-                    # Track latest modified time
-                    modified_time = parse_datetime_field(role_data.get('Modified_Time'))
-                    if modified_time:
-                        if latest_modified is None or modified_time > latest_modified:
-                            latest_modified = modified_time
+                    # Company relationship fields (using exact field names)
+                    'intern_company_id': extract_nested_id(intern_company_data),
+                    'intern_company_name': extract_nested_name(intern_company_data),
+                    'company_work_policy': list_to_json_string(role_data.get('Company_Work_Policy')),
+                    'location': role_data.get('Location'),
+                    'open_to_remote': role_data.get('Open_to_Remote'),
                     
-                    if synced_count % 100 == 0:
-                        logger.info(f"Processed {synced_count} intern roles...")
-                        
+                    # Status and Management fields (using exact field names with suffixes)
+                    'due_diligence_status_2': role_data.get('Due_Diligence_Status_2'),
+                    'account_outreach_status': role_data.get('Account_Outreach_Status'),
+                    'record_status': role_data.get('Record_Status__s'),
+                    'approval_state': role_data.get('Approval_State'),
+                    'management_status': role_data.get('Management_Status'),
+                    'placement_fields_to_revise': list_to_json_string(role_data.get('Placement_Fields_to_Revise')),
+                    'placement_revision_notes': role_data.get('Placement_Revision_Notes'),
+                    'gold_rating': role_data.get('Gold_Rating', False),
+                    'locked': role_data.get('Locked__s', False),
+                }
             except Exception as e:
                 logger.error(f"Error processing intern role {role_data.get('id')}: {str(e)}")
                 continue
+            
+            if not role_fields_mapped['id']:
+                continue
+            batch[role_fields_mapped['id']] = role_fields_mapped
+            
+            # Track latest modified time
+            modified_time = parse_datetime_field(role_data.get('Modified_Time'))
+            if modified_time:
+                if latest_modified is None or modified_time > latest_modified:
+                    latest_modified = modified_time
+            
+            if len(batch) >= SYNC_BATCH_SIZE:
+                flush_sync_checkpoint(InternRole, batch, 'intern role', 'intern_roles', latest_modified, progress)
+                logger.info(f"Processed {progress['synced']} intern roles...")
+        
+        # The last, partial batch checkpoints the records written since the previous one
+        flush_sync_checkpoint(InternRole, batch, 'intern role', 'intern_roles', latest_modified, progress)
+        
+        if not progress['synced']:
+            logger.info("No intern roles to sync")
+            return
         
-        # Update sync tracker
-        if latest_modified:
-            update_sync_tracker('intern_roles', latest_modified, synced_count)
-        
-        logger.info(f"Intern roles sync completed successfully. Synced {synced_count} roles")
+        logger.info(f"Intern roles sync completed successfully. Synced {progress['synced']} roles")
         
     except Exception as e:
         logger.error(f"Error in intern roles sync: {str(e)}")
@@ -967,14 +1042,16 @@ def sync_deals(incremental=True):
     logger.info("Starting deals sync...")
     zoho = ZohoClient()
     
-    # Determine sync criteria
+    # Determine sync criteria; the tracker's watermark also goes to Zoho as If-Modified-Since
     criteria = None
+    modified_since = None
     last_sync_info = ""
     
     if incremental:
         tracker = get_sync_tracker('deals')
         if tracker.last_sync_timestamp:
             criteria = build_incremental_criteria(tracker.last_sync_timestamp)
+            modified_since = tracker.last_sync_timestamp - INCREMENTAL_SYNC_OVERLAP
             last_sync_info = f" (incremental since {tracker.last_sync_timestamp})"
         else:
             last_sync_info = " (full sync - no previous sync found)"
@@ -996,7 +1073,8 @@ def sync_deals(incremental=True):
             fields=deal_fields,
             criteria=criteria,
             sort_by='Modified_Time',
-            sort_order='asc'
+            sort_order='asc',
+            modified_since=modified_since
         )
         
         logger.info(f"Retrieved {len(zoho_deals)} deals from Zoho")
@@ -1204,11 +1282,6 @@ def sync_role_deals(incremental=True):
                 rejected_count = api_helper.sync_role_deals_for_role(role.id)
                 total_synced += 1
                 
-                # Update latest modified time (use current time for role deals sync)
-                current_time = django_timezone.now()
-                if latest_modified is None or current_time > latest_modified:
-                    latest_modified = current_time
-                
                 if total_synced % 50 == 0:
                     logger.info(f"Processed {total_synced} roles...")
                     
@@ -1216,6 +1289,10 @@ def sync_role_deals(incremental=True):
                 logger.error(f"Error processing role {role.id}: {str(e)}")
                 continue
         
+        # Role deals have no Modified_Time, so the run itself is the watermark
+        if total_synced:
+            latest_modified = django_timezone.now()
+        
         # Update sync tracker
         if latest_modified:
             update_sync_tracker('role_deals', latest_modified, total_synced)
@@ -19,14 +19,25 @@ class ZohoClient:
         # Create a session for connection pooling and better performance
         self.session = requests.Session()
         
-        self.headers = {
+        # Fetch a token up front so configuration problems surface at construction time
+        get_access_token()
+
+    @property
+    def headers(self):
+        """
+        Request headers carrying the current access token
+        
+        The token comes from the module-level cache in zoho.auth, so long-lived
+        clients pick up refreshed tokens instead of reusing an expired one.
+        """
+        return {
             "Authorization": f"Zoho-oauthtoken {get_access_token()}",
             "Content-Type": "application/json"
         }
 
-    def get_paginated_data(self, module, fields, criteria=None, sort_order=None, sort_by=None):
+    def iter_pages(self, module, fields, criteria=None, sort_order=None, sort_by=None, modified_since=None):
         """
-        Get paginated data from Zoho CRM module
+        Iterate over paginated data from Zoho CRM module one page at a time
         
         Args:
             module: CRM module name (Contacts, Accounts, etc.)
@@ -34,9 +45,10 @@ class ZohoClient:
             criteria: Filter criteria for API call
             sort_order: Sort order (asc/desc)
             sort_by: Field to sort by
+            modified_since: Only return records modified after this datetime (If-Modified-Since)
             
-        Returns:
-            List of records
+        Yields:
+            List of records for each page
         """
         url = f"{self.base_url}/{module}"
         params = {
@@ -53,35 +65,25 @@ class ZohoClient:
         if sort_order and sort_by:
             params["sort_order"] = sort_order
             params["sort_by"] = sort_by
+        
+        # Zoho filters the records API server-side on this header and answers 304 when nothing changed
+        headers = None
+        if modified_since:
+            headers = {"If-Modified-Since": modified_since.isoformat(timespec='seconds')}
             
-        all_data = []
+        total_records = 0
 
         while True:
             # Retry logic for network issues
             for attempt in range(self.max_retries):
                 try:
-                    # logger.info(f"Fetching {module} data - Page {params['page']}, Attempt {attempt + 1}")
                     response = self.session.get(
                         url, 
-                        headers=self.headers, 
+                        headers={**self.headers, **headers} if headers else self.headers, 
                         params=params, 
                         timeout=self.timeout
                     )
                     response.raise_for_status()
-                    
-                    data = response.json().get('data', [])
-                    if not data:
-                        logger.info(f"No more data found for {module} on page {params['page']}")
-                        return all_data
-                        
-                    all_data.extend(data)
-                    # logger.info(f"Retrieved {len(data)} records from {module} (page {params['page']}, total so far: {len(all_data)})")
-                    
-                    if not response.json().get('info', {}).get('more_records'):
-                        logger.info(f"Completed fetching {module} data - Total records: {len(all_data)}")
-                        return all_data
-                        
-                    params["page"] += 1
                     break  # Success, exit retry loop
                     
                 except requests.exceptions.Timeout as e:
@@ -102,6 +104,43 @@ class ZohoClient:
                     logger.error(f"Request error for {module} page {params['page']}: {e}")
                     raise
 
+            # Parse the page body once; Zoho returns 204/304 with no body when nothing matches
+            payload = response.json() if response.content else {}
+            data = payload.get('data', [])
+            if not data:
+                logger.info(f"No more data found for {module} on page {params['page']}")
+                return
+                
+            total_records += len(data)
+            yield data
+            
+            if not payload.get('info', {}).get('more_records'):
+                logger.info(f"Completed fetching {module} data - Total records: {total_records}")
+                return
+                
+            params["page"] += 1
+
+    def get_paginated_data(self, module, fields, criteria=None, sort_order=None, sort_by=None, modified_since=None):
+        """
+        Get paginated data from Zoho CRM module
+        
+        Args:
+            module: CRM module name (Contacts, Accounts, etc.)
+            fields: List of fields to fetch
+            criteria: Filter criteria for API call
+            sort_order: Sort order (asc/desc)
+            sort_by: Field to sort by
+            modified_since: Only return records modified after this datetime (If-Modified-Since)
+            
+        Returns:
+            List of records
+        """
+        all_data = []
+        for page in self.iter_pages(
+            module, fields, criteria=criteria, sort_order=sort_order, sort_by=sort_by,
+            modified_since=modified_since
+        ):
+            all_data.extend(page)
         return all_data
 
     def get_contact_by_id(self, contact_id):
@@ -153,6 +192,40 @@ class ZohoClient:
             logger.error(f"Error fetching {module} record {record_id}: {e}")
             return None
 
+    def get_records_by_ids(self, module, record_ids, chunk_size=100):
+        """
+        Get several records by ID with one request per chunk of IDs
+        
+        Args:
+            module: The CRM module name (e.g., 'Contacts', 'Accounts')
+            record_ids: IDs of the records to fetch
+            chunk_size: IDs per request (Zoho accepts at most 100)
+            
+        Returns:
+            Tuple of (record ID -> record data, IDs whose request failed); IDs that
+            Zoho reported as not found appear in neither
+        """
+        records = {}
+        failed_ids = []
+        url = f"{self.base_url}/{module}"
+        for start in range(0, len(record_ids), chunk_size):
+            chunk = record_ids[start:start + chunk_size]
+            try:
+                response = self.session.get(
+                    url, headers=self.headers, params={'ids': ','.join(chunk)}, timeout=self.timeout
+                )
+                response.raise_for_status()
+                
+                # Zoho answers 204 with an empty body when none of the IDs exist
+                data = response.json().get('data', []) if response.content else []
+                for record in data:
+                    records[record['id']] = record
+                    
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Error fetching {len(chunk)} {module} records by ID: {e}")
+                failed_ids.extend(chunk)
+        return records, failed_ids
+
     def get_attachments(self, module, record_id):
         """
         Get attachments for a specific record
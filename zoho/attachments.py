@@ -7,6 +7,7 @@ import os
 import re
 import logging
 import threading
+import requests
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from urllib.parse import urlparse
@@ -72,12 +73,14 @@ class ZohoAttachmentManager:
             logger.error(f"Failed to create download directory {self.download_dir}: {e}")
             raise
     
-    def get_contact_attachments(self, contact_id: str) -> List[Dict]:
+    def get_contact_attachments(self, contact_id: str, raise_request_errors: bool = False) -> List[Dict]:
         """
         Get all attachments for a specific contact
         
         Args:
             contact_id: Zoho contact ID
+            raise_request_errors: Re-raise Zoho request errors instead of returning [],
+                so a caller that retries can tell an outage from a contact without attachments
             
         Returns:
             List of attachment dictionaries
@@ -89,8 +92,7 @@ class ZohoAttachmentManager:
                 "Content-Type": "application/json"
             }
             
-            import requests
-            response = requests.get(url, headers=headers)
+            response = self.zoho_client.session.get(url, headers=headers)
             response.raise_for_status()
             
             data = response.json()
@@ -99,6 +101,11 @@ class ZohoAttachmentManager:
             logger.info(f"Found {len(attachments)} attachments for contact {contact_id}")
             return attachments
                 
+        except requests.RequestException as e:
+            logger.error(f"Error fetching attachments for contact {contact_id}: {e}")
+            if raise_request_errors:
+                raise
+            return []
         except Exception as e:
             logger.error(f"Error fetching attachments for contact {contact_id}: {e}")
             return []
@@ -152,7 +159,8 @@ class ZohoAttachmentManager:
         return cv_attachments
     
     def download_attachment(self, contact_id: str, attachment_id: str, filename: str, 
-                          contact_name: str = None, attachment_data: Dict = None) -> Optional[str]:
+                          contact_name: str = None, attachment_data: Dict = None,
+                          raise_request_errors: bool = False) -> Optional[str]:
         """
         Download a specific attachment and save mapping to database
         
@@ -162,6 +170,7 @@ class ZohoAttachmentManager:
             filename: Name of the file
             contact_name: Name of the contact (for organizing files)
             attachment_data: Full attachment data from Zoho API
+            raise_request_errors: Re-raise Zoho request errors instead of returning None
             
         Returns:
             Path to downloaded file or None if failed
@@ -177,8 +186,7 @@ class ZohoAttachmentManager:
                 "Authorization": f"Zoho-oauthtoken {get_access_token()}",
             }
             
-            import requests
-            response = requests.get(download_url, headers=headers)
+            response = self.zoho_client.session.get(download_url, headers=headers)
             response.raise_for_status()
             
             # Save the file
@@ -200,6 +208,11 @@ class ZohoAttachmentManager:
             
             return file_path
                 
+        except requests.RequestException as e:
+            logger.error(f"Error downloading attachment {attachment_id}: {e}")
+            if raise_request_errors:
+                raise
+            return None
         except Exception as e:
             logger.error(f"Error downloading attachment {attachment_id}: {e}")
             return None
@@ -387,13 +400,15 @@ class ZohoAttachmentManager:
         thread = threading.Thread(target=extract_skills, daemon=True)
         thread.start()
     
-    def download_contact_cvs(self, contact_id: str, contact_name: str = None) -> List[str]:
+    def download_contact_cvs(self, contact_id: str, contact_name: str = None,
+                             raise_request_errors: bool = False) -> List[str]:
         """
         Download all CV files for a specific contact
         
         Args:
             contact_id: Zoho contact ID
             contact_name: Name of the contact (optional)
+            raise_request_errors: Re-raise Zoho request errors so the caller can retry
             
         Returns:
             List of downloaded file paths
@@ -401,7 +416,7 @@ class ZohoAttachmentManager:
         logger.info(f"Downloading CVs for contact {contact_id}")
         
         # Get all attachments
-        attachments = self.get_contact_attachments(contact_id)
+        attachments = self.get_contact_attachments(contact_id, raise_request_errors)
         if not attachments:
             logger.info(f"No attachments found for contact {contact_id}")
             return []
@@ -423,7 +438,7 @@ class ZohoAttachmentManager:
                 continue
             
             file_path = self.download_attachment(
-                contact_id, attachment_id, filename, contact_name, attachment
+                contact_id, attachment_id, filename, contact_name, attachment, raise_request_errors
             )
             
             if file_path:
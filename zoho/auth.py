@@ -1,8 +1,10 @@
 import requests
 import os
 import logging
+import threading
 import time
 import json
+import uuid
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
@@ -15,10 +17,119 @@ _token_cache = {
     'expires_at': None
 }
 
+# Shared token cache keys, so all worker processes reuse one token and only one refreshes it
+SHARED_TOKEN_CACHE_KEY = 'zoho:oauth:token'
+SHARED_TOKEN_LOCK_KEY = 'zoho:oauth:lock'
+SHARED_TOKEN_LOCK_TIMEOUT = 30  # seconds before a stale refresh lock expires
+SHARED_TOKEN_WAIT = 5  # seconds to wait for another process to finish refreshing
+
+# Serializes refreshes within this process
+_refresh_lock = threading.Lock()
+
+
+def _get_shared_cache():
+    """
+    Return the Django cache when Django is configured, else None
+    
+    Returns:
+        Django cache backend or None
+    """
+    try:
+        from django.conf import settings
+        if not settings.configured:
+            return None
+        from django.core.cache import cache
+        return cache
+    except ImportError:
+        return None
+
+
+def _get_cached_token():
+    """
+    Return a valid cached token from the process cache or the shared cache
+    
+    Returns:
+        str: Cached access token or None
+    """
+    if _token_cache['access_token'] and _token_cache['expires_at']:
+        if datetime.now() < _token_cache['expires_at']:
+            logger.debug("Using cached access token")
+            return _token_cache['access_token']
+    
+    shared_cache = _get_shared_cache()
+    if shared_cache is None:
+        return None
+    
+    try:
+        cached = shared_cache.get(SHARED_TOKEN_CACHE_KEY)
+    except Exception as e:
+        logger.warning(f"Could not read shared token cache: {e}")
+        return None
+    
+    if cached and datetime.now() < cached['expires_at']:
+        _token_cache['access_token'] = cached['access_token']
+        _token_cache['expires_at'] = cached['expires_at']
+        logger.debug("Using shared cached access token")
+        return cached['access_token']
+    return None
+
+
+def _wait_for_shared_token():
+    """
+    Poll the shared cache while another process refreshes the token
+    
+    Returns:
+        str: Access token refreshed by the other process, or None on timeout
+    """
+    deadline = time.monotonic() + SHARED_TOKEN_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(0.2)
+        token = _get_cached_token()
+        if token:
+            return token
+    return None
+
+
+def _renew_shared_lock(shared_cache, lock_token, timeout):
+    """
+    Extend the shared refresh lock if this process still holds it
+    
+    Args:
+        shared_cache: Django cache holding the lock, or None
+        lock_token: Value stored when the lock was acquired, or None if it was not
+        timeout: Seconds the lock should stay valid from now
+    """
+    if shared_cache is None or lock_token is None:
+        return
+    try:
+        if shared_cache.get(SHARED_TOKEN_LOCK_KEY) == lock_token:
+            shared_cache.touch(SHARED_TOKEN_LOCK_KEY, timeout)
+    except Exception as e:
+        logger.warning(f"Could not renew shared token lock: {e}")
+
+
+def _release_shared_lock(shared_cache, lock_token):
+    """
+    Release the shared refresh lock only if this process still holds it
+    
+    Args:
+        shared_cache: Django cache holding the lock
+        lock_token: Value stored when the lock was acquired
+    """
+    try:
+        if shared_cache.get(SHARED_TOKEN_LOCK_KEY) == lock_token:
+            shared_cache.delete(SHARED_TOKEN_LOCK_KEY)
+    except Exception as e:
+        logger.warning(f"Could not release shared token lock: {e}")
+
+
 def get_access_token(force_refresh=False):
     """
     Get access token for Zoho CRM API using refresh token with caching
     
+    The token is cached in-process and, when Django is configured, in the shared
+    Django cache. A cache lock ensures only one worker refreshes an expired token.
+    
     Args:
         force_refresh: Force refresh token even if cached token is valid
         
@@ -27,85 +138,136 @@ def get_access_token(force_refresh=False):
     """
     try:
         # Check if we have a valid cached token
-        if not force_refresh and _token_cache['access_token'] and _token_cache['expires_at']:
-            if datetime.now() < _token_cache['expires_at']:
-                logger.info("Using cached access token")
-                return _token_cache['access_token']
-        
-        url = os.getenv("ZOHO_TOKEN_URL")
-        refresh_token = os.getenv("ZOHO_REFRESH_TOKEN")
-        client_id = os.getenv("ZOHO_CLIENT_ID")
-        client_secret = os.getenv("ZOHO_CLIENT_SECRET")
-        
-        # Log the values (without sensitive data) for debugging
-        logger.info(f"Requesting new token from: {url}")
-        logger.info(f"Client ID: {client_id[:10]}..." if client_id else "Client ID: None")
+        if not force_refresh:
+            token = _get_cached_token()
+            if token:
+                return token
         
-        if not all([url, refresh_token, client_id, client_secret]):
-            missing = []
-            if not url: missing.append("ZOHO_TOKEN_URL")
-            if not refresh_token: missing.append("ZOHO_REFRESH_TOKEN")
-            if not client_id: missing.append("ZOHO_CLIENT_ID")
-            if not client_secret: missing.append("ZOHO_CLIENT_SECRET")
-            raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
-        
-        payload = {
-            'refresh_token': refresh_token,
-            'client_id': client_id,
-            'client_secret': client_secret,
-            'grant_type': 'refresh_token'
-        }
-        
-        # Add retry logic for rate limiting
-        max_retries = 3
-        base_wait_time = 120
-        
-        for attempt in range(max_retries):
-            try:
-                response = requests.post(url, data=payload, timeout=120)
-                
-                if response.status_code == 429 or (response.status_code == 400 and "too many requests" in response.text.lower()):
-                    if attempt < max_retries - 1:
-                        wait_time = base_wait_time * (2 ** attempt)
-                        logger.warning(f"Rate limited. Waiting {wait_time} seconds before retry {attempt + 1}/{max_retries}")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        logger.error(f"Rate limit exceeded after {max_retries} attempts")
-                        raise Exception(f"Rate limited by Zoho API. Please wait 15-30 minutes before retrying.")
+        with _refresh_lock:
+            # Another thread may have refreshed while we waited for the lock
+            if not force_refresh:
+                token = _get_cached_token()
+                if token:
+                    return token
+            
+            shared_cache = _get_shared_cache()
+            lock_token = None
+            if shared_cache is not None:
+                # A unique value lets us release only our own lock if it expired and another process took it
+                token_value = str(uuid.uuid4())
+                try:
+                    if shared_cache.add(SHARED_TOKEN_LOCK_KEY, token_value, SHARED_TOKEN_LOCK_TIMEOUT):
+                        lock_token = token_value
+                except Exception as e:
+                    logger.warning(f"Could not acquire shared token lock: {e}")
                 
-                if response.status_code != 200:
-                    logger.error(f"Token request failed with status {response.status_code}")
-                    logger.error(f"Response: {response.text}")
-                    
-                response.raise_for_status()
-                break
-                
-            except requests.exceptions.RequestException as e:
-                if attempt < max_retries - 1:
-                    logger.warning(f"Request failed, retrying in {base_wait_time} seconds: {e}")
-                    time.sleep(base_wait_time)
-                    continue
-                else:
-                    raise
-        
-        token_data = response.json()
-        if 'access_token' not in token_data:
-            logger.error(f"No access_token in response: {token_data}")
-            raise ValueError("Invalid token response - no access_token found")
-        
-        # Cache the token (Zoho tokens typically expire in 1 hour)
-        expires_in = token_data.get('expires_in', 3600)
-        _token_cache['access_token'] = token_data['access_token']
-        _token_cache['expires_at'] = datetime.now() + timedelta(seconds=expires_in - 300)
-        
-        logger.info(f"Successfully obtained new access token (expires in {expires_in} seconds)")
-        return token_data['access_token']
+                if lock_token is None and not force_refresh:
+                    token = _wait_for_shared_token()
+                    if token:
+                        return token
+                    logger.warning("Timed out waiting for shared token refresh, refreshing locally")
+            
+            try:
+                return _refresh_access_token(shared_cache, lock_token)
+            finally:
+                if lock_token is not None:
+                    _release_shared_lock(shared_cache, lock_token)
         
     except Exception as e:
         logger.error(f"Error getting access token: {e}")
         raise
 
+
+def _refresh_access_token(shared_cache=None, lock_token=None):
+    """
+    Request a new access token from Zoho and cache it
+    
+    Args:
+        shared_cache: Django cache to publish the token to, or None
+        lock_token: Value of the shared refresh lock held by this process, renewed
+            before each retry wait so it cannot expire mid-refresh
+        
+    Returns:
+        str: New access token
+    """
+    url = os.getenv("ZOHO_TOKEN_URL")
+    refresh_token = os.getenv("ZOHO_REFRESH_TOKEN")
+    client_id = os.getenv("ZOHO_CLIENT_ID")
+    client_secret = os.getenv("ZOHO_CLIENT_SECRET")
+    
+    # Log the values (without sensitive data) for debugging
+    logger.info(f"Requesting new token from: {url}")
+    logger.info(f"Client ID: {client_id[:10]}..." if client_id else "Client ID: None")
+    
+    if not all([url, refresh_token, client_id, client_secret]):
+        missing = []
+        if not url: missing.append("ZOHO_TOKEN_URL")
+        if not refresh_token: missing.append("ZOHO_REFRESH_TOKEN")
+        if not client_id: missing.append("ZOHO_CLIENT_ID")
+        if not client_secret: missing.append("ZOHO_CLIENT_SECRET")
+        raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
+    
+    payload = {
+        'refresh_token': refresh_token,
+        'client_id': client_id,
+        'client_secret': client_secret,
+        'grant_type': 'refresh_token'
+    }
+    
+    # Add retry logic for rate limiting
+    max_retries = 3
+    base_wait_time = 120
+    
+    for attempt in range(max_retries):
+        try:
+            response = requests.post(url, data=payload, timeout=120)
+            
+            if response.status_code == 429 or (response.status_code == 400 and "too many requests" in response.text.lower()):
+                if attempt < max_retries - 1:
+                    wait_time = base_wait_time * (2 ** attempt)
+                    logger.warning(f"Rate limited. Waiting {wait_time} seconds before retry {attempt + 1}/{max_retries}")
+                    _renew_shared_lock(shared_cache, lock_token, wait_time + SHARED_TOKEN_LOCK_TIMEOUT)
+                    time.sleep(wait_time)
+                    continue
+                else:
+                    logger.error(f"Rate limit exceeded after {max_retries} attempts")
+                    raise Exception(f"Rate limited by Zoho API. Please wait 15-30 minutes before retrying.")
+            
+            if response.status_code != 200:
+                logger.error(f"Token request failed with status {response.status_code}")
+                logger.error(f"Response: {response.text}")
+                
+            response.raise_for_status()
+            break
+            
+        except requests.exceptions.RequestException as e:
+            if attempt < max_retries - 1:
+                logger.warning(f"Request failed, retrying in {base_wait_time} seconds: {e}")
+                _renew_shared_lock(shared_cache, lock_token, base_wait_time + SHARED_TOKEN_LOCK_TIMEOUT)
+                time.sleep(base_wait_time)
+                continue
+            else:
+                raise
+    
+    token_data = response.json()
+    if 'access_token' not in token_data:
+        logger.error(f"No access_token in response: {token_data}")
+        raise ValueError("Invalid token response - no access_token found")
+    
+    # Cache the token (Zoho tokens typically expire in 1 hour)
+    expires_in = token_data.get('expires_in', 3600)
+    _token_cache['access_token'] = token_data['access_token']
+    _token_cache['expires_at'] = datetime.now() + timedelta(seconds=expires_in - 300)
+    
+    if shared_cache is not None:
+        try:
+            shared_cache.set(SHARED_TOKEN_CACHE_KEY, dict(_token_cache), max(expires_in - 300, 1))
+        except Exception as e:
+            logger.warning(f"Could not store token in shared cache: {e}")
+    
+    logger.info(f"Successfully obtained new access token (expires in {expires_in} seconds)")
+    return token_data['access_token']
+
 def clear_token_cache():
     """Clear the cached token to force refresh on next request"""
     global _token_cache
@@ -113,4 +275,7 @@ def clear_token_cache():
         'access_token': None,
         'expires_at': None
     }
+    shared_cache = _get_shared_cache()
+    if shared_cache is not None:
+        shared_cache.delete(SHARED_TOKEN_CACHE_KEY)
     logger.info("Token cache cleared")
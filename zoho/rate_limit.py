@@ -0,0 +1,118 @@
+"""
+Rate limiting for Zoho CRM API calls
+"""
+import os
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket that also caps the number of calls in flight
+
+    Use as a context manager around each API request:
+
+        with zoho_api_limiter:
+            response = session.get(url, ...)
+    """
+
+    def __init__(self, calls: int, period: float, max_concurrent: int = None):
+        """
+        Initialize the rate limiter
+
+        Args:
+            calls: Number of calls allowed per period
+            period: Length of the period in seconds
+            max_concurrent: Maximum number of calls allowed in flight at once
+        """
+        self.capacity = float(calls)
+        self.rate = calls / period
+        self._tokens = float(calls)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._semaphore = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+
+    def acquire(self):
+        """Block until a call is allowed by the token bucket"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.rate
+            logger.debug(f"Zoho rate limit reached, waiting {wait_time:.2f}s")
+            time.sleep(wait_time)
+
+    def __enter__(self):
+        if self._semaphore:
+            self._semaphore.acquire()
+        try:
+            self.acquire()
+        except BaseException:
+            if self._semaphore:
+                self._semaphore.release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._semaphore:
+            self._semaphore.release()
+        return False
+
+
+# Per-process Zoho quota, configurable per deployment
+ZOHO_API_CALLS_PER_MINUTE = int(os.getenv('ZOHO_API_CALLS_PER_MINUTE', 100))
+ZOHO_API_MAX_CONCURRENT = int(os.getenv('ZOHO_API_MAX_CONCURRENT', 8))
+
+# Shared limiter for single-record Zoho lookups
+zoho_api_limiter = RateLimiter(
+    calls=ZOHO_API_CALLS_PER_MINUTE, period=60, max_concurrent=ZOHO_API_MAX_CONCURRENT
+)
+
+# Zoho's per-second ceiling across every process (web workers and Celery workers)
+ZOHO_CALLS_PER_SECOND = 10
+
+
+def acquire_shared_slot(limit: int = ZOHO_CALLS_PER_SECOND, key_prefix: str = 'zoho:rl'):
+    """
+    Block until a call is allowed by a per-second counter in the Django cache
+
+    RateLimiter only sees calls made by the current process; this counter is shared
+    through the cache (Redis in production), so all workers together stay under
+    Zoho's limit. Without a usable cache the call is allowed immediately.
+
+    Args:
+        limit: Maximum calls per second across all processes
+        key_prefix: Cache key prefix for the per-second counters
+    """
+    try:
+        from django.core.cache import cache
+    except ImportError:
+        return
+
+    while True:
+        now = time.time()
+        window = int(now)
+        key = f"{key_prefix}:{window}"
+        try:
+            cache.add(key, 0, 2)
+            count = cache.incr(key)
+        except ValueError:
+            # Counter expired between add and incr; retry in the current window
+            continue
+        except Exception as e:
+            logger.warning(f"Shared rate limiter unavailable, continuing without it: {e}")
+            return
+
+        if count <= limit:
+            return
+
+        wait_time = max(0.0, window + 1 - time.time())
+        logger.debug(f"Shared Zoho rate limit reached, waiting {wait_time:.2f}s")
+        time.sleep(wait_time)
@@ -4,7 +4,7 @@ Skill extraction module for CV processing using OpenAI
 import os
 import json
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from django.db import transaction
 
 try:
@@ -23,6 +23,13 @@ from zoho_app.models import Skill
 
 logger = logging.getLogger(__name__)
 
+# Response token budget per CV, shared by the single and batch extraction paths
+SKILL_RESPONSE_TOKENS = 1500
+# gpt-3.5-turbo returns at most 4096 tokens, so a batch call is capped below that
+BATCH_MAX_RESPONSE_TOKENS = 4000
+# CVs per batch call, so each keeps the single-document response budget
+SKILL_BATCH_SIZE = BATCH_MAX_RESPONSE_TOKENS // SKILL_RESPONSE_TOKENS
+
 
 class SkillExtractor:
     """Handles skill extraction from CV PDF files using OpenAI"""
@@ -117,32 +124,8 @@ class SkillExtractor:
             Respond with only the JSON array, no additional text.
             """
             
-            # Make API call - handle both new and legacy OpenAI APIs
-            try:
-                if self.client:  # New API (v1.x)
-                    response = self.client.chat.completions.create(
-                        model="gpt-3.5-turbo",
-                        messages=[
-                            {"role": "system", "content": "You are an expert HR assistant that extracts skills from CVs. Always respond with valid JSON."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        max_tokens=1500,
-                        temperature=0.3
-                    )
-                    response_text = response.choices[0].message.content.strip()
-                else:  # Legacy API
-                    response = openai.ChatCompletion.create(
-                        model="gpt-3.5-turbo",
-                        messages=[
-                            {"role": "system", "content": "You are an expert HR assistant that extracts skills from CVs. Always respond with valid JSON."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        max_tokens=1500,
-                        temperature=0.3
-                    )
-                    response_text = response.choices[0].message.content.strip()
-            except Exception as api_error:
-                logger.error(f"OpenAI API call failed: {api_error}")
+            response_text = self._chat_completion(prompt, max_tokens=SKILL_RESPONSE_TOKENS)
+            if response_text is None:
                 return []
             logger.info(f"OpenAI response received: {len(response_text)} characters")
             logger.debug(f"OpenAI raw response: {response_text[:500]}...")
@@ -168,23 +151,7 @@ class SkillExtractor:
                 logger.error(f"OpenAI response is not a list: {type(skills_data)}")
                 return []
             
-            # Validate the structure
-            valid_skills = []
-            for skill in skills_data:
-                if isinstance(skill, dict) and all(key in skill for key in ['skill_name', 'category', 'proficiency_level']):
-                    # Clean and validate the skill data
-                    cleaned_skill = {
-                        'skill_name': str(skill['skill_name']).strip()[:255],
-                        'category': str(skill['category']).strip()[:100],
-                        'proficiency_level': str(skill['proficiency_level']).strip()[:50]
-                    }
-                    
-                    # Only add if skill name is not empty
-                    if cleaned_skill['skill_name']:
-                        valid_skills.append(cleaned_skill)
-                else:
-                    logger.warning(f"Invalid skill format: {skill}")
-            
+            valid_skills = self._clean_skills(skills_data)
             logger.info(f"Successfully extracted {len(valid_skills)} valid skills")
             return valid_skills
             
@@ -195,6 +162,168 @@ class SkillExtractor:
             logger.error(f"Error extracting skills with OpenAI: {e}")
             return []
     
+    def extract_skills_batch(self, texts: Dict[str, str]) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Extract skills from several CV texts with one OpenAI call per SKILL_BATCH_SIZE documents
+        
+        Documents whose batch call fails, or that are missing from its response, are
+        retried one by one with extract_skills_with_openai.
+        
+        Args:
+            texts: Dictionary mapping a document key (e.g. file path) to its CV text
+            
+        Returns:
+            Dictionary mapping each document key to its list of skill dictionaries
+        """
+        texts = {key: text for key, text in texts.items() if text and text.strip()}
+        if not texts:
+            logger.warning("No CV text provided for batch skill extraction")
+            return {}
+        
+        keys = list(texts)
+        results = {}
+        for start in range(0, len(keys), SKILL_BATCH_SIZE):
+            chunk = {key: texts[key] for key in keys[start:start + SKILL_BATCH_SIZE]}
+            if len(chunk) > 1:
+                results.update(self._extract_skills_chunk(chunk))
+        
+        for key in keys:
+            if key not in results:
+                results[key] = self.extract_skills_with_openai(texts[key])
+        return results
+    
+    def _extract_skills_chunk(self, texts: Dict[str, str]) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Extract skills from a few CV texts with a single OpenAI call
+        
+        Args:
+            texts: Dictionary mapping a document key to its CV text (at most SKILL_BATCH_SIZE entries)
+            
+        Returns:
+            Dictionary mapping document keys to their skill lists; documents missing
+            from the response, or all of them if the call fails, are omitted
+        """
+        # Short labels keep the response keys unambiguous regardless of file names
+        labels = {f"doc_{index}": key for index, key in enumerate(texts, start=1)}
+        documents = "\n\n".join(
+            f"=== DOCUMENT {label} ===\n{texts[key][:4000]}" for label, key in labels.items()
+        )
+        
+        try:
+            prompt = f"""
+            Analyze each of the following CV documents and extract all technical skills, soft skills, and competencies.
+            For each skill, provide:
+            1. skill_name: The name of the skill
+            2. category: Category (Technical, Programming, Language, Soft Skill, Tool/Software, Domain Knowledge, etc.)
+            3. proficiency_level: Estimated proficiency (Beginner, Intermediate, Advanced, Expert) based on context
+            
+            Respond with a JSON object whose keys are the document labels ({", ".join(labels)})
+            and whose values are arrays of objects with these exact fields: skill_name, category, proficiency_level
+            
+            {documents}
+            
+            Respond with only the JSON object, no additional text.
+            """
+            
+            response_text = self._chat_completion(
+                prompt,
+                max_tokens=min(SKILL_RESPONSE_TOKENS * len(labels), BATCH_MAX_RESPONSE_TOKENS),
+                response_format={"type": "json_object"}
+            )
+            if response_text is None:
+                return {}
+            logger.info(f"OpenAI batch response received: {len(response_text)} characters")
+            
+            skills_by_label = json.loads(response_text)
+            if not isinstance(skills_by_label, dict):
+                logger.error(f"OpenAI batch response is not an object: {type(skills_by_label)}")
+                return {}
+            
+            results = {}
+            for label, key in labels.items():
+                skills_data = skills_by_label.get(label)
+                if isinstance(skills_data, list):
+                    results[key] = self._clean_skills(skills_data)
+                else:
+                    logger.warning(f"Batch response has no skill list for {label}; retrying it on its own")
+            
+            logger.info(f"Successfully extracted skills for {len(results)} of {len(labels)} documents in one request")
+            return results
+            
+        except json.JSONDecodeError as e:
+            logger.error(f"JSON parsing error in batch response, retrying documents one by one: {e}")
+            return {}
+        except Exception as e:
+            logger.error(f"Error extracting skills in batch with OpenAI, retrying documents one by one: {e}")
+            return {}
+    
+    def _chat_completion(self, prompt: str, max_tokens: int, response_format: Optional[dict] = None) -> Optional[str]:
+        """
+        Send a prompt to the chat completion API
+        
+        Args:
+            prompt: User prompt
+            max_tokens: Maximum tokens in the response
+            response_format: Optional response format (only sent with the v1.x client)
+            
+        Returns:
+            Response text, or None if the API call failed
+        """
+        messages = [
+            {"role": "system", "content": "You are an expert HR assistant that extracts skills from CVs. Always respond with valid JSON."},
+            {"role": "user", "content": prompt}
+        ]
+        
+        # Make API call - handle both new and legacy OpenAI APIs
+        try:
+            if self.client:  # New API (v1.x)
+                kwargs = {'response_format': response_format} if response_format else {}
+                response = self.client.chat.completions.create(
+                    model="gpt-3.5-turbo",
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=0.3,
+                    **kwargs
+                )
+            else:  # Legacy API
+                response = openai.ChatCompletion.create(
+                    model="gpt-3.5-turbo",
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=0.3
+                )
+            return response.choices[0].message.content.strip()
+        except Exception as api_error:
+            logger.error(f"OpenAI API call failed: {api_error}")
+            return None
+    
+    def _clean_skills(self, skills_data: list) -> List[Dict[str, str]]:
+        """
+        Validate and trim skill dictionaries returned by OpenAI
+        
+        Args:
+            skills_data: Parsed list of skill objects
+            
+        Returns:
+            List of cleaned skill dictionaries
+        """
+        valid_skills = []
+        for skill in skills_data:
+            if isinstance(skill, dict) and all(key in skill for key in ['skill_name', 'category', 'proficiency_level']):
+                # Clean and validate the skill data
+                cleaned_skill = {
+                    'skill_name': str(skill['skill_name']).strip()[:255],
+                    'category': str(skill['category']).strip()[:100],
+                    'proficiency_level': str(skill['proficiency_level']).strip()[:50]
+                }
+                
+                # Only add if skill name is not empty
+                if cleaned_skill['skill_name']:
+                    valid_skills.append(cleaned_skill)
+            else:
+                logger.warning(f"Invalid skill format: {skill}")
+        return valid_skills
+    
     def save_skills_to_database(self, skills: List[Dict[str, str]], contact_id: str, document_id: int) -> List[int]:
         """
         Save extracted skills to the database
@@ -244,6 +373,53 @@ class SkillExtractor:
             
         return created_skill_ids
     
+    def save_skills_batch(self, entries: List[Tuple[List[Dict[str, str]], str, int]]) -> int:
+        """
+        Save skills for several documents with one bulk INSERT
+        
+        Args:
+            entries: List of (skills, contact_id, document_id) triples
+            
+        Returns:
+            Number of skills saved
+        """
+        entries = [(skills, contact_id, document_id) for skills, contact_id, document_id in entries if skills]
+        if not entries:
+            logger.info("No skills to save")
+            return 0
+        
+        pending = [
+            Skill(
+                contact_id=contact_id,
+                document_id=document_id,
+                skill_name=skill_data['skill_name'],
+                skill_category=skill_data['category'],
+                proficiency_level=skill_data['proficiency_level'],
+                extraction_method='openai_gpt3.5',
+                confidence_score=0.8,
+            )
+            for skills, contact_id, document_id in entries
+            for skill_data in skills
+        ]
+        
+        try:
+            with transaction.atomic():
+                # Remove existing skills for these documents to avoid duplicates
+                for contact_id in {contact_id for _, contact_id, _ in entries}:
+                    Skill.objects.filter(
+                        contact_id=contact_id,
+                        document_id__in=[document_id for _, cid, document_id in entries if cid == contact_id]
+                    ).delete()
+                
+                Skill.objects.bulk_create(pending, batch_size=500)
+            
+            logger.info(f"Saved {len(pending)} skills to database for {len(entries)} documents")
+            return len(pending)
+            
+        except Exception as e:
+            logger.error(f"Error saving skills to database: {e}")
+            return 0
+    
     def extract_and_save_skills(self, pdf_path: str, contact_id: str, document_id: int) -> List[int]:
         """
         Complete workflow: extract text from PDF, extract skills with OpenAI, save to database
@@ -0,0 +1,63 @@
+"""
+JSON helpers for API payloads and responses, using orjson when it is installed
+"""
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_django_encoder = DjangoJSONEncoder()
+
+
+def dumps(data) -> bytes:
+    """
+    Serialize data to JSON bytes
+
+    Datetimes are emitted as ISO 8601 strings, so callers can pass model
+    values straight through without calling isoformat().
+
+    Args:
+        data: JSON-serializable data (datetimes, dates, decimals and UUIDs allowed)
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            data,
+            default=_django_encoder.default,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(data, cls=DjangoJSONEncoder).encode('utf-8')
+
+
+def loads(data):
+    """
+    Parse JSON from bytes or str
+
+    Args:
+        data: Encoded JSON (e.g. request.body or response.content)
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON (orjson's error subclasses it)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class ORJsonResponse(HttpResponse):
+    """HttpResponse that serializes its payload with orjson (falls back to DjangoJSONEncoder)"""
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(content=dumps(data), **kwargs)
@@ -0,0 +1,50 @@
+import json
+
+from django.db import migrations, models
+
+
+MATCHED_FIELDS = ('matched_skills', 'matched_industry_1', 'matched_industry_2')
+
+
+def normalize_matched_fields(apps, schema_editor):
+    """Rewrite stored match lists so every value is valid JSON before the column type changes"""
+    JobMatch = apps.get_model('zoho_app', 'JobMatch')
+    for match in JobMatch.objects.only('id', *MATCHED_FIELDS).iterator():
+        changed = False
+        for field in MATCHED_FIELDS:
+            value = getattr(match, field)
+            if value is None:
+                continue
+            try:
+                json.loads(value)
+            except (TypeError, ValueError):
+                setattr(match, field, json.dumps([value] if value.strip() else []))
+                changed = True
+        if changed:
+            match.save(update_fields=list(MATCHED_FIELDS))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('zoho_app', '0010_rename_matched_industries_jobmatch_matched_industry_1_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_matched_fields, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='jobmatch',
+            name='matched_skills',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='jobmatch',
+            name='matched_industry_1',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='jobmatch',
+            name='matched_industry_2',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('zoho_app', '0011_jobmatch_matched_fields_jsonfield'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobmatch',
+            index=models.Index(fields=['contact_id', '-match_score'], name='zoho_app_jo_contact_c9f17d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['contact_id', '-created_at'], name='zoho_app_sk_contact_62f04b_idx'),
+        ),
+    ]
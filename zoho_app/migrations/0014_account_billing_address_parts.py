@@ -0,0 +1,40 @@
+from django.db import migrations, models
+from django.db.models.functions import Left
+
+
+def copy_billing_address(apps, schema_editor):
+    """Keep previously stored billing addresses by moving them into billing_street"""
+    Account = apps.get_model('zoho_app', 'Account')
+    Account.objects.filter(billing_address__isnull=False).exclude(billing_address='').update(
+        billing_street=Left('billing_address', 255)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('zoho_app', '0013_contact_payload_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='account',
+            name='billing_street',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='account',
+            name='billing_city',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='account',
+            name='billing_state',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.RunPython(copy_billing_address, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='account',
+            name='billing_address',
+        ),
+    ]
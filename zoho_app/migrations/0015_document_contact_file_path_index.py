@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('zoho_app', '0014_account_billing_address_parts'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(fields=['contact_id', 'file_path'], name='zoho_app_do_contact_089cf8_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('zoho_app', '0015_document_contact_file_path_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='account',
+            name='modified_time',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='internrole',
+            name='modified_time',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
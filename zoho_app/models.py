@@ -171,6 +171,9 @@ class Contact(models.Model):
     # New field: Placement_Automation - can be null, 'Yes', 'No', or a date string
     placement_automation = models.CharField(max_length=255, null=True, blank=True)
 
+    # Digest of the last processed webhook payload, used to skip repeat deliveries
+    payload_hash = models.CharField(max_length=64, null=True, blank=True, db_index=True)
+
     def __str__(self):
         return self.full_name or self.email or self.id
 
@@ -179,7 +182,9 @@ class Account(models.Model):
     id = models.CharField(max_length=255, primary_key=True)
     name = models.CharField(max_length=255, blank=True, null=True)
     industry = models.CharField(max_length=255, blank=True, null=True)
-    billing_address = models.TextField(blank=True, null=True)
+    billing_street = models.CharField(max_length=255, blank=True, null=True)
+    billing_city = models.CharField(max_length=255, blank=True, null=True)
+    billing_state = models.CharField(max_length=255, blank=True, null=True)
     shipping_address = models.TextField(blank=True, null=True)
 
     owner_id = models.CharField(max_length=255, blank=True, null=True)
@@ -244,6 +249,13 @@ class Account(models.Model):
     location = models.CharField(max_length=255, blank=True, null=True)
     location_other = models.CharField(max_length=255, blank=True, null=True)
     account_status = models.CharField(max_length=255, blank=True, null=True)
+    modified_time = models.DateTimeField(blank=True, null=True)
+
+    @property
+    def billing_address(self):
+        """Billing address assembled from its parts on read"""
+        parts = [part for part in (self.billing_street, self.billing_city, self.billing_state) if part]
+        return ' '.join(parts) if parts else None
 
     def __str__(self):
         return self.name or self.id
@@ -262,6 +274,7 @@ class InternRole(models.Model):
     start_date = models.DateTimeField(blank=True, null=True)
     end_date = models.DateTimeField(blank=True, null=True)
     created_time = models.DateTimeField(blank=True, null=True)
+    modified_time = models.DateTimeField(blank=True, null=True)
     intern_company_id = models.CharField(max_length=255, blank=True, null=True)
     intern_company_name = models.CharField(max_length=255, blank=True, null=True)
     company_work_policy = models.TextField(blank=True, null=True)
@@ -312,6 +325,11 @@ class Document(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['contact_id', 'file_path']),
+        ]
+
     def __str__(self):
         return f"{self.document_name} ({self.document_type})"
 
@@ -329,6 +347,11 @@ class Skill(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['contact_id', '-created_at']),
+        ]
+
     def __str__(self):
         return f"{self.skill_name} - {self.skill_category}"
 
@@ -354,16 +377,21 @@ class JobMatch(models.Model):
     location_match = models.BooleanField(default=False)
     work_policy_match = models.BooleanField(default=False)
     skill_match = models.BooleanField(default=False)
-    matched_skills = models.TextField(blank=True, null=True)
+    matched_skills = models.JSONField(blank=True, null=True)
     match_reason = models.TextField(blank=True, null=True)
     industry_1_match = models.BooleanField(default=False)
     industry_2_match = models.BooleanField(default=False)
-    matched_industry_1 = models.TextField(blank=True, null=True)
-    matched_industry_2 = models.TextField(blank=True, null=True)
+    matched_industry_1 = models.JSONField(blank=True, null=True)
+    matched_industry_2 = models.JSONField(blank=True, null=True)
     status = models.CharField(max_length=50, default='active')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['contact_id', '-match_score']),
+        ]
+
     def __str__(self):
         return f"{self.contact_id} - {self.intern_role_id} [{self.match_score}]"
 
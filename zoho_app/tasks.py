@@ -0,0 +1,354 @@
+"""
+Celery tasks for CV processing, skill extraction, job matching and Zoho syncs
+"""
+import logging
+
+import requests
+from celery import chain, shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, autoretry_for=(requests.RequestException,), retry_backoff=True, max_retries=5)
+def process_contact_async(self, contact_id: str, contact_info: dict, payload_hash: str = None) -> dict:
+    """
+    Download CVs, extract skills and match jobs for a Ready to Pitch contact
+    
+    Args:
+        contact_id: Contact ID
+        contact_info: Contact data from Zoho (API or webhook)
+        payload_hash: Webhook payload hash to store once processing succeeds, so
+            identical repeat deliveries are skipped only after the CVs were handled
+        
+    Returns:
+        Processing summary dictionary
+    """
+    from etl.job_matcher import match_jobs_for_contact
+    from .models import Contact
+    from .views import get_webhook_handler
+    
+    handler = get_webhook_handler()
+    
+    try:
+        logger.info(f"Starting async processing for contact {contact_id}")
+        
+        # Get contact name
+        contact_name = handler.get_contact_full_name(contact_info)
+        
+        # Step 1: Download and manage CV files (includes duplicate cleanup)
+        logger.info(f"Step 15. *********Processing CVs for contact {contact_id} ('{contact_name}') *********")
+        # Zoho request errors propagate so autoretry_for can retry the task
+        downloaded_files = handler.process_cv_files(contact_id, contact_name, raise_request_errors=True)
+        
+        if not downloaded_files:
+            logger.warning(f"No CV files downloaded for contact {contact_id}")
+            if payload_hash:
+                Contact.objects.filter(id=contact_id).update(payload_hash=payload_hash)
+            return {'contact_id': contact_id, 'cv_files_processed': 0}
+        
+        # Step 2: Extract skills from downloaded CVs
+        logger.info(f"Step 16. *********Extracting skills for contact {contact_id} ('{contact_name}') *********")
+        skills_extracted = handler.extract_skills_from_cvs(contact_id, downloaded_files)
+        
+        # Step 3: Trigger job matching (in one hit as requested)
+        logger.info(f"Step 17. *********Matching jobs for contact {contact_id} ('{contact_name}') *********")
+        match_result = match_jobs_for_contact(contact_id)
+        
+        logger.info(f"=== ASYNC PROCESSING COMPLETED FOR CONTACT {contact_id} ===")
+        logger.info(f"  Contact Name: {contact_name}")
+        logger.info(f"  CVs Downloaded: {len(downloaded_files)}")
+        logger.info(f"  Skills Extracted: {skills_extracted}")
+        logger.info(f"  Job Matches Created: {match_result.get('matches_created', 0)}")
+        logger.info(f"  Total Job Matches: {match_result.get('total_matches', 0)}")
+        
+        if payload_hash:
+            Contact.objects.filter(id=contact_id).update(payload_hash=payload_hash)
+        
+        return {
+            'contact_id': contact_id,
+            'cv_files_processed': len(downloaded_files),
+            'skills_extracted': skills_extracted,
+            'job_matches': match_result.get('matches_created', 0),
+        }
+        
+    except requests.RequestException as e:
+        logger.warning(f"Zoho request failed while processing contact {contact_id}, retrying: {e}")
+        raise
+    except Exception as e:
+        logger.exception(f"Error in async processing for contact {contact_id}: {e}")
+        raise
+
+
+@shared_task(bind=True, max_retries=3)
+def process_contact_update_task(self, webhook_data: dict) -> dict:
+    """
+    Process a contact webhook acknowledged by handle_contact_webhook
+    
+    Zoho never resends a delivery that was answered with 202, so failed
+    processing is retried here with exponential backoff.
+    
+    Args:
+        webhook_data: Parsed webhook payload
+        
+    Returns:
+        Result dictionary from process_contact_update
+    """
+    from .views import get_webhook_handler
+    
+    result = get_webhook_handler().process_contact_update(webhook_data)
+    if result['status'] in ['success', 'skipped']:
+        logger.info(f"Webhook processing result: {result}")
+        return result
+    
+    if self.request.retries < self.max_retries:
+        logger.warning(f"Webhook processing failed, retrying: {result}")
+        raise self.retry(countdown=60 * 2 ** self.request.retries)
+    logger.error(f"Webhook processing failed after {self.max_retries} retries: {result}")
+    return result
+
+
+@shared_task(bind=True, max_retries=5)
+def sync_single_contact_task(self, contact_id: str, dedup_key: str = None) -> dict:
+    """
+    Sync one contact from Zoho for the contact sync webhook
+    
+    The webhook was already acknowledged, so Zoho will not resend it; failed
+    syncs are retried here with exponential backoff instead.
+    
+    Args:
+        contact_id: Zoho contact ID
+        dedup_key: Webhook dedup claim to release once the sync gives up
+        
+    Returns:
+        Result dictionary from sync_single_contact
+    """
+    from django.core.cache import cache
+    from .views import sync_single_contact
+    
+    result = sync_single_contact(contact_id)
+    if result['status'] == 'success':
+        logger.info(f"Step 5. *********Contact sync completed successfully for {contact_id} *********")
+        return result
+    
+    if self.request.retries < self.max_retries:
+        logger.warning(f"Contact sync failed for {contact_id}, retrying: {result['message']}")
+        raise self.retry(countdown=30 * 2 ** self.request.retries)
+    
+    logger.error(f"Contact sync failed for {contact_id} after {self.max_retries} retries: {result['message']}")
+    if dedup_key:
+        cache.delete(dedup_key)
+    return result
+
+
+@shared_task
+def sync_contact_batch_task() -> dict:
+    """
+    Sync the contacts collected by the contact sync webhook since the last batch
+    
+    Returns:
+        Batch summary dictionary
+    """
+    from .views import sync_queued_contacts
+    
+    return sync_queued_contacts()
+
+
+@shared_task
+def download_cvs_task(contact_id: str, contact_name: str) -> dict:
+    """
+    Download the latest CV files for a contact (I/O bound stage)
+
+    Args:
+        contact_id: Contact ID
+        contact_name: Contact name for file organization
+
+    Returns:
+        Pipeline payload with the downloaded file paths
+    """
+    from .views import get_webhook_handler
+
+    downloaded_files = get_webhook_handler().process_cv_files(contact_id, contact_name)
+    logger.info(f"Downloaded {len(downloaded_files)} CV files for contact {contact_id}")
+    return {
+        'contact_id': contact_id,
+        'contact_name': contact_name,
+        'downloaded_files': downloaded_files,
+    }
+
+
+@shared_task
+def extract_skills_task(payload: dict) -> dict:
+    """
+    Extract skills from the downloaded CVs (CPU/OpenAI bound stage)
+
+    Args:
+        payload: Output of download_cvs_task
+
+    Returns:
+        Pipeline payload with the number of skills extracted
+    """
+    from .views import get_webhook_handler
+
+    payload['skills_extracted'] = get_webhook_handler().extract_skills_from_cvs(
+        payload['contact_id'], payload['downloaded_files']
+    )
+    return payload
+
+
+@shared_task
+def match_jobs_task(payload: dict) -> dict:
+    """
+    Match jobs for the contact using its freshly extracted skills (DB bound stage)
+
+    Always runs the matcher uncached so a manual re-run rewrites the JobMatch rows.
+
+    Args:
+        payload: Output of extract_skills_task
+
+    Returns:
+        Pipeline payload with the job matching result
+    """
+    from etl.job_matcher import match_jobs_for_contact
+
+    payload['match_result'] = match_jobs_for_contact(payload['contact_id'])
+    return payload
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def sync_contacts_task(self, incremental: bool = True) -> bool:
+    """
+    Run the contact ETL sync off the request thread
+    
+    Args:
+        incremental: Only sync contacts modified since the last sync
+        
+    Returns:
+        True once the sync has completed
+    """
+    from django.core.cache import cache
+    from etl.pipeline import sync_contacts
+    from .models import Contact
+    from .views import get_row_count_cache_key, record_etl_sync_run, release_etl_sync_lock
+    
+    try:
+        sync_contacts(incremental=incremental)
+    except Exception:
+        # Keep the lock through autoretries; drop it once the task gives up
+        if self.request.retries >= self.max_retries:
+            release_etl_sync_lock('contacts', self.request.id)
+        raise
+    release_etl_sync_lock('contacts', self.request.id)
+    record_etl_sync_run('contacts')
+    cache.delete(get_row_count_cache_key(Contact))
+    return True
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def sync_accounts_task(self, incremental: bool = True) -> bool:
+    """
+    Run the account ETL sync off the request thread
+    
+    Args:
+        incremental: Only sync accounts modified since the last sync
+        
+    Returns:
+        True once the sync has completed
+    """
+    from django.core.cache import cache
+    from etl.pipeline import sync_accounts
+    from .models import Account
+    from .views import get_row_count_cache_key, record_etl_sync_run, release_etl_sync_lock
+    
+    try:
+        sync_accounts(incremental=incremental)
+    except Exception:
+        # Keep the lock through autoretries; drop it once the task gives up
+        if self.request.retries >= self.max_retries:
+            release_etl_sync_lock('accounts', self.request.id)
+        raise
+    release_etl_sync_lock('accounts', self.request.id)
+    record_etl_sync_run('accounts')
+    cache.delete(get_row_count_cache_key(Account))
+    return True
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def sync_intern_roles_task(self, incremental: bool = True) -> bool:
+    """
+    Run the intern role ETL sync off the request thread
+    
+    Args:
+        incremental: Only sync intern roles modified since the last sync
+        
+    Returns:
+        True once the sync has completed
+    """
+    from django.core.cache import cache
+    from etl.pipeline import sync_intern_roles
+    from .models import InternRole
+    from .views import get_row_count_cache_key, record_etl_sync_run, release_etl_sync_lock
+    
+    mode = "incremental" if incremental else "full"
+    logger.info(f"Starting {mode} sync for intern roles")
+    try:
+        sync_intern_roles(incremental=incremental)
+    except Exception:
+        # Keep the lock through autoretries; drop it once the task gives up
+        if self.request.retries >= self.max_retries:
+            release_etl_sync_lock('intern_roles', self.request.id)
+        raise
+    release_etl_sync_lock('intern_roles', self.request.id)
+    record_etl_sync_run('intern_roles')
+    cache.delete(get_row_count_cache_key(InternRole))
+    logger.info(f"Step 13. *********{mode.capitalize()} sync for intern roles completed *********")
+    return True
+
+
+@shared_task
+def sync_account_deals_task(account_id: str) -> int:
+    """
+    Sync the deals of an account from Zoho
+    
+    Args:
+        account_id: Zoho account ID
+        
+    Returns:
+        Number of deals synced
+    """
+    from .views import get_webhook_handler
+    
+    return get_webhook_handler().sync_account_deals(account_id)
+
+
+@shared_task
+def sync_intern_role_deals_task(intern_role_id: str) -> int:
+    """
+    Sync the deals of an intern role
+    
+    Args:
+        intern_role_id: Intern role ID
+        
+    Returns:
+        Number of deals synced
+    """
+    from .views import get_webhook_handler
+    
+    return get_webhook_handler().sync_intern_role_deals(intern_role_id)
+
+
+def cv_processing_chain(contact_id: str, contact_name: str):
+    """
+    Build the CV download -> skill extraction -> job matching chain for a contact
+
+    Args:
+        contact_id: Contact ID
+        contact_name: Contact name for file organization
+
+    Returns:
+        Celery chain signature ready for apply_async()
+    """
+    return chain(
+        download_cvs_task.s(contact_id, contact_name),
+        extract_skills_task.s(),
+        match_jobs_task.s(),
+    )
@@ -15,6 +15,8 @@ urlpatterns = [
     # ETL endpoints
     path('api/etl/trigger/', views.trigger_etl_sync, name='trigger_etl'),
     path('api/etl/status/', views.etl_status, name='etl_status'),
+    path('api/etl/status/stream/', views.etl_status_stream, name='etl_status_stream'),
+    path('api/etl/job/<str:task_id>/status/', views.etl_job_status, name='etl_job_status'),
     
     # Test endpoints
     path('webhook/manual-cv-extraction/<str:contact_id>/', views.manual_cv_extraction, name='manual_cv_extraction'),
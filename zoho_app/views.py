@@ -2,33 +2,657 @@ import json
 import logging
 import hmac
 import hashlib
-import threading
 import asyncio
 import os
+import time
+import uuid
+import random
+import threading
 import requests
-from typing import List, Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Any, Optional, Tuple
+from email.utils import parsedate_to_datetime
+from urllib.parse import unquote_plus, unquote_to_bytes
 from concurrent.futures import ThreadPoolExecutor
-from django.http import JsonResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
-from django.views.decorators.http import require_http_methods
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_http_methods
 from django.conf import settings
+from django.core.cache import cache
 from django.utils.decorators import method_decorator
 from django.views import View
-from django.db import transaction
+from django.db import IntegrityError, close_old_connections, connection, transaction
+from django.db.models import Count, Max, Q
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
-from .models import Contact, JobMatch, Skill, Document
+from .models import Contact, JobMatch, Skill, Document, Account, Deal, InternRole, SyncTracker
+from .json_utils import ORJsonResponse, dumps as json_dumps, loads as json_loads
+from .tasks import (
+    process_contact_async, cv_processing_chain, sync_intern_roles_task,
+    sync_account_deals_task, sync_intern_role_deals_task, sync_single_contact_task,
+    sync_contact_batch_task, sync_contacts_task, sync_accounts_task, process_contact_update_task,
+)
+from celery import group
+from celery.result import AsyncResult
 from zoho.attachments import ZohoAttachmentManager
 from zoho.api_client import ZohoClient
-from etl.job_matcher import match_jobs_for_contact
-from etl.pipeline import sync_contacts, sync_accounts, sync_intern_roles
+from zoho.auth import get_access_token
+from zoho.rate_limit import zoho_api_limiter, acquire_shared_slot, ZOHO_API_MAX_CONCURRENT
+from etl.job_matcher import match_jobs_for_contact, JobMatcher, get_job_matches_cache_version
+from etl.pipeline import (
+    flush_sync_batch,
+    parse_datetime_field, extract_nested_id, extract_nested_name, extract_nested_email, list_to_json_string,
+)
+
+try:
+    import ciso8601
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Server-Sent Events settings for the ETL status streams; under WSGI each open
+# stream holds a worker, so streams are short-lived and their number is capped
+ETL_STREAM_POLL_INTERVAL = 2  # seconds between sync tracker checks
+ETL_STREAM_MAX_DURATION = 30  # seconds before the stream closes and the client reconnects
+ETL_STREAM_MAX_SUBSCRIBERS = int(os.getenv('ETL_STREAM_MAX_SUBSCRIBERS', 4))  # open streams across all workers
+ETL_STREAM_SUBSCRIBERS_KEY = 'etl:stream:subscribers'
+ROW_COUNT_CACHE_TTL = 60  # seconds to reuse the entity counts reported by etl_status
+ETL_SYNC_LOCK_TIMEOUT = 3600  # seconds before an ETL sync lock is considered abandoned
+ETL_STATUS_MAX_AGE = 30  # seconds clients and proxies may reuse an etl_status response
+ETL_INCREMENTAL_MIN_INTERVAL = 60  # seconds after a finished sync during which incremental syncs are skipped
+
+# Contact webhook fields that update_local_contact persists, plus Modified_Time so a
+# new revision (e.g. a replaced CV) is never mistaken for a repeat delivery; a repeat
+# delivery with identical values for all of them is skipped
+CONTACT_PAYLOAD_HASH_FIELDS = (
+    'id', 'Full_Name', 'First_Name', 'Last_Name', 'Email', 'Phone', 'Company', 'Account_Name',
+    'Title', 'Department', 'Role_Success_Stage', 'role_success_stage',
+    'Placement_Automation', 'placement_automation', 'Modified_Time',
+)
+
+READY_TO_PITCH_STAGE = 'Ready to Pitch'  # role success stage that triggers CV processing
+
+JOB_MATCH_CACHE_TTL = 3600  # seconds to reuse job match results for unchanged matching inputs
+# Contact fields JobMatcher scores besides skills (industry preferences, location, start date)
+JOB_MATCH_CONTACT_FIELDS = (
+    'industry', 'industry_choice_1', 'industry_choice_2', 'industry_choice_3',
+    'industry_1_areas', 'industry_2_areas', 'location', 'current_location_v2', 'start_date',
+)
+JOB_MATCHES_RESPONSE_TTL = 60  # seconds to serve a cached get_job_matches response
+
+ZOHO_FETCH_CONCURRENCY = ZOHO_API_MAX_CONCURRENT  # parallel Zoho lookups when syncing a list of records
+
+ZOHO_REQUEST_TIMEOUT = (5, 30)  # (connect, read) seconds for single-record Zoho lookups
+
+ZOHO_FETCH_CACHE_TTL = 60  # seconds to reuse a single-record Zoho API response
+
+
+ZOHO_FETCH_ATTEMPTS = 3  # attempts per Zoho lookup when rate limited (429) or failing (5xx)
+ZOHO_MAX_RETRY_DELAY = 30  # cap in seconds for a Retry-After or backoff sleep
+
+
+WEBHOOK_DEDUP_TTL = 86400  # seconds to remember a processed webhook delivery
+WEBHOOK_LOG_BODY_PREVIEW = 1024  # bytes of a failed webhook body written to the error log
+
+CONTACT_SYNC_QUEUE_KEY = 'zoho:sync:contacts'  # Redis list of pending contact sync webhooks
+CONTACT_SYNC_BATCH_SIZE = 200  # contacts synced per batch
+
+
+def get_zoho_record_cache_key(module: str, record_id: str) -> str:
+    """Cache key for a single Zoho record fetched by the webhook handler"""
+    return f"zoho:{module}:{record_id}"
+
+
+def _safe_unlink(file_path: str):
+    """Delete a file, ignoring files that are already gone and logging other failures"""
+    try:
+        os.unlink(file_path)
+        logger.info(f"Deleted existing CV file: {file_path}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Could not delete file {file_path}: {e}")
+
+
+def _parse_zoho_form(raw_body: bytes) -> dict:
+    """
+    Decode a form-encoded Zoho webhook body in a single pass
+    
+    Each key and value is unquoted exactly once; the first value of a repeated key
+    wins and blank values are dropped, as parse_qs did. Zoho field names are plain
+    ASCII, so keys take the ASCII fast path and only values go through the UTF-8 codec.
+    
+    Args:
+        raw_body: Raw request body (request.body)
+        
+    Returns:
+        Dictionary of field name to value
+    """
+    form = {}
+    for pair in raw_body.split(b'&'):
+        key, _, value = pair.partition(b'=')
+        if not value:
+            continue
+        if b'%' in key or b'+' in key:
+            key = unquote_plus(key.decode('utf-8', 'replace'))
+        else:
+            key = key.decode('ascii', 'replace')
+        form.setdefault(key, unquote_to_bytes(value.replace(b'+', b' ')).decode('utf-8', 'replace'))
+    return form
+
+
+def _parse_webhook_body(content_type: str, raw_body: bytes, allow_json: bool = True):
+    """
+    Parse a Zoho webhook body according to its content type
+    
+    Args:
+        content_type: Request content type (request.content_type)
+        raw_body: Raw request body (request.body)
+        allow_json: Whether application/json bodies are accepted
+        
+    Returns:
+        Parsed webhook data, or None if the content type is not supported
+        
+    Raises:
+        json.JSONDecodeError: If a JSON body is malformed
+    """
+    if content_type.startswith('application/x-www-form-urlencoded'):
+        webhook_data = _parse_zoho_form(raw_body)
+        logger.info(f"Step 2. *********Parsed form data received *********")
+        return webhook_data
+    if allow_json and content_type.startswith('application/json'):
+        webhook_data = json_loads(raw_body)
+        logger.info(f"Step 2. *********Parsed JSON data received *********")
+        return webhook_data
+    logger.error(f"Unsupported content type: {content_type}")
+    return None
+
+
+def _oversized_webhook_response(request, webhook_data: dict = None):
+    """
+    Build a 413 response for a webhook body or payload over the configured limits
+    
+    Called with only the request before the body is read (Content-Length check), and
+    again with the parsed payload to cap its number of fields.
+    
+    Args:
+        request: Django request
+        webhook_data: Parsed webhook payload, if already parsed
+        
+    Returns:
+        413 response if a limit is exceeded, None otherwise
+    """
+    if webhook_data is None:
+        try:
+            content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            content_length = 0
+        if content_length <= settings.WEBHOOK_MAX_BODY_SIZE:
+            return None
+        logger.warning(f"Rejected webhook body of {content_length} bytes")
+    elif len(webhook_data) <= settings.WEBHOOK_MAX_FIELDS:
+        return None
+    else:
+        logger.warning(f"Rejected webhook payload with {len(webhook_data)} fields")
+    return ORJsonResponse({'error': 'Payload too large'}, status=413)
+
+
+def _log_raw_body(raw_body: bytes):
+    """Log the size and the first WEBHOOK_LOG_BODY_PREVIEW bytes of a failed webhook body"""
+    logger.error(
+        f"Raw body ({len(raw_body)} bytes): "
+        f"{raw_body[:WEBHOOK_LOG_BODY_PREVIEW].decode('utf-8', 'replace')}"
+    )
+
+
+def _invalid_json_response(error: Exception, raw_body: bytes):
+    """Log a malformed JSON webhook body and build the 400 response"""
+    logger.error(f"JSON decode error: {error}")
+    _log_raw_body(raw_body)
+    return ORJsonResponse({'error': 'Invalid JSON payload'}, status=400)
+
+
+def _log_webhook_preview(webhook_data: dict):
+    """Log the first 500 characters of a webhook payload, serializing it only when INFO is enabled"""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("data: %s...", json_dumps(webhook_data)[:500].decode('utf-8', 'replace'))
+
+
+def _retry_delay(response, attempt: int) -> float:
+    """
+    Seconds to wait before retrying a rate-limited or failed Zoho request
+    
+    Args:
+        response: The 429/5xx response
+        attempt: Zero-based attempt number
+        
+    Returns:
+        Retry-After (seconds or HTTP date) for 429s, otherwise exponential backoff with jitter
+    """
+    retry_after = response.headers.get('Retry-After') if response.status_code == 429 else None
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = (parsedate_to_datetime(retry_after) - timezone.now()).total_seconds()
+            except (TypeError, ValueError):
+                delay = 2 ** attempt
+    else:
+        delay = 2 ** attempt + random.uniform(0, 0.5)
+    return min(max(delay, 0), ZOHO_MAX_RETRY_DELAY)
+
+
+def _parse_zoho_datetime(date_str):
+    """Parse a Zoho ISO 8601 datetime string, returning None if missing or invalid"""
+    if date_str:
+        try:
+            # ciso8601's C parser is much faster than Django's regex-based fallback
+            if CISO8601_AVAILABLE:
+                return ciso8601.parse_datetime(date_str)
+            return parse_datetime(date_str)
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+# String spellings of a checked Zoho checkbox
+_ZOHO_TRUE_VALUES = frozenset({'true', 'True', 'TRUE', '1', 'yes', 'Yes', 'YES'})
+
+
+def _zoho_bool(value) -> bool:
+    """Interpret a Zoho checkbox value (bool or 'true'/'1'/'yes' string)"""
+    return value is True or (type(value) is str and value in _ZOHO_TRUE_VALUES)
+
+
+def _nested_value(key: str):
+    """Build a converter reading one key of a nested Zoho object (None for non-dict values)"""
+    def convert(obj):
+        return obj.get(key) if isinstance(obj, dict) else None
+    return convert
+
+
+def _zoho_lookup(value) -> dict:
+    """Normalise a Zoho lookup field ({'id', 'name', ...} dict or bare ID) to a dict"""
+    if isinstance(value, dict):
+        return value
+    return {'id': value} if value else {}
+
+
+def map_zoho_fields(record: dict, field_map: tuple) -> dict:
+    """
+    Map a Zoho record to local model field values using a field map
+    
+    Args:
+        record: Zoho record dictionary
+        field_map: Tuple of (model_field, zoho_key, converter) entries; converter may be None
+        
+    Returns:
+        Dictionary of model field values
+    """
+    mapped = {}
+    get = record.get
+    for field_name, zoho_key, converter in field_map:
+        value = get(zoho_key)
+        mapped[field_name] = converter(value) if converter else value
+    return mapped
+
+
+# (model field, Zoho field, converter) for Account records
+ACCOUNT_FIELD_MAP = (
+    ('industry', 'Industry', None),
+    ('billing_street', 'Billing_Street', None),
+    ('billing_city', 'Billing_City', None),
+    ('billing_state', 'Billing_State', None),
+    ('shipping_address', 'Shipping_Street', None),
+    ('cleanup_start_date', 'Cleanup_Start_Date', _parse_zoho_datetime),
+    ('last_activity_time', 'Last_Activity_Time', _parse_zoho_datetime),
+    ('last_full_due_diligence_date', 'Last_Full_Due_Diligence_Date', _parse_zoho_datetime),
+    ('follow_up_date', 'Follow_up_Date', _parse_zoho_datetime),
+    ('next_reply_date', 'Next_Reply_Date', _parse_zoho_datetime),
+    ('field_states', '$field_states', None),
+    ('management_status', 'Management_Status', None),
+    ('company_work_policy', 'Company_Work_Policy', None),
+    ('company_industry', 'Company_Industry', None),
+    ('company_description', 'Company_Description', None),
+    ('approval_status', 'Approval_Status', None),
+    ('street', 'Street', None),
+    ('classic_partnership', 'Classic_Partnership', None),
+    ('state_region', 'State_Region', None),
+    ('cleanup_status', 'Cleanup_Status', None),
+    ('uni_region', 'Uni_Region', None),
+    ('approval', 'Approval', None),
+    ('uni_outreach_status', 'Uni_Outreach_Status', None),
+    ('enrich_status', 'Enrich_Status', None),
+    ('roles_available', 'Roles_Available', None),
+    ('roles', 'Roles', None),
+    ('city', 'City', None),
+    ('postcode', 'Postcode', None),
+    ('outreach_notes', 'Outreach_Notes', None),
+    ('company_industry_other', 'Company_Industry_Other', None),
+    ('no_employees', 'No_Employees', None),
+    ('industry_areas', 'Industry_Areas', None),
+    ('placement_revision_required', 'Placement_Revision_Required', None),
+    ('country', 'Country', None),
+    ('uni_state_if_in_us', 'Uni_State_if_in_US', None),
+    ('review_process', 'Review_Process', None),
+    ('layout_id', '$layout_id', None),
+    ('layout_display_label', '$layout_display_label', None),
+    ('layout_name', '$layout_name', None),
+    ('review', 'Review', None),
+    ('cleanup_notes', 'Cleanup_Notes', None),
+    ('account_notes', 'Account_Notes', None),
+    ('standard_working_hours', 'Standard_Working_Hours', None),
+    ('due_diligence_fields_to_revise', 'Due_Diligence_Fields_to_Revise', None),
+    ('uni_country', 'Uni_Country', None),
+    ('cleanup_phase', 'Cleanup_Phase', None),
+    ('record_status', 'Record_Status', None),
+    ('type', 'Type', None),
+    ('uni_timezone', 'Uni_Timezone', None),
+    ('company_address', 'Company_Address', None),
+    ('tag', 'Tag', None),
+    ('approval_state', '$approval_state', None),
+    ('location', 'Location', None),
+    ('location_other', 'Location_Other', None),
+    ('account_status', 'Account_Status', None),
+    ('process_flow', '$process_flow', _zoho_bool),
+    ('locked_for_me', '$locked_for_me', _zoho_bool),
+    ('is_duplicate', '$is_duplicate', _zoho_bool),
+    ('in_merge', '$in_merge', _zoho_bool),
+    ('upon_to_remote_interns', 'Upon_to_Remote_Interns', _zoho_bool),
+    ('locked', '$locked', _zoho_bool),
+    ('is_dnc', '$is_dnc', _zoho_bool),
+    ('pathfinder', 'Pathfinder', _zoho_bool),
+    ('gold_rating', 'Gold_Rating', _zoho_bool),
+    ('modified_time', 'Modified_Time', _parse_zoho_datetime),
+)
+
+# (model field, Zoho field, converter) for InternRole records
+INTERN_ROLE_FIELD_MAP = (
+    ('name', 'Name', None),
+    ('role_title', 'Role_Title', None),
+    ('role_description_requirements', 'Role_Description_Requirements', None),
+    ('role_status', 'Role_Status', None),
+    ('role_function', 'Role_Function', None),
+    ('role_department_size', 'Role_Department_Size', None),
+    ('role_attachments_jd', 'Role_Attachments_JD', None),
+    ('role_tags', 'Role_Tags', None),
+    ('start_date', 'Start_Date', _parse_zoho_datetime),
+    ('end_date', 'End_Date', _parse_zoho_datetime),
+    ('created_time', 'Created_Time', _parse_zoho_datetime),
+    ('modified_time', 'Modified_Time', _parse_zoho_datetime),
+    ('company_work_policy', 'Company_Work_Policy', None),
+    ('location', 'Location', None),
+    ('open_to_remote', 'Open_to_Remote', None),
+    ('due_diligence_status_2', 'Due_Diligence_Status_2', None),
+    ('account_outreach_status', 'Account_Outreach_Status', None),
+    ('record_status', 'Record_Status', None),
+    ('approval_state', '$approval_state', None),
+    ('management_status', 'Management_Status', None),
+    ('placement_fields_to_revise', 'Placement_Fields_to_Revise', None),
+    ('placement_revision_notes', 'Placement_Revision_Notes', None),
+    ('gold_rating', 'Gold_Rating', _zoho_bool),
+    ('locked', '$locked', _zoho_bool),
+)
+
+# (model field, Zoho field, converter) for Deal records
+DEAL_FIELD_MAP = (
+    ('deal_name', 'Deal_Name', None),
+    ('description', 'Description', None),
+    ('stage', 'Stage', None),
+    ('start_date', 'Start_Date', _parse_zoho_datetime),
+    ('end_date', 'End_Date', _parse_zoho_datetime),
+    ('created_time', 'Created_Time', _parse_zoho_datetime),
+    ('modified_time', 'Modified_Time', _parse_zoho_datetime),
+)
+
+# (model field, Zoho field, converter) for Contact records synced from Zoho
+CONTACT_FIELD_MAP = (
+    # Core fields
+    ('email', 'Email', None),
+    ('first_name', 'First_Name', None),
+    ('last_name', 'Last_Name', None),
+    ('phone', 'Phone', None),
+    ('account_id', 'Account_Name', extract_nested_id),
+    ('account_name', 'Account_Name', extract_nested_name),
+    ('title', 'Title', None),
+    ('department', 'Department', None),
+    ('updated_time', 'Modified_Time', parse_datetime_field),
+    ('created_time', 'Created_Time', parse_datetime_field),
+    ('full_name', 'Full_Name', None),
+
+    # Location and Industry fields
+    ('location', 'Location', None),
+    ('industry', 'Industry', None),
+    ('industry_choice_1', 'Industry_Choice_1', None),
+    ('industry_choice_2', 'Industry_choice_2', None),
+    ('industry_choice_3', 'Industry_Choice_3', None),
+    ('industry_1_areas', 'Industry_1_Areas', None),
+    ('industry_2_areas', 'Industry_2_Areas', None),
+    ('current_location_v2', 'Current_Location_V2', None),
+    ('location_other', 'Location_Other', None),
+    ('alternative_location1', 'Alternative_Location1', None),
+    ('country_city_of_residence', 'Country_city_of_residence', None),
+
+    # Student and Academic fields
+    ('skills', 'Skills', None),
+    ('student_status', 'Student_Status', None),
+    ('university_name', 'University_Name', None),
+    ('graduation_date', 'Graduation_Date', parse_datetime_field),
+    ('student_bio', 'Student_Bio', None),
+    ('uni_start_date', 'Uni_Start_Date', parse_datetime_field),
+    ('english_level', 'English_Level', None),
+    ('age_on_start_date', 'Age_on_Start_Date', None),
+    ('date_of_birth', 'Date_of_Birth', parse_datetime_field),
+
+    # Placement and Role fields
+    ('placement_status', 'Placement_status', None),
+    ('start_date', 'Start_date', parse_datetime_field),
+    ('end_date', 'End_date', parse_datetime_field),
+    ('role_success_stage', 'Role_Success_Stage', None),
+    ('role_owner', 'Role_Owner', extract_nested_name),
+    ('role_success_notes', 'Role_Success_Notes', None),
+    ('role_confirmed_date', 'Role_confirmed_date', parse_datetime_field),
+    ('paid_role', 'Paid_Role', None),
+    ('likelihood_to_convert', 'Likelihood_to_convert', None),
+    ('job_title', 'Job_Title', None),
+    ('job_offered_after', 'Job_offered_after', None),
+
+    # Contact and Communication fields
+    ('link_to_cv', 'Link_to_CV', None),
+    ('contact_email', 'Contact_Email', None),
+    ('secondary_email', 'Secondary_Email', None),
+    ('do_not_contact', 'Do_Not_Contact', _zoho_bool),
+    ('email_opt_out', 'Email_Opt_Out', _zoho_bool),
+    ('unsubscribed_time', 'Unsubscribed_Time', parse_datetime_field),
+    ('follow_up_date', 'Follow_up_Date', parse_datetime_field),
+
+    # Personal Information
+    ('gender', 'Gender', None),
+    ('nationality', 'Nationality', None),
+    ('timezone', 'Timezone', None),
+    ('contact_last_name', 'Contact_Last_Name', None),
+
+    # Visa and Travel fields
+    ('visa_eligible', 'Visa_Eligible', None),
+    ('requires_a_visa', 'Requires_a_visa', None),
+    ('visa_type_exemption', 'Visa_Type_Exemption', None),
+    ('visa_successful', 'Visa_successful', None),
+    ('visa_alt_options', 'Visa_Alt_Options', list_to_json_string),
+    ('visa_notes', 'Visa_Note_s', None),
+    ('visa_owner', 'Visa_Owner', extract_nested_name),
+    ('visa_f_u_date', 'Visa_F_U_Date', parse_datetime_field),
+    ('arrival_date_time', 'Arrival_date_time', parse_datetime_field),
+    ('departure_date_time', 'Departure_date_time', parse_datetime_field),
+    ('departure_flight_number', 'Departure_flight_number', None),
+    ('arrival_drop_off_address', 'Arrival_drop_off_address', None),
+
+    # Additional fields to complete the mapping
+    ('interview', 'Interview', None),
+    ('interview_successful', 'Interview_successful', None),
+    ('interviewer', 'Interviewer', None),
+    ('myinterview_url', 'MyInterview_URL', None),
+    ('intro_call_date', 'Intro_Call_Date', parse_datetime_field),
+    ('call_scheduled_date_time', 'Call_Scheduled_Date_Time', parse_datetime_field),
+    ('call_booked_date_time', 'Call_Booked_Date_Time', parse_datetime_field),
+    ('call_to_conversion_time_days', 'Call_to_Conversion_Time_days', None),
+    ('enrolment_to_intro_call_lead_time', 'Enrolment_to_Intro_Call_Lead_Time', None),
+    ('process_flow', '$process_flow', _zoho_bool),
+    ('approval', '$approval', None),
+    ('approval_date', 'Approval_date', parse_datetime_field),
+    ('approval_state', '$approval_state', None),
+    ('review_process', '$review_process', None),
+    ('admission_member', 'Admission_Member', extract_nested_name),
+    ('lead_created_time', 'Lead_Created_Time', parse_datetime_field),
+    ('last_activity_time', 'Last_Activity_Time', parse_datetime_field),
+    ('layout_id', 'Layout', extract_nested_id),
+    ('layout_display_label', 'Layout', _nested_value('display_label')),
+    ('layout_name', 'Layout', _nested_value('name')),
+    ('field_states', '$field_states', None),
+    ('student_decision', 'Student_decision', None),
+    ('company_decision', 'Company_decision', None),
+    ('rating_new', 'Rating_New', None),
+    ('rating', 'Rating', None),
+    ('warm_call', 'Warm_Call', None),
+    ('other_industry', 'Other_industry', None),
+    ('review', '$review', None),
+    ('reason_for_cancellation', 'Reason_for_Cancellation', None),
+    ('cancelled_date_time', 'Cancelled_Date_Time', parse_datetime_field),
+    ('notes1', 'Notes1', None),
+    ('partner_organisation', 'Partner_Organisation', None),
+    ('date_of_cancellation', 'Date_of_Cancellation', parse_datetime_field),
+    ('in_merge', '$in_merge', _zoho_bool),
+    ('duration', 'Duration', None),
+    ('utm_campaign', 'UTM_Campaign', None),
+    ('utm_medium', 'UTM_Medium', None),
+    ('utm_content', 'UTM_Content', None),
+    ('utm_gclid', 'UTM_GCLID', None),
+    ('description', 'Description', None),
+    ('locked_for_me', '$locked_for_me', _zoho_bool),
+    ('from_university_partner', 'From_University_partner', None),
+    ('placement_urgency', 'Placement_Urgency', None),
+    ('enrich_status', 'Enrich_Status__s', None),
+    ('cohort_start_date', 'Cohort_Start_Date', parse_datetime_field),
+    ('is_duplicate', '$is_duplicate', _zoho_bool),
+    ('signed_agreement', 'Signed_Agreement', None),
+    ('accommodation_finalised', 'Accommodation_finalised', None),
+    ('send_mail2', 'Send_Mail2', _zoho_bool),
+    ('t_c_link', 'T_C_Link', None),
+    ('number_of_days', 'Number_of_Days', None),
+    ('agreement_finalised', 'Agreement_finalised', None),
+    ('end_date_auto_populated', 'End_date_Auto_populated', parse_datetime_field),
+    ('total', 'Total', None),
+    ('house_rules', 'House_rules', None),
+    ('other_payment_status', 'Other_Payment_Status', None),
+    ('days_since_conversion', 'Days_Since_Conversion', None),
+    ('name1', 'Name1', None),
+    ('average_no_of_days', 'Average_no_of_days', None),
+    ('placement_lead_time_days', 'Placement_Lead_Time_days', None),
+    ('placement_deadline', 'Placement_Deadline', parse_datetime_field),
+    ('change_log_time', 'Change_Log_Time__s', parse_datetime_field),
+    ('community_owner', 'Community_Owner', extract_nested_name),
+    ('created_by_email', 'Created_By', extract_nested_email),
+    ('decision_date', 'Decision_Date', parse_datetime_field),
+    ('last_enriched_time', 'Last_Enriched_Time__s', parse_datetime_field),
+    ('refund_date', 'Refund_date', parse_datetime_field),
+    ('ps_assigned_date', 'PS_Assigned_Date', parse_datetime_field),
+    ('books_cust_id', 'books_cust_id', None),
+    ('days_count', 'Days_Count', None),
+    ('record_status', 'Record_Status__s', None),
+    ('type', 'Type', None),
+    ('cancellation_notes', 'Cancellation_Notes', None),
+    ('locked', 'Locked__s', _zoho_bool),
+    ('tag', 'Tag', None),
+    ('additional_information', 'Additional_Information', None),
+    ('token', 'Token', None),
+    ('partnership_specialist_id', 'Partnership_Specialist', extract_nested_name),
+)
+
+
+def save_local_record(model, record_data: dict, label: str) -> bool:
+    """
+    Update a local record in place, creating it if it does not exist yet
+    
+    Issues one UPDATE ... WHERE pk without loading the row first; None values are
+    left untouched, as the Zoho payload may omit fields. When the record carries a
+    modified_time, the UPDATE only applies if it is newer than the stored one, so
+    redundant webhooks for an unchanged record do not rewrite the row.
+    
+    Args:
+        model: Django model class
+        record_data: Field values including 'id'
+        label: Record type used in log messages
+        
+    Returns:
+        True if a new record was created
+    """
+    record_id = record_data['id']
+    update_values = {field: value for field, value in record_data.items() if field != 'id' and value is not None}
+    
+    # QuerySet.update() skips auto_now, so stamp those fields explicitly
+    now = timezone.now()
+    for field in model._meta.concrete_fields:
+        if getattr(field, 'auto_now', False):
+            update_values[field.name] = now
+    
+    rows = model.objects.filter(pk=record_id)
+    modified_time = record_data.get('modified_time')
+    if modified_time is not None:
+        rows = rows.filter(Q(modified_time__isnull=True) | Q(modified_time__lt=modified_time))
+    
+    if rows.update(**update_values):
+        logger.info("Successfully updated local %s %s", label, record_id)
+        return False
+    
+    if modified_time is not None and model.objects.filter(pk=record_id).exists():
+        logger.info("Local %s %s is already at Modified_Time %s - skipping update", label, record_id, modified_time)
+        return False
+    
+    logger.info("%s %s not found locally - creating new record", label.capitalize(), record_id)
+    try:
+        # Savepoint so a concurrent insert of the same record does not break the caller's transaction
+        with transaction.atomic():
+            model.objects.create(**record_data)
+    except IntegrityError:
+        # Another webhook created the row between our UPDATE and INSERT; apply ours on top
+        rows.update(**update_values)
+        logger.info("Successfully updated local %s %s after concurrent insert", label, record_id)
+        return False
+    logger.info("Created new local %s %s", label, record_id)
+    return True
+
 
 class ZohoWebhookHandler:
     """Handles Zoho CRM webhook notifications"""
     
+    # Alternate spellings of contact fields across JSON and form-encoded webhooks
+    NAME_ALIASES = (
+        ('First_Name', 'first_name', 'firstName'),
+        ('Last_Name', 'last_name', 'lastName'),
+        ('Full_Name', 'name', 'fullName'),
+    )
+    STAGE_ALIASES = ('Role_Success_Stage', 'role_success_stage')
+    
+    @staticmethod
+    def _first(data: dict, keys: tuple):
+        """Return the first non-empty value in data for the given alias keys"""
+        for key in keys:
+            value = data.get(key)
+            if value:
+                return value
+        return None
+    
     def __init__(self):
         """Initialize the webhook handler"""
         # Get configuration from Django settings
@@ -36,31 +660,112 @@ class ZohoWebhookHandler:
             download_dir=getattr(settings, 'CV_DOWNLOAD_DIR', 'downloads')
         )
         self.webhook_secret = getattr(settings, 'WEBHOOK_SECRET', 'your_webhook_secret_key_here')
+        # Encode the secret once instead of on every signature check
+        self._secret_bytes = self.webhook_secret.encode('utf-8')
         self.zoho_client = ZohoClient()
         
-    def verify_webhook_signature(self, payload: str, signature: str) -> bool:
+        # Shared HTTP session so Zoho API calls reuse pooled keep-alive connections
+        # (the handler is a process-wide singleton, see get_webhook_handler).
+        # Transient errors and 429s are retried with backoff; the final response is
+        # still returned so the fetchers' own error handling applies.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+            raise_on_status=False
+        )
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retry))
+        self.session.headers['Content-Type'] = 'application/json'
+        
+        # Authorization header reused until the cached access token changes
+        self._auth_token = None
+        self._auth_headers = {}
+        
+    def get_auth_headers(self) -> dict:
+        """
+        Get the Zoho Authorization header for the current access token
+        
+        Returns:
+            Header dictionary (rebuilt only when the token is refreshed)
+        """
+        token = get_access_token()
+        if token != self._auth_token:
+            self._auth_headers = {"Authorization": f"Zoho-oauthtoken {token}"}
+            self._auth_token = token
+        return self._auth_headers
+    
+    def zoho_get(self, url: str, headers: dict, params: dict = None) -> requests.Response:
+        """
+        GET a Zoho API URL under the rate limiters, waiting out 429s and 5xx errors
+        
+        The session adapter already retries quickly; this loop covers longer
+        Retry-After windows that urllib3 would give up on.
+        
+        Args:
+            url: Zoho API URL
+            headers: Request headers (Authorization)
+            params: Optional query parameters
+            
+        Returns:
+            The last response received (callers still call raise_for_status)
+        """
+        for attempt in range(ZOHO_FETCH_ATTEMPTS):
+            with zoho_api_limiter:
+                acquire_shared_slot()
+                response = self.session.get(url, headers=headers, params=params, timeout=ZOHO_REQUEST_TIMEOUT)
+            if response.status_code != 429 and response.status_code < 500:
+                return response
+            if attempt + 1 < ZOHO_FETCH_ATTEMPTS:
+                delay = _retry_delay(response, attempt)
+                logger.warning(f"Zoho returned {response.status_code} for {url}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+        return response
+    
+    def verify_webhook_signature(self, payload: bytes, signature: str) -> bool:
         """
         Verify the webhook signature from Zoho
         
         Args:
-            payload: Raw webhook payload
-            signature: Signature from Zoho webhook headers
+            payload: Raw webhook payload bytes (request.body)
+            signature: Hex SHA-256 signature from Zoho webhook headers
             
         Returns:
             True if signature is valid
         """
         try:
-            expected_signature = hmac.new(
-                self.webhook_secret.encode('utf-8'),
-                payload.encode('utf-8'),
-                hashlib.sha256
-            ).hexdigest()
+            expected_digest = hmac.new(self._secret_bytes, payload, hashlib.sha256).digest()
+            
+            try:
+                supplied_digest = bytes.fromhex(signature)
+            except ValueError:
+                return False
             
-            return hmac.compare_digest(signature, expected_signature)
+            return len(supplied_digest) == len(expected_digest) and hmac.compare_digest(expected_digest, supplied_digest)
         except Exception as e:
             logger.error(f"Error verifying webhook signature: {e}")
             return False
     
+    def acquire_webhook_dedup_key(self, module: str, record_id: str, webhook_data: dict) -> Optional[str]:
+        """
+        Claim a webhook delivery so Zoho retries of the same payload are ignored
+        
+        Args:
+            module: Record type, e.g. 'contact'
+            record_id: Zoho record ID
+            webhook_data: Webhook payload data
+            
+        Returns:
+            The dedup key if this delivery is new, None if it was already seen
+        """
+        payload_bytes = json.dumps(webhook_data, sort_keys=True, default=str).encode('utf-8')
+        dedup_key = f"wh:{module}:{record_id}:{hashlib.sha1(payload_bytes).hexdigest()}"
+        if cache.add(dedup_key, '1', WEBHOOK_DEDUP_TTL):
+            return dedup_key
+        logger.info(f"Duplicate {module} webhook for {record_id} ignored")
+        return None
+    
     def process_contact_update(self, webhook_data: dict) -> dict:
         """
         Process contact update webhook notification with comprehensive data sync
@@ -80,8 +785,86 @@ class ZohoWebhookHandler:
             if not contact_id:
                 return {'status': 'error', 'message': 'No contact ID found'}
             
-            # Step 1: Always fetch latest data from Zoho API to ensure full sync
+            dedup_key = self.acquire_webhook_dedup_key('contact', contact_id, webhook_data)
+            if not dedup_key:
+                return {'status': 'success', 'contact_id': contact_id, 'message': 'duplicate ignored'}
+            
+            # Skip repeat deliveries whose relevant fields match the last processed payload
+            payload_hash = self.compute_payload_hash(contact_info)
+            stored_hash = Contact.objects.filter(id=contact_id).values_list('payload_hash', flat=True).first()
+            if stored_hash == payload_hash:
+                logger.info(f"Contact {contact_id} webhook payload unchanged - skipping processing")
+                return {
+                    'status': 'skipped',
+                    'contact_id': contact_id,
+                    'reason': 'unchanged',
+                    'message': f'Contact {contact_id} payload unchanged since last webhook'
+                }
+            
+            result = self._process_contact(contact_id, contact_info, payload_hash)
+            # Queued CV processing stores the hash itself once it succeeds
+            if result.get('status') == 'success' and not result.get('cv_processing_queued'):
+                Contact.objects.filter(id=contact_id).update(payload_hash=payload_hash)
+            else:
+                # Let a Zoho retry through when processing failed
+                cache.delete(dedup_key)
+            return result
+                
+        except Exception as e:
+            logger.error(f"Error processing contact update: {e}")
+            return {'status': 'error', 'message': str(e)}
+    
+    def compute_payload_hash(self, contact_info: dict) -> str:
+        """
+        Compute a stable digest of the contact webhook fields we act on
+        
+        Args:
+            contact_info: Extracted contact information
+            
+        Returns:
+            Hex digest string
+        """
+        canonical = json.dumps(
+            {field: contact_info.get(field) for field in CONTACT_PAYLOAD_HASH_FIELDS},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _process_contact(self, contact_id: str, contact_info: dict, payload_hash: str = None) -> dict:
+        """
+        Fetch the latest contact data and start CV processing for Ready to Pitch contacts
+        
+        Args:
+            contact_id: Zoho contact ID
+            contact_info: Contact information extracted from the webhook
+            payload_hash: Webhook payload hash to store once CV processing succeeds
+            
+        Returns:
+            Processing result dictionary
+        """
+        try:
+            # When the webhook already carries a stage other than "Ready to Pitch" no CV
+            # processing is needed, so save the webhook fields and skip the Zoho round trip
+            webhook_stage = (self._first(contact_info, self.STAGE_ALIASES) or '').strip()
+            if webhook_stage and webhook_stage != READY_TO_PITCH_STAGE:
+                logger.info(f"Step 5. *********Contact {contact_id} stage '{webhook_stage}' - updating from webhook data only *********")
+                if not self.update_local_contact(contact_info):
+                    return {
+                        'status': 'error',
+                        'contact_id': contact_id,
+                        'message': f'Failed to update contact {contact_id} from webhook data'
+                    }
+                return {
+                    'status': 'success',
+                    'contact_id': contact_id,
+                    'message': f'Contact data updated. Role stage "{webhook_stage}" - CV processing skipped'
+                }
+            
+            # Step 1: Fetch latest data from Zoho API to ensure full sync
             logger.info(f"Step 5. *********Fetching latest contact data from Zoho API for {contact_id}*********")
+            # The webhook means the record changed, so drop any cached copy first
+            cache.delete(get_zoho_record_cache_key('contact', contact_id))
             full_contact_data = self.fetch_contact_from_api(contact_id)
             
             if full_contact_data:
@@ -93,15 +876,12 @@ class ZohoWebhookHandler:
                 logger.warning(f"Could not fetch from API, using webhook data for contact {contact_id}")
             
             # Check if this is a "Ready to Pitch" contact for CV processing
-            role_success_stage = contact_info.get('Role_Success_Stage', '').strip()
-            if not role_success_stage:
-                # Try alternate field names from webhook
-                role_success_stage = contact_info.get('role_success_stage', '').strip()
+            role_success_stage = (self._first(contact_info, self.STAGE_ALIASES) or '').strip()
             
             logger.info(f"Step 14. *********Contact {contact_id} role_success_stage: '{role_success_stage}' *********")
             
             # If not "Ready to Pitch", just return success for data update
-            if role_success_stage != 'Ready to Pitch':
+            if role_success_stage != READY_TO_PITCH_STAGE:
                 return {
                     'status': 'success',
                     'contact_id': contact_id,
@@ -111,11 +891,12 @@ class ZohoWebhookHandler:
             logger.info(f"Step 15. *********Processing Ready to Pitch contact: {contact_id}*********")
             
             # Start asynchronous processing for CV download and skill extraction
-            self.start_async_processing(contact_id, contact_info)
+            self.start_async_processing(contact_id, contact_info, payload_hash)
             
             return {
                 'status': 'success',
                 'contact_id': contact_id,
+                'cv_processing_queued': True,
                 'message': f'Contact {contact_id} processing started (async)',
                 'note': 'CV download, skill extraction, and job matching will be processed in background'
             }
@@ -138,8 +919,13 @@ class ZohoWebhookHandler:
             account_id = webhook_data.get('id')
             account_name = webhook_data.get('name', 'Unknown')
             
+            dedup_key = self.acquire_webhook_dedup_key('account', account_id, webhook_data)
+            if not dedup_key:
+                return {'status': 'success', 'account_id': account_id, 'message': 'duplicate ignored'}
+            
             # Step 1: Fetch complete account data from Zoho API
             logger.info(f"Step 6. *********Fetching latest account data from Zoho API for {account_id} *********")
+            cache.delete(get_zoho_record_cache_key('account', account_id))
             full_account_data = self.fetch_account_from_api(account_id)
             
             if full_account_data:
@@ -151,29 +937,30 @@ class ZohoWebhookHandler:
                 logger.warning(f"Could not fetch from API, using webhook data for account {account_id}")
                 account_info = webhook_data
             
-            # Step 2: Update local account data with the most current information
+            # Step 2: Queue the deals sync so the webhook does not wait on the Zoho search
+            sync_account_deals_task.delay(account_id)
+            logger.info(f"Deals sync queued for account {account_id}")
+            
+            # Step 3: Update local account data
             logger.info(f"Step 7. *********Updating local account data for {account_id} *********")
             update_success = self.update_local_account(account_info)
             
-            # Step 3: Sync deals associated with this account
-            logger.info(f"Step 8. *********Syncing deals for account {account_id} *********")
-            deals_synced = self.sync_account_deals(account_id)
-            
             if update_success:
                 logger.info(f"Step 9. *********Successfully updated local account data for {account_id} *********")
                 return {
                     'status': 'success',
                     'account_id': account_id,
                     'account_name': account_name,
-                    'deals_synced': deals_synced,
-                    'message': f'Account {account_id} ({account_name}) data and {deals_synced} deals successfully updated'
+                    'deals_sync': 'queued',
+                    'message': f'Account {account_id} ({account_name}) data updated, deals sync queued'
                 }
             else:
+                cache.delete(dedup_key)
                 return {
                     'status': 'error',
                     'account_id': account_id,
-                    'deals_synced': deals_synced,
-                    'message': f'Failed to update local account data for {account_id}, but synced {deals_synced} deals'
+                    'deals_sync': 'queued',
+                    'message': f'Failed to update local account data for {account_id}, deals sync queued'
                 }
                 
         except Exception as e:
@@ -197,10 +984,15 @@ class ZohoWebhookHandler:
             if not intern_role_id:
                 return {'status': 'error', 'message': 'No intern role ID found in webhook data'}
             
+            dedup_key = self.acquire_webhook_dedup_key('intern_role', intern_role_id, webhook_data)
+            if not dedup_key:
+                return {'status': 'success', 'intern_role_id': intern_role_id, 'message': 'duplicate ignored'}
+            
             logger.info(f"Step 5. *********Processing intern role update for ID: {intern_role_id}, Name: {intern_role_name} *********")
             
             # Step 1: Fetch complete intern role data from Zoho API
             logger.info(f"Step 6. *********Fetching latest intern role data from Zoho API for {intern_role_id} *********")
+            cache.delete(get_zoho_record_cache_key('intern_role', intern_role_id))
             full_role_data = self.fetch_intern_role_from_api(intern_role_id)
             
             if full_role_data:
@@ -212,88 +1004,65 @@ class ZohoWebhookHandler:
                 logger.warning(f"Could not fetch from API, using webhook data for intern role {intern_role_id}")
                 role_info = webhook_data
             
-            # Step 2: Update local intern role data with the most current information
+            # Step 2: Queue the role deals sync so the webhook does not wait on it
+            sync_intern_role_deals_task.delay(intern_role_id)
+            logger.info(f"Role deals sync queued for intern role {intern_role_id}")
+            
+            # Step 3: Update local intern role data
             logger.info(f"Step 7. *********Updating local intern role data for {intern_role_id} *********")
             update_success = self.update_local_intern_role(role_info)
             
-            # Step 3: Sync role deals associated with this intern role
-            logger.info(f"Step 8. *********Syncing role deals for intern role {intern_role_id} *********")
-            deals_synced = self.sync_intern_role_deals(intern_role_id)
-            
             if update_success:
                 logger.info(f"Step 9. *********Successfully updated local intern role data for {intern_role_id} *********")
                 return {
                     'status': 'success',
                     'intern_role_id': intern_role_id,
                     'intern_role_name': intern_role_name,
-                    'deals_synced': deals_synced,
-                    'message': f'Intern role {intern_role_id} ({intern_role_name}) data and {deals_synced} deals successfully updated'
+                    'deals_sync': 'queued',
+                    'message': f'Intern role {intern_role_id} ({intern_role_name}) data updated, role deals sync queued'
                 }
             else:
+                cache.delete(dedup_key)
                 return {
                     'status': 'error',
                     'intern_role_id': intern_role_id,
-                    'deals_synced': deals_synced,
-                    'message': f'Failed to update local intern role data for {intern_role_id}, but synced {deals_synced} deals'
+                    'deals_sync': 'queued',
+                    'message': f'Failed to update local intern role data for {intern_role_id}, role deals sync queued'
                 }
                 
         except Exception as e:
             logger.error(f"Error processing intern role update: {e}")
             return {'status': 'error', 'message': str(e)}
     
-    def start_async_processing(self, contact_id: str, contact_info: dict):
-        """
-        Start asynchronous processing in a background thread to avoid blocking webhook
+    def start_async_processing(self, contact_id: str, contact_info: dict, payload_hash: str = None):
         """
-        def async_worker():
-            try:
-                logger.info(f"Starting async processing for contact {contact_id}")
-                
-                # Get contact name
-                contact_name = self.get_contact_full_name(contact_info)
-                
-                # Step 1: Download and manage CV files (includes duplicate cleanup)
-                logger.info(f"Step 15. *********Processing CVs for contact {contact_id} ('{contact_name}') *********")
-            
-                downloaded_files = self.process_cv_files(contact_id, contact_name)
-                
-                if not downloaded_files:
-                    logger.warning(f"No CV files downloaded for contact {contact_id}")
-                    return
-                
-                # Step 2: Extract skills from downloaded CVs
-                logger.info(f"Step 16. *********Extracting skills for contact {contact_id} ('{contact_name}') *********")
-                skills_extracted = self.extract_skills_from_cvs(contact_id, downloaded_files)
-                
-                # Step 3: Trigger job matching (in one hit as requested)
-                logger.info(f"Step 17. *********Matching jobs for contact {contact_id} ('{contact_name}') *********")
-                match_result = match_jobs_for_contact(contact_id)
-                
-                logger.info(f"=== ASYNC PROCESSING COMPLETED FOR CONTACT {contact_id} ===")
-                logger.info(f"  Contact Name: {contact_name}")
-                logger.info(f"  CVs Downloaded: {len(downloaded_files)}")
-                logger.info(f"  Skills Extracted: {skills_extracted}")
-                logger.info(f"  Job Matches Created: {match_result.get('matches_created', 0)}")
-                logger.info(f"  Total Job Matches: {match_result.get('total_matches', 0)}")
-                
-            except Exception as e:
-                logger.error(f"Error in async processing for contact {contact_id}: {e}")
-                # Log full stack trace for debugging
-                import traceback
-                logger.error(f"Full traceback: {traceback.format_exc()}")
+        Queue CV download, skill extraction and job matching as a Celery task to avoid blocking webhook
         
-        # Start background thread
-        thread = threading.Thread(target=async_worker, daemon=True)
-        thread.start()
-        logger.info(f"Background processing thread started for contact {contact_id}")
+        Args:
+            contact_id: Contact ID
+            contact_info: Contact data from Zoho (API or webhook)
+            payload_hash: Webhook payload hash the task stores once processing succeeds
+        """
+        # CV processing runs at most once per contact revision
+        modified_time = contact_info.get('Modified_Time')
+        if modified_time:
+            processing_key = f"wh:contact:{contact_id}:cv:{modified_time}"
+            if not cache.add(processing_key, '1', WEBHOOK_DEDUP_TTL):
+                logger.info(f"CV processing already started for contact {contact_id} at {modified_time} - skipping")
+                return
+        
+        # Queue on Celery so the work survives web worker restarts and is retried on Zoho errors
+        process_contact_async.delay(contact_id, contact_info, payload_hash)
+        logger.info(f"Background processing queued for contact {contact_id}")
     
-    def process_cv_files(self, contact_id: str, contact_name: str) -> List[str]:
+    def process_cv_files(self, contact_id: str, contact_name: str, raise_request_errors: bool = False) -> List[str]:
         """
         Download CV files, removing old ones and keeping only the latest
         
         Args:
             contact_id: Contact ID
             contact_name: Contact name for file organization
+            raise_request_errors: Re-raise Zoho request errors so a Celery task can retry them
             
         Returns:
             List of downloaded file paths
@@ -305,11 +1074,17 @@ class ZohoWebhookHandler:
             
             # Download new CVs
             logger.info(f"Downloading CVs for contact {contact_id}")
-            downloaded_files = self.attachment_manager.download_contact_cvs(contact_id, contact_name)
+            downloaded_files = self.attachment_manager.download_contact_cvs(
+                contact_id, contact_name, raise_request_errors=raise_request_errors
+            )
             
             logger.info(f"Downloaded {len(downloaded_files)} CV files for contact {contact_id}")
             return downloaded_files
             
+        except requests.RequestException:
+            if raise_request_errors:
+                raise
+            return []
         except Exception as e:
             logger.error(f"Error processing CV files for contact {contact_id}: {e}")
             return []
@@ -322,31 +1097,31 @@ class ZohoWebhookHandler:
             contact_id: Contact ID to cleanup
         """
         try:
-            # Get existing documents for this contact
-            existing_docs = Document.objects.filter(contact_id=contact_id)
-            
-            if existing_docs.exists():
-                logger.info(f"Found {existing_docs.count()} existing CV(s) for contact {contact_id}, cleaning up duplicates...")
-                
-                for doc in existing_docs:
-                    # Delete physical file if it exists
-                    if doc.file_path and os.path.exists(doc.file_path):
-                        try:
-                            os.remove(doc.file_path)
-                            logger.info(f"Deleted existing CV file: {doc.file_path}")
-                        except Exception as e:
-                            logger.warning(f"Could not delete file {doc.file_path}: {e}")
-                    
-                    # Delete associated skills for this document
-                    skills_deleted = Skill.objects.filter(contact_id=contact_id, document_id=doc.id).delete()
-                    if skills_deleted[0] > 0:
-                        logger.info(f"Deleted {skills_deleted[0]} associated skills for document {doc.id}")
-                
-                # Delete document records
-                docs_deleted = existing_docs.delete()
-                logger.info(f"Cleaned up {docs_deleted[0]} CV documents and associated skills for contact {contact_id}")
-            else:
+            # Get existing documents for this contact in one query; the materialized rows
+            # drive the existence check, the log count, the skill delete and the unlinks
+            doc_rows = list(Document.objects.filter(contact_id=contact_id).values_list('id', 'file_path'))
+            if not doc_rows:
                 logger.info(f"No existing CVs found for contact {contact_id}")
+                return
+            
+            logger.info(f"Found {len(doc_rows)} existing CV(s) for contact {contact_id}, cleaning up duplicates...")
+            
+            # Delete associated skills and document records with one DELETE each
+            with transaction.atomic():
+                skills_deleted = Skill.objects.filter(
+                    contact_id=contact_id, document_id__in=[doc_id for doc_id, _ in doc_rows]
+                ).delete()
+                docs_deleted = Document.objects.filter(
+                    contact_id=contact_id, id__in=[doc_id for doc_id, _ in doc_rows]
+                ).delete()
+            
+            # Delete physical files
+            file_paths = [file_path for _, file_path in doc_rows if file_path]
+            if file_paths:
+                with ThreadPoolExecutor(max_workers=min(4, len(file_paths))) as executor:
+                    list(executor.map(_safe_unlink, file_paths))
+            
+            logger.info(f"Cleaned up {docs_deleted[0]} CV documents and {skills_deleted[0]} associated skills for contact {contact_id}")
             
         except Exception as e:
             logger.error(f"Error cleaning up existing CVs for contact {contact_id}: {e}")
@@ -361,25 +1136,25 @@ class ZohoWebhookHandler:
         Returns:
             Contact data dictionary or None if failed
         """
+        cache_key = get_zoho_record_cache_key('contact', contact_id)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            import requests
-            from zoho.auth import get_access_token
-            
             url = f"https://www.zohoapis.com/crm/v2/Contacts/{contact_id}"
-            headers = {
-                "Authorization": f"Zoho-oauthtoken {get_access_token()}",
-                "Content-Type": "application/json"
-            }
+            headers = self.get_auth_headers()
             
-            response = requests.get(url, headers=headers, timeout=120)
+            response = self.zoho_get(url, headers)
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             contacts = data.get('data', [])
             
             if contacts and len(contacts) > 0:
                 contact_data = contacts[0]
                 logger.info(f"Successfully fetched contact {contact_id} from API")
+                cache.set(cache_key, contact_data, ZOHO_FETCH_CACHE_TTL)
                 return contact_data
             else:
                 logger.warning(f"No contact data found for {contact_id}")
@@ -416,38 +1191,47 @@ class ZohoWebhookHandler:
                 logger.warning(f"Skill extractor not available for contact {contact_id}")
                 return 0
             
-            # Process each downloaded file
-            for file_path in downloaded_files:
-                try:
-                    logger.info(f"Extracting skills from {file_path}")
-                    
-                    # Get corresponding document record
-                    doc = Document.objects.get(contact_id=contact_id, file_path=file_path)
-                    
-                    # Extract text from PDF
-                    cv_text = skill_extractor.extract_text_from_pdf(file_path)
-                    if not cv_text.strip():
-                        logger.warning(f"No text extracted from {file_path}")
-                        continue
-                    
-                    # Extract skills using OpenAI
-                    skills = skill_extractor.extract_skills_with_openai(cv_text)
-                    if not skills:
-                        logger.warning(f"No skills extracted from {file_path}")
-                        continue
-                    
-                    # Save skills to database
-                    skill_ids = skill_extractor.save_skills_to_database(skills, contact_id, doc.id)
-                    total_skills += len(skill_ids)
-                    
-                    logger.info(f"Extracted and saved {len(skill_ids)} skills from {file_path}")
-                    
-                except Document.DoesNotExist:
-                    logger.error(f"Document record not found for file {file_path}")
+            if not downloaded_files:
+                return 0
+            
+            # Extract text from all PDFs concurrently
+            with ThreadPoolExecutor(max_workers=min(8, len(downloaded_files))) as executor:
+                extracted = dict(zip(downloaded_files, executor.map(skill_extractor.extract_text_from_pdf, downloaded_files)))
+            
+            texts = {}
+            for file_path, cv_text in extracted.items():
+                if not cv_text.strip():
+                    logger.warning(f"No text extracted from {file_path}")
                     continue
-                except Exception as e:
-                    logger.error(f"Error extracting skills from {file_path}: {e}")
+                texts[file_path] = cv_text
+            
+            # Extract skills for all CVs with a single OpenAI call
+            skills_by_file = skill_extractor.extract_skills_batch(texts) if texts else {}
+            
+            # Fetch all corresponding document records in one query
+            doc_map = {
+                doc.file_path: doc
+                for doc in Document.objects.filter(
+                    contact_id=contact_id, file_path__in=downloaded_files
+                ).only('id', 'file_path')
+            }
+            
+            # Collect skills for every document, then save them with one bulk insert
+            entries = []
+            for file_path, skills in skills_by_file.items():
+                if not skills:
+                    logger.warning(f"No skills extracted from {file_path}")
                     continue
+                
+                doc = doc_map.get(file_path)
+                if doc is None:
+                    logger.error(f"Document record not found for file {file_path}")
+                    continue
+                
+                entries.append((skills, contact_id, doc.id))
+                logger.info(f"Extracted {len(skills)} skills from {file_path}")
+            
+            total_skills = skill_extractor.save_skills_batch(entries)
             
             logger.info(f"Total skills extracted for contact {contact_id}: {total_skills}")
             return total_skills
@@ -512,130 +1296,88 @@ class ZohoWebhookHandler:
         Returns:
             Full name string
         """
-        # Handle both JSON and form-encoded formats
-        first_name = (contact_data.get('First_Name') or 
-                     contact_data.get('first_name') or 
-                     contact_data.get('firstName') or '')
-        last_name = (contact_data.get('Last_Name') or 
-                    contact_data.get('last_name') or 
-                    contact_data.get('lastName') or '')
+        first_aliases, last_aliases, full_aliases = self.NAME_ALIASES
         
         # Try Full_Name field if available
-        full_name = (contact_data.get('Full_Name') or 
-                    contact_data.get('name') or 
-                    contact_data.get('fullName'))
+        full_name = self._first(contact_data, full_aliases)
         if full_name:
             return str(full_name)
         
-        # Construct from first and last name
-        name_parts = [name for name in [first_name, last_name] if name]
+        # Construct from first and last name (handles both JSON and form-encoded formats)
+        name_parts = [name for name in (self._first(contact_data, first_aliases), self._first(contact_data, last_aliases)) if name]
         return ' '.join(name_parts) if name_parts else 'Unknown'
     
-    def update_local_contact(self, contact_info: dict) -> bool:
+    def update_local_contact(self, contact_info: dict, now=None) -> bool:
         """
         Update contact in local database
         
         Args:
             contact_info: Contact information dictionary
+            now: Timestamp to record as the update time (batch callers pass one shared value)
             
         Returns:
             True if update was successful
         """
         try:
+            if now is None:
+                now = timezone.now()
+            
             # For webhook processing, we'll update the contact record directly
             # without triggering a full sync to avoid API rate limits
             contact_id = contact_info.get('id')
+            if not contact_id:
+                logger.warning("No contact ID provided for local update")
+                return False
             
-            if contact_id:
-                from zoho_app.models import Contact
-                
-                # Try to find and update existing contact
+            full_name = contact_info.get('Full_Name')
+            if not full_name and contact_info.get('First_Name') and contact_info.get('Last_Name'):
+                full_name = f"{contact_info['First_Name']} {contact_info['Last_Name']}"
+            
+            account = contact_info.get('Account_Name')
+            company = contact_info.get('Company') or (account.get('name') if isinstance(account, dict) else account)
+            
+            field_values = {
+                'full_name': full_name,
+                'email': contact_info.get('Email'),
+                'role_success_stage': self._first(contact_info, self.STAGE_ALIASES),
+                'phone': contact_info.get('Phone'),
+                'account_name': company,
+                'title': contact_info.get('Title'),
+                'department': contact_info.get('Department'),
+            }
+            
+            # Existing contacts only get the fields provided in webhook/API data
+            defaults = {field: value for field, value in field_values.items() if value}
+            defaults['updated_time'] = now
+            
+            create_defaults = {field: value or '' for field, value in field_values.items()}
+            create_defaults.update(
+                placement_automation=contact_info.get('Placement_Automation') or contact_info.get('placement_automation'),
+                created_time=now,
+                updated_time=now
+            )
+            
+            logger.info("Step 7. *********Upserting local contact %s *********", contact_id)
+            # One UPDATE for existing contacts; INSERT only when it matched no row
+            created = not Contact.objects.filter(id=contact_id).update(**defaults)
+            if created:
                 try:
-                    contact = Contact.objects.get(id=contact_id)
-
-                    logger.info(f"Step 7. ********* Updating existing contact {contact_id} *********")
-                    
-                    # Update fields if provided in webhook/API data
-                    if contact_info.get('Full_Name'):
-                        contact.full_name = contact_info['Full_Name']
-                    if contact_info.get('First_Name') and contact_info.get('Last_Name'):
-                        contact.full_name = f"{contact_info['First_Name']} {contact_info['Last_Name']}"
-                    if contact_info.get('Email'):
-                        contact.email = contact_info['Email']
-                    if contact_info.get('Role_Success_Stage'):
-                        contact.role_success_stage = contact_info['Role_Success_Stage']
-                    elif contact_info.get('role_success_stage'):
-                        contact.role_success_stage = contact_info['role_success_stage']
-                    if contact_info.get('Phone'):
-                        contact.phone = contact_info['Phone']
-                    if contact_info.get('Mobile'):
-                        contact.mobile = contact_info['Mobile']
-                    if contact_info.get('Company') or contact_info.get('Account_Name'):
-                        company = contact_info.get('Company') or contact_info.get('Account_Name', {}).get('name') if isinstance(contact_info.get('Account_Name'), dict) else contact_info.get('Account_Name')
-                        if company:
-                            contact.company = company
-                    if contact_info.get('Title'):
-                        contact.title = contact_info['Title']
-                    if contact_info.get('Department'):
-                        contact.department = contact_info['Department']
-                    if contact_info.get('Lead_Source'):
-                        contact.lead_source = contact_info['Lead_Source']
-                    if contact_info.get('Mailing_Street'):
-                        contact.mailing_address = f"{contact_info.get('Mailing_Street', '')} {contact_info.get('Mailing_City', '')} {contact_info.get('Mailing_State', '')}"
-                    
-                    # Update timestamp
-                    contact.updated_time = timezone.now()
-                    contact.save()
-                    logger.info(f"Step 8. *********Successfully updated local contact {contact_id} *********")
-                    
-                except Contact.DoesNotExist:
-                
-                    logger.info(f"Step 7. *********Contact {contact_id} not found locally - creating new record *********")
-                    
-                    # Prepare contact data for creation
-                    full_name = contact_info.get('Full_Name')
-                    if not full_name and contact_info.get('First_Name') and contact_info.get('Last_Name'):
-                        full_name = f"{contact_info['First_Name']} {contact_info['Last_Name']}"
-                    
-                    company = contact_info.get('Company')
-                    if not company and contact_info.get('Account_Name'):
-                        if isinstance(contact_info['Account_Name'], dict):
-                            company = contact_info['Account_Name'].get('name')
-                        else:
-                            company = contact_info['Account_Name']
-                    
-                    role_success_stage = contact_info.get('Role_Success_Stage') or contact_info.get('role_success_stage', '')
-                    
-                    mailing_address = ""
-                    if contact_info.get('Mailing_Street'):
-                        mailing_address = f"{contact_info.get('Mailing_Street', '')} {contact_info.get('Mailing_City', '')} {contact_info.get('Mailing_State', '')}"
-                    
-                    # Create new contact record
-                    contact = Contact.objects.create(
-                        id=contact_id,
-                        full_name=full_name or '',
-                        email=contact_info.get('Email', ''),
-                        placement_automation=contact_info.get('Placement_Automation') or contact_info.get('placement_automation'),
-                        role_success_stage=role_success_stage,
-                        phone=contact_info.get('Phone', ''),
-                        mobile=contact_info.get('Mobile', ''),
-                        company=company or '',
-                        title=contact_info.get('Title', ''),
-                        department=contact_info.get('Department', ''),
-                        lead_source=contact_info.get('Lead_Source', ''),
-                        mailing_address=mailing_address,
-                        created_time=timezone.now(),
-                        updated_time=timezone.now()
-                    )
-                    logger.info(f"Step 8. *********Successfully created new local contact {contact_id} *********")
-
-                return True
+                    # Savepoint so a concurrent insert of the same contact does not break the caller's transaction
+                    with transaction.atomic():
+                        Contact.objects.create(id=contact_id, **create_defaults)
+                except IntegrityError:
+                    # Another webhook created the row between our UPDATE and INSERT; apply ours on top
+                    Contact.objects.filter(id=contact_id).update(**defaults)
+                    created = False
+            
+            if created:
+                logger.info("Step 8. *********Successfully created new local contact %s *********", contact_id)
             else:
-                logger.warning("No contact ID provided for local update")
-                return False
+                logger.info("Step 8. *********Successfully updated local contact %s *********", contact_id)
+            return True
                 
         except Exception as e:
-            logger.error(f"Error updating local contact: {e}")
+            logger.error("Error updating local contact: %s", e)
             return False
     
     def sync_related_account(self, account_id: str) -> bool:
@@ -649,22 +1391,22 @@ class ZohoWebhookHandler:
             True if sync was successful
         """
         try:
-            logger.info(f"Step 10. *********Syncing account data for account {account_id} *********")
+            logger.info("Step 10. *********Syncing account data for account %s *********", account_id)
             
             # Fetch account data from Zoho API
             account_data = self.fetch_account_from_api(account_id)
             if not account_data:
-                logger.warning(f"Could not fetch account {account_id} from API")
+                logger.warning("Could not fetch account %s from API", account_id)
                 return False
             
             # Update local account data
             self.update_local_account(account_data)
-            logger.info(f"Step 11. *********Successfully synced account and update local data {account_id} *********")
+            logger.info("Step 11. *********Successfully synced account and update local data %s *********", account_id)
             
             return True
             
         except Exception as e:
-            logger.error(f"Error syncing account {account_id}: {e}")
+            logger.error("Error syncing account %s: %s", account_id, e)
             return False
     
     def fetch_account_from_api(self, account_id: str) -> Optional[dict]:
@@ -677,25 +1419,25 @@ class ZohoWebhookHandler:
         Returns:
             Account data dictionary or None if failed
         """
+        cache_key = get_zoho_record_cache_key('account', account_id)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            import requests
-            from zoho.auth import get_access_token
-            
             url = f"https://www.zohoapis.com/crm/v2/Accounts/{account_id}"
-            headers = {
-                "Authorization": f"Zoho-oauthtoken {get_access_token()}",
-                "Content-Type": "application/json"
-            }
+            headers = self.get_auth_headers()
 
-            response = requests.get(url, headers=headers, timeout=120)
+            response = self.zoho_get(url, headers)
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             accounts = data.get('data', [])
             
             if accounts and len(accounts) > 0:
                 account_data = accounts[0]
                 logger.info(f"Successfully fetched account {account_id} from API")
+                cache.set(cache_key, account_data, ZOHO_FETCH_CACHE_TTL)
                 return account_data
             else:
                 logger.warning(f"No account data found for {account_id}")
@@ -723,155 +1465,47 @@ class ZohoWebhookHandler:
             True if update was successful
         """
         try:
-            from zoho_app.models import Account
-            from django.utils.dateparse import parse_datetime
-            
             account_id = account_info.get('id')
             if not account_id:
                 logger.warning("No account ID provided for local update")
                 return False
             
-            # Helper function to parse date fields
-            def parse_date_field(date_str):
-                if date_str:
-                    try:
-                        return parse_datetime(date_str)
-                    except:
-                        return None
-                return None
-            
-            # Helper function to safely get boolean values
-            def get_bool_value(value):
-                if isinstance(value, bool):
-                    return value
-                if isinstance(value, str):
-                    return value.lower() in ['true', '1', 'yes']
-                return False
+            owner = _zoho_lookup(account_info.get('Owner'))
             
-            # Prepare account data with comprehensive field mapping
+            # Fields that need more than a plain lookup; the rest come from ACCOUNT_FIELD_MAP
             account_data = {
                 'id': account_id,
                 'name': account_info.get('Account_Name') or account_info.get('name'),
-                'industry': account_info.get('Industry'),
-                'billing_address': account_info.get('Billing_Street'),
-                'shipping_address': account_info.get('Shipping_Street'),
-                
-                # Owner information
-                'owner_id': account_info.get('Owner', {}).get('id') if isinstance(account_info.get('Owner'), dict) else account_info.get('Owner'),
-                'owner_name': account_info.get('Owner', {}).get('name') if isinstance(account_info.get('Owner'), dict) else None,
-                'owner_email': account_info.get('Owner', {}).get('email') if isinstance(account_info.get('Owner'), dict) else None,
-                
-                # Date fields
-                'cleanup_start_date': parse_date_field(account_info.get('Cleanup_Start_Date')),
-                'last_activity_time': parse_date_field(account_info.get('Last_Activity_Time')),
-                'last_full_due_diligence_date': parse_date_field(account_info.get('Last_Full_Due_Diligence_Date')),
-                'follow_up_date': parse_date_field(account_info.get('Follow_up_Date')),
-                'next_reply_date': parse_date_field(account_info.get('Next_Reply_Date')),
-                
-                # Text fields
-                'field_states': account_info.get('$field_states'),
-                'management_status': account_info.get('Management_Status'),
-                'company_work_policy': account_info.get('Company_Work_Policy'),
-                'company_industry': account_info.get('Company_Industry'),
-                'company_description': account_info.get('Company_Description'),
-                'approval_status': account_info.get('Approval_Status'),
-                'street': account_info.get('Street'),
-                'classic_partnership': account_info.get('Classic_Partnership'),
-                'state_region': account_info.get('State_Region'),
-                'cleanup_status': account_info.get('Cleanup_Status'),
-                'uni_region': account_info.get('Uni_Region'),
-                'approval': account_info.get('Approval'),
-                'uni_outreach_status': account_info.get('Uni_Outreach_Status'),
-                'enrich_status': account_info.get('Enrich_Status'),
-                'roles_available': account_info.get('Roles_Available'),
-                'roles': account_info.get('Roles'),
-                'city': account_info.get('City'),
-                'postcode': account_info.get('Postcode'),
-                'outreach_notes': account_info.get('Outreach_Notes'),
-                'company_industry_other': account_info.get('Company_Industry_Other'),
-                'no_employees': account_info.get('No_Employees'),
-                'industry_areas': account_info.get('Industry_Areas'),
-                'placement_revision_required': account_info.get('Placement_Revision_Required'),
-                'country': account_info.get('Country'),
-                'uni_state_if_in_us': account_info.get('Uni_State_if_in_US'),
-                'review_process': account_info.get('Review_Process'),
-                'layout_id': account_info.get('$layout_id'),
-                'layout_display_label': account_info.get('$layout_display_label'),
-                'layout_name': account_info.get('$layout_name'),
-                'review': account_info.get('Review'),
-                'cleanup_notes': account_info.get('Cleanup_Notes'),
-                'account_notes': account_info.get('Account_Notes'),
-                'standard_working_hours': account_info.get('Standard_Working_Hours'),
-                'due_diligence_fields_to_revise': account_info.get('Due_Diligence_Fields_to_Revise'),
-                'uni_country': account_info.get('Uni_Country'),
-                'cleanup_phase': account_info.get('Cleanup_Phase'),
-                'record_status': account_info.get('Record_Status'),
-                'type': account_info.get('Type'),
-                'uni_timezone': account_info.get('Uni_Timezone'),
-                'company_address': account_info.get('Company_Address'),
-                'tag': account_info.get('Tag'),
-                'approval_state': account_info.get('$approval_state'),
-                'location': account_info.get('Location'),
-                'location_other': account_info.get('Location_Other'),
-                'account_status': account_info.get('Account_Status'),
-                
-                # Boolean fields
-                'process_flow': get_bool_value(account_info.get('$process_flow')),
-                'locked_for_me': get_bool_value(account_info.get('$locked_for_me')),
-                'is_duplicate': get_bool_value(account_info.get('$is_duplicate')),
-                'in_merge': get_bool_value(account_info.get('$in_merge')),
-                'upon_to_remote_interns': get_bool_value(account_info.get('Upon_to_Remote_Interns')),
-                'locked': get_bool_value(account_info.get('$locked')),
-                'is_dnc': get_bool_value(account_info.get('$is_dnc')),
-                'pathfinder': get_bool_value(account_info.get('Pathfinder')),
-                'gold_rating': get_bool_value(account_info.get('Gold_Rating')),
+                'owner_id': owner.get('id'),
+                'owner_name': owner.get('name'),
+                'owner_email': owner.get('email'),
             }
+            account_data.update(map_zoho_fields(account_info, ACCOUNT_FIELD_MAP))
             
-            # Try to find and update existing account
-            try:
-                account = Account.objects.get(id=account_id)
-                logger.info(f"Updating existing account {account_id}")
-                
-                # Update all fields
-                for field_name, field_value in account_data.items():
-                    if field_name != 'id' and field_value is not None:
-                        setattr(account, field_name, field_value)
-                
-                account.save()
-                logger.info(f"Successfully updated local account {account_id}")
-                
-            except Account.DoesNotExist:
-                logger.info(f"Account {account_id} not found locally - creating new record")
-                
-                # Create new account record
-                account = Account.objects.create(**account_data)
-                logger.info(f"Created new local account {account_id}")
+            # Single UPDATE for an existing account, INSERT only when it is new
+            save_local_record(Account, account_data, 'account')
             
             return True
             
         except Exception as e:
-            logger.error(f"Error updating local account: {e}")
-            import traceback
-            logger.error(f"Full traceback: {traceback.format_exc()}")
+            logger.exception("Error updating local account: %s", e)
             return False
     
     def sync_intern_roles_incremental(self) -> bool:
         """
-        Trigger incremental sync for intern roles to keep job data fresh
+        Queue an incremental sync for intern roles to keep job data fresh
         
         Returns:
-            True if sync was successful
+            True if the sync was queued
         """
         try:
-            logger.info("Starting incremental sync for intern roles")
-            
-            # Use the existing ETL pipeline for incremental sync
-            sync_intern_roles(incremental=True)
-            logger.info(f"Step 13. *********Incremental sync for intern roles completed *********")
+            # The ETL sync takes seconds; run it on Celery instead of the request thread
+            sync_intern_roles_task.delay()
+            logger.info("Incremental sync for intern roles queued")
             return True
             
         except Exception as e:
-            logger.error(f"Error in incremental sync for intern roles: {e}")
+            logger.error("Error queueing incremental sync for intern roles: %s", e)
             return False
     
     def sync_account_deals(self, account_id: str) -> int:
@@ -885,29 +1519,45 @@ class ZohoWebhookHandler:
             Number of deals synced
         """
         try:
-            logger.info(f"Fetching deals for account {account_id}")
+            logger.info("Fetching deals for account %s", account_id)
             
             # Fetch deals for this account from Zoho API
             deals_data = self.fetch_account_deals_from_api(account_id)
             
             if not deals_data:
-                logger.info(f"No deals found for account {account_id}")
+                logger.info("No deals found for account %s", account_id)
                 return 0
             
-            deals_synced = 0
-            for deal_data in deals_data:
-                try:
-                    if self.update_local_deal(deal_data):
-                        deals_synced += 1
-                except Exception as e:
-                    logger.error(f"Error updating deal {deal_data.get('id', 'unknown')}: {e}")
-                    continue
-            
-            logger.info(f"Successfully synced {deals_synced} deals for account {account_id}")
+            # Upsert all deals in one statement (flush_sync_batch falls back to per-row writes)
+            now = timezone.now()
+            batch = {}
+            for deal_info in deals_data:
+                deal_data = self.map_deal_fields(deal_info)
+                if deal_data:
+                    deal_data['updated_at'] = now
+                    batch[deal_data['id']] = deal_data
+            
+            # Same Modified_Time guard as save_local_record: leave deals that are already current
+            stored = dict(
+                Deal.objects.filter(id__in=list(batch), modified_time__isnull=False).values_list('id', 'modified_time')
+            )
+            current = [
+                deal_id for deal_id, deal_data in batch.items()
+                if deal_id in stored and deal_data.get('modified_time') is not None
+                and stored[deal_id] >= deal_data['modified_time']
+            ]
+            for deal_id in current:
+                del batch[deal_id]
+            if current:
+                logger.info("Skipping %s deals for account %s already at their Modified_Time", len(current), account_id)
+            
+            deals_synced = flush_sync_batch(Deal, batch, 'deal')
+            
+            logger.info("Successfully synced %s deals for account %s", deals_synced, account_id)
             return deals_synced
             
         except Exception as e:
-            logger.error(f"Error syncing deals for account {account_id}: {e}")
+            logger.error("Error syncing deals for account %s: %s", account_id, e)
             return 0
     
     def fetch_account_deals_from_api(self, account_id: str) -> List[dict]:
@@ -921,14 +1571,9 @@ class ZohoWebhookHandler:
             List of deal data dictionaries
         """
         try:
-            from zoho.auth import get_access_token
-            
             # Use the search API to find deals by account ID
             url = "https://www.zohoapis.com/crm/v2/Deals/search"
-            headers = {
-                "Authorization": f"Zoho-oauthtoken {get_access_token()}",
-                "Content-Type": "application/json"
-            }
+            headers = self.get_auth_headers()
             
             # Search for deals with the specific account ID
             params = {
@@ -936,10 +1581,10 @@ class ZohoWebhookHandler:
                 "per_page": 200  # Maximum allowed per page
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=120)
+            response = self.zoho_get(url, headers, params=params)
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             deals = data.get('data', [])
             
             logger.info(f"Found {len(deals)} deals for account {account_id}")
@@ -956,73 +1601,31 @@ class ZohoWebhookHandler:
             logger.error(f"Error fetching deals for account {account_id}: {e}")
             return []
     
-    def update_local_deal(self, deal_info: dict) -> bool:
+    def map_deal_fields(self, deal_info: dict) -> Optional[dict]:
         """
-        Update deal in local database with comprehensive field mapping
+        Map a Zoho deal record to local Deal field values
         
         Args:
             deal_info: Deal information dictionary from Zoho API
             
         Returns:
-            True if update was successful
+            Deal field dictionary, or None if the record has no ID
         """
-        try:
-            from zoho_app.models import Deal
-            from django.utils.dateparse import parse_datetime
-            
-            deal_id = deal_info.get('id')
-            if not deal_id:
-                logger.warning("No deal ID provided for local update")
-                return False
-            
-            # Helper function to parse date fields
-            def parse_date_field(date_str):
-                if date_str:
-                    try:
-                        return parse_datetime(date_str)
-                    except:
-                        return None
-                return None
-            
-            # Prepare deal data with comprehensive field mapping
-            deal_data = {
-                'id': deal_id,
-                'deal_name': deal_info.get('Deal_Name'),
-                'description': deal_info.get('Description'),
-                'account_id': deal_info.get('Account_Name', {}).get('id') if isinstance(deal_info.get('Account_Name'), dict) else deal_info.get('Account_Name'),
-                'account_name': deal_info.get('Account_Name', {}).get('name') if isinstance(deal_info.get('Account_Name'), dict) else None,
-                'stage': deal_info.get('Stage'),
-                'start_date': parse_date_field(deal_info.get('Start_Date')),
-                'end_date': parse_date_field(deal_info.get('End_Date')),
-                'created_time': parse_date_field(deal_info.get('Created_Time')),
-                'modified_time': parse_date_field(deal_info.get('Modified_Time')),
-            }
-            
-            # Try to find and update existing deal
-            try:
-                deal = Deal.objects.get(id=deal_id)
-                logger.info(f"Updating existing deal {deal_id}")
-                
-                # Update all fields
-                for field_name, field_value in deal_data.items():
-                    if field_name != 'id' and field_value is not None:
-                        setattr(deal, field_name, field_value)
-                
-                deal.save()
-                logger.info(f"Successfully updated local deal {deal_id}")
-                
-            except Deal.DoesNotExist:
-                logger.info(f"Deal {deal_id} not found locally - creating new record")
-                
-                # Create new deal record
-                deal = Deal.objects.create(**deal_data)
-                logger.info(f"Created new local deal {deal_id}")
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error updating local deal: {e}")
-            return False
+        
+        deal_id = deal_info.get('id')
+        if not deal_id:
+            return None
+        
+        account = _zoho_lookup(deal_info.get('Account_Name'))
+        
+        # Fields that need more than a plain lookup; the rest come from DEAL_FIELD_MAP
+        deal_data = {
+            'id': deal_id,
+            'account_id': account.get('id'),
+            'account_name': account.get('name'),
+        }
+        deal_data.update(map_zoho_fields(deal_info, DEAL_FIELD_MAP))
+        return deal_data
     
     def fetch_intern_role_from_api(self, intern_role_id: str) -> Optional[dict]:
         """
@@ -1034,24 +1637,25 @@ class ZohoWebhookHandler:
         Returns:
             Intern role data dictionary or None if failed
         """
+        cache_key = get_zoho_record_cache_key('intern_role', intern_role_id)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            from zoho.auth import get_access_token
-            
             url = f"https://www.zohoapis.com/crm/v2/Intern_Roles/{intern_role_id}"
-            headers = {
-                "Authorization": f"Zoho-oauthtoken {get_access_token()}",
-                "Content-Type": "application/json"
-            }
+            headers = self.get_auth_headers()
 
-            response = requests.get(url, headers=headers, timeout=120)
+            response = self.zoho_get(url, headers)
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             roles = data.get('data', [])
             
             if roles and len(roles) > 0:
                 role_data = roles[0]
                 logger.info(f"Successfully fetched intern role {intern_role_id} from API")
+                cache.set(cache_key, role_data, ZOHO_FETCH_CACHE_TTL)
                 return role_data
             else:
                 logger.warning(f"No intern role data found for {intern_role_id}")
@@ -1079,93 +1683,28 @@ class ZohoWebhookHandler:
             True if update was successful
         """
         try:
-            from zoho_app.models import InternRole
-            from django.utils.dateparse import parse_datetime
-            
             role_id = role_info.get('id')
             if not role_id:
                 logger.warning("No intern role ID provided for local update")
                 return False
             
-            # Helper function to parse date fields
-            def parse_date_field(date_str):
-                if date_str:
-                    try:
-                        return parse_datetime(date_str)
-                    except:
-                        return None
-                return None
-            
-            # Helper function to safely get boolean values
-            def get_bool_value(value):
-                if isinstance(value, bool):
-                    return value
-                if isinstance(value, str):
-                    return value.lower() in ['true', '1', 'yes']
-                return False
+            intern_company = _zoho_lookup(role_info.get('Intern_Company'))
             
-            # Prepare intern role data with comprehensive field mapping
+            # Fields that need more than a plain lookup; the rest come from INTERN_ROLE_FIELD_MAP
             role_data = {
                 'id': role_id,
-                'name': role_info.get('Name'),
-                'role_title': role_info.get('Role_Title'),
-                'role_description_requirements': role_info.get('Role_Description_Requirements'),
-                'role_status': role_info.get('Role_Status'),
-                'role_function': role_info.get('Role_Function'),
-                'role_department_size': role_info.get('Role_Department_Size'),
-                'role_attachments_jd': role_info.get('Role_Attachments_JD'),
-                'role_tags': role_info.get('Role_Tags'),
-                'start_date': parse_date_field(role_info.get('Start_Date')),
-                'end_date': parse_date_field(role_info.get('End_Date')),
-                'created_time': parse_date_field(role_info.get('Created_Time')),
-                
-                # Company information
-                'intern_company_id': role_info.get('Intern_Company', {}).get('id') if isinstance(role_info.get('Intern_Company'), dict) else role_info.get('Intern_Company'),
-                'intern_company_name': role_info.get('Intern_Company', {}).get('name') if isinstance(role_info.get('Intern_Company'), dict) else None,
-                
-                # Work and location fields
-                'company_work_policy': role_info.get('Company_Work_Policy'),
-                'location': role_info.get('Location'),
-                'open_to_remote': role_info.get('Open_to_Remote'),
-                'due_diligence_status_2': role_info.get('Due_Diligence_Status_2'),
-                'account_outreach_status': role_info.get('Account_Outreach_Status'),
-                'record_status': role_info.get('Record_Status'),
-                'approval_state': role_info.get('$approval_state'),
-                'management_status': role_info.get('Management_Status'),
-                'placement_fields_to_revise': role_info.get('Placement_Fields_to_Revise'),
-                'placement_revision_notes': role_info.get('Placement_Revision_Notes'),
-                
-                # Boolean fields
-                'gold_rating': get_bool_value(role_info.get('Gold_Rating')),
-                'locked': get_bool_value(role_info.get('$locked')),
+                'intern_company_id': intern_company.get('id'),
+                'intern_company_name': intern_company.get('name'),
             }
+            role_data.update(map_zoho_fields(role_info, INTERN_ROLE_FIELD_MAP))
             
-            # Try to find and update existing intern role
-            try:
-                role = InternRole.objects.get(id=role_id)
-                logger.info(f"Updating existing intern role {role_id}")
-                
-                # Update all fields
-                for field_name, field_value in role_data.items():
-                    if field_name != 'id' and field_value is not None:
-                        setattr(role, field_name, field_value)
-                
-                role.save()
-                logger.info(f"Successfully updated local intern role {role_id}")
-                
-            except InternRole.DoesNotExist:
-                logger.info(f"Intern role {role_id} not found locally - creating new record")
-                
-                # Create new intern role record
-                role = InternRole.objects.create(**role_data)
-                logger.info(f"Created new local intern role {role_id}")
+            # Single UPDATE for an existing intern role, INSERT only when it is new
+            save_local_record(InternRole, role_data, 'intern role')
             
             return True
             
         except Exception as e:
-            logger.error(f"Error updating local intern role: {e}")
-            import traceback
-            logger.error(f"Full traceback: {traceback.format_exc()}")
+            logger.exception("Error updating local intern role: %s", e)
             return False
     
     def sync_intern_role_deals(self, intern_role_id: str) -> int:
@@ -1179,21 +1718,76 @@ class ZohoWebhookHandler:
             Number of deals synced
         """
         try:
-            from etl.job_matcher import JobMatcher
-            
             # Create job matcher instance
             job_matcher = JobMatcher()
             
             # Use the existing sync_role_deals method
             deals_count = job_matcher.sync_role_deals(intern_role_id)
             
-            logger.info(f"Successfully synced {deals_count} deals for intern role {intern_role_id}")
+            logger.info("Successfully synced %s deals for intern role %s", deals_count, intern_role_id)
             return deals_count
             
         except Exception as e:
-            logger.error(f"Error syncing deals for intern role {intern_role_id}: {e}")
+            logger.error("Error syncing deals for intern role %s: %s", intern_role_id, e)
             return 0
     
+    def fetch_records_concurrently(self, fetch_func, record_ids: List[str]) -> Dict[str, Optional[dict]]:
+        """
+        Fetch several records from Zoho in parallel over the shared session
+        
+        Args:
+            fetch_func: Single-record fetcher, e.g. self.fetch_contact_from_api
+            record_ids: Record IDs to fetch
+            
+        Returns:
+            Dictionary mapping each record ID to its data (None if the fetch failed)
+        """
+        if not record_ids:
+            return {}
+        
+        # Lookups are I/O bound; zoho_api_limiter still caps the calls in flight
+        with ThreadPoolExecutor(max_workers=min(ZOHO_FETCH_CONCURRENCY, len(record_ids))) as executor:
+            return dict(zip(record_ids, executor.map(fetch_func, record_ids)))
+    
+    def fetch_records_bulk(self, module: str, record_type: str, record_ids: List[str], fetch_func) -> Dict[str, Optional[dict]]:
+        """
+        Fetch several records from Zoho with one request per 100 IDs
+        
+        Records already in the cache are not requested again. The rest go through
+        ZohoClient.get_records_by_ids; only IDs whose chunk request failed are retried
+        one by one with fetch_func, IDs Zoho reports as missing map to None.
+        
+        Args:
+            module: Zoho module name, e.g. 'Accounts'
+            record_type: Cache key record type, e.g. 'account'
+            record_ids: Record IDs to fetch
+            fetch_func: Single-record fetcher used as a fallback
+            
+        Returns:
+            Dictionary mapping each record ID to its data (None if the fetch failed)
+        """
+        if not record_ids:
+            return {}
+        
+        cache_keys = {record_id: get_zoho_record_cache_key(record_type, record_id) for record_id in record_ids}
+        cached = cache.get_many(list(cache_keys.values()))
+        records = {record_id: cached[key] for record_id, key in cache_keys.items() if key in cached}
+        missing = [record_id for record_id in dict.fromkeys(record_ids) if record_id not in records]
+        
+        found, failed = self.zoho_client.get_records_by_ids(module, missing) if missing else ({}, [])
+        found = {record_id: record for record_id, record in found.items() if record_id in cache_keys}
+        records.update(found)
+        cache.set_many({cache_keys[record_id]: record for record_id, record in found.items()}, ZOHO_FETCH_CACHE_TTL)
+        
+        if failed:
+            logger.warning("Bulk fetch of %s %s failed, falling back to single fetches", len(failed), module)
+            records.update(self.fetch_records_concurrently(fetch_func, failed))
+        for record_id in missing:
+            records.setdefault(record_id, None)
+        
+        logger.info("Fetched %s %s records (%s individually)", len(records), module, len(failed))
+        return records
+    
     def sync_specific_contacts(self, contact_ids: List[str]) -> dict:
         """
         Sync specific contacts by their IDs
@@ -1204,6 +1798,9 @@ class ZohoWebhookHandler:
         Returns:
             Sync results dictionary
         """
+        # Repeated IDs would only re-upsert the same record
+        contact_ids = list(dict.fromkeys(contact_ids))
+        
         results = {
             'total_requested': len(contact_ids),
             'successful': 0,
@@ -1211,17 +1808,22 @@ class ZohoWebhookHandler:
             'errors': []
         }
         
+        # One timestamp for the whole batch
+        now = timezone.now()
+        
+        # Fetch latest data from API for all contacts in bulk
+        fetched = self.fetch_records_bulk('Contacts', 'contact', contact_ids, self.fetch_contact_from_api)
+        
         for contact_id in contact_ids:
             try:
-                logger.info(f"Syncing specific contact: {contact_id}")
+                logger.info("Syncing specific contact: %s", contact_id)
                 
-                # Fetch latest data from API
-                contact_data = self.fetch_contact_from_api(contact_id)
+                contact_data = fetched.get(contact_id)
                 if contact_data:
                     # Update local data
-                    self.update_local_contact(contact_data)
+                    self.update_local_contact(contact_data, now=now)
                     results['successful'] += 1
-                    logger.info(f"Successfully synced contact {contact_id}")
+                    logger.info("Successfully synced contact %s", contact_id)
                 else:
                     results['failed'] += 1
                     results['errors'].append(f"Could not fetch contact {contact_id}")
@@ -1229,7 +1831,7 @@ class ZohoWebhookHandler:
             except Exception as e:
                 results['failed'] += 1
                 results['errors'].append(f"Error syncing contact {contact_id}: {str(e)}")
-                logger.error(f"Error syncing contact {contact_id}: {e}")
+                logger.error("Error syncing contact %s: %s", contact_id, e)
         
         return results
     
@@ -1243,6 +1845,9 @@ class ZohoWebhookHandler:
         Returns:
             Sync results dictionary
         """
+        # Repeated IDs would only re-upsert the same record
+        account_ids = list(dict.fromkeys(account_ids))
+        
         results = {
             'total_requested': len(account_ids),
             'successful': 0,
@@ -1250,17 +1855,19 @@ class ZohoWebhookHandler:
             'errors': []
         }
         
+        # Fetch latest data from API for all accounts in bulk
+        fetched = self.fetch_records_bulk('Accounts', 'account', account_ids, self.fetch_account_from_api)
+        
         for account_id in account_ids:
             try:
-                logger.info(f"Syncing specific account: {account_id}")
+                logger.info("Syncing specific account: %s", account_id)
                 
-                # Fetch latest data from API
-                account_data = self.fetch_account_from_api(account_id)
+                account_data = fetched.get(account_id)
                 if account_data:
                     # Update local data
                     self.update_local_account(account_data)
                     results['successful'] += 1
-                    logger.info(f"Successfully synced account {account_id}")
+                    logger.info("Successfully synced account %s", account_id)
                 else:
                     results['failed'] += 1
                     results['errors'].append(f"Could not fetch account {account_id}")
@@ -1268,7 +1875,7 @@ class ZohoWebhookHandler:
             except Exception as e:
                 results['failed'] += 1
                 results['errors'].append(f"Error syncing account {account_id}: {str(e)}")
-                logger.error(f"Error syncing account {account_id}: {e}")
+                logger.error("Error syncing account %s: %s", account_id, e)
         
         return results
 
@@ -1276,17 +1883,34 @@ class ZohoWebhookHandler:
 
 # Simple PK-listing view for accounts / contacts / intern roles
 from django.shortcuts import render
+from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
+
+# Upper bound for per_page so a caller cannot request an arbitrarily large page
+PK_LIST_MAX_PER_PAGE = 200
+
+# Columns shown per tab; only these are loaded instead of every model field
+PK_LIST_COLUMNS = {
+    'accounts': ('id', 'name', 'account_status'),
+    'contacts': ('id', 'first_name', 'last_name', 'email'),
+    'intern_roles': ('id', 'name', 'role_title', 'role_status'),
+}
+
+# Keyset (?after=<id>) pagination by default; set to false to fall back to OFFSET paging
+PK_LIST_KEYSET_PAGINATION = os.getenv('PK_LIST_KEYSET_PAGINATION', 'true').lower() == 'true'
 
 def pk_list_tabs_view(request):
     """
     Render a simple page with three tabs (accounts, contacts, intern_roles).
     Supports filtering by exact pk or range (pk_min, pk_max) and pagination.
+    Pages are fetched by keyset (id > after) so deep pages cost the same as the
+    first one and no COUNT(*) is run; ?page= uses the legacy OFFSET paginator.
     Query params:
       - tab: accounts|contacts|intern_roles (default: contacts)
       - pk: exact pk value
       - pk_min, pk_max: range filter (inclusive)
-      - page: page number
-      - per_page: items per page
+      - after: last id of the previous page (keyset pagination)
+      - page: page number (legacy OFFSET pagination)
+      - per_page: items per page (capped at PK_LIST_MAX_PER_PAGE)
     """
     tab = request.GET.get('tab', 'contacts')
     pk = request.GET.get('pk')
@@ -1296,7 +1920,9 @@ def pk_list_tabs_view(request):
         per_page = int(request.GET.get('per_page', 25))
     except Exception:
         per_page = 25
-    page = request.GET.get('page', 1)
+    per_page = max(1, min(per_page, PK_LIST_MAX_PER_PAGE))
+    after = request.GET.get('after')
+    page = request.GET.get('page')
 
     if tab == 'accounts':
         qs = Account.objects.all().order_by('id')
@@ -1305,6 +1931,7 @@ def pk_list_tabs_view(request):
     else:
         tab = 'contacts'
         qs = Contact.objects.all().order_by('id')
+    qs = qs.only(*PK_LIST_COLUMNS[tab])
 
     # Apply PK filters. Since PKs are strings, use lexicographical filters which work
     # for most cases. Exact match when 'pk' provided.
@@ -1316,120 +1943,172 @@ def pk_list_tabs_view(request):
         if pk_max:
             qs = qs.filter(id__lte=pk_max)
 
-    paginator = Paginator(qs, per_page)
-    try:
-        page_obj = paginator.page(page)
-    except PageNotAnInteger:
-        page_obj = paginator.page(1)
-    except EmptyPage:
-        page_obj = paginator.page(paginator.num_pages)
+    if PK_LIST_KEYSET_PAGINATION and not page:
+        if after:
+            qs = qs.filter(id__gt=after)
+        # Fetch one extra row to tell whether a next page exists
+        items = list(qs[:per_page + 1])
+        has_next = len(items) > per_page
+        items = items[:per_page]
+        page_obj = None
+        next_after = items[-1].id if has_next else None
+    else:
+        paginator = Paginator(qs, per_page)
+        try:
+            page_obj = paginator.page(page or 1)
+        except PageNotAnInteger:
+            page_obj = paginator.page(1)
+        except EmptyPage:
+            page_obj = paginator.page(paginator.num_pages)
+        items = page_obj.object_list
+        has_next = page_obj.has_next()
+        next_after = None
 
     context = {
         'tab': tab,
-        'items': page_obj.object_list,
+        'items': items,
         'page_obj': page_obj,
+        'has_next': has_next,
+        'after': after,
+        'next_after': next_after,
         'per_page': per_page,
         'request': request,
     }
     return render(request, 'zoho_app/pk_list_tabs.html', context)
-# Lazy initialization of webhook handler
+# Lazy initialization of webhook handler, shared by every request and worker thread
 webhook_handler = None
+_webhook_handler_lock = threading.Lock()
 
 def get_webhook_handler():
-    """Get webhook handler instance with lazy initialization"""
+    """
+    Get webhook handler instance with lazy initialization
+    
+    The handler owns the pooled Zoho session, so it is built once per process; the
+    lock keeps concurrent first requests from each constructing their own.
+    """
     global webhook_handler
     if webhook_handler is None:
-        webhook_handler = ZohoWebhookHandler()
+        with _webhook_handler_lock:
+            if webhook_handler is None:
+                webhook_handler = ZohoWebhookHandler()
     return webhook_handler
 
 
+def _apply_task_in_thread(task, *args):
+    """Run a Celery task inline on a background thread, closing its DB connections before and after"""
+    close_old_connections()
+    try:
+        task.apply(args=args)
+    finally:
+        close_old_connections()
+
+
+def queue_contact_update(webhook_data: dict):
+    """
+    Queue processing of a contact webhook without blocking the acknowledgement
+    
+    Without a broker Celery runs tasks inline (CELERY_TASK_ALWAYS_EAGER), which
+    would hold the webhook response until the Zoho fetch, CV download and skill
+    extraction finish, so the task is started on a background thread instead.
+    
+    Args:
+        webhook_data: Parsed webhook payload
+    """
+    if getattr(settings, 'CELERY_TASK_ALWAYS_EAGER', False):
+        threading.Thread(
+            target=_apply_task_in_thread, args=(process_contact_update_task, webhook_data), daemon=True
+        ).start()
+    else:
+        process_contact_update_task.delay(webhook_data)
+
+
 @csrf_exempt
 @require_http_methods(["POST"])
 def handle_contact_webhook(request):
-    """Handle Zoho contact webhook notifications"""
+    """
+    Handle Zoho contact webhook notifications
+    
+    Only parses, verifies and queues the payload, so Zoho gets its acknowledgement
+    without waiting on the Zoho fetch or CV processing.
+    """
+    oversized = _oversized_webhook_response(request)
+    if oversized:
+        return oversized
+    
+    # Read the body once; parsing, signature checks and error logs all reuse it
+    raw_body = request.body
+    logger.info(f"Step 1. *********Webhook trigger received *********")
     try:
-
-        logger.info(f"Step 1. *********Webhook trigger received *********")
-        # Parse request body based on content type
-        webhook_data = None
-        if request.content_type == 'application/json':
-            webhook_data = json.loads(request.body.decode('utf-8'))
-        elif request.content_type.startswith('application/x-www-form-urlencoded'):
-            # Parse form-encoded data from Zoho
-            from urllib.parse import parse_qs, unquote
-            raw_data = request.body.decode('utf-8')
-            parsed_data = parse_qs(raw_data)
-            
-            # Convert to single values and decode URL encoding
-            webhook_data = {}
-            for key, values in parsed_data.items():
-                webhook_data[key] = unquote(values[0]) if values else ''
-            
-            logger.info(f"Step 2. *********Parsed form data received *********")
-        else:
-            # logger.error(f"Unsupported content type: {request.content_type}")
-            return JsonResponse({'error': 'Unsupported content type'}, status=400)
-        
-        logger.info(f"Step 3. *********Parsed webhook data received *********")
-        logger.info(f"data: {json.dumps(webhook_data, indent=2)[:500]}...")
+        handler = get_webhook_handler()
         
-        # Verify signature if provided
+        # Verify the signature over the raw bytes before spending any work on the payload
         signature = request.headers.get('X-Zoho-Signature')
-        if signature:
-            handler = get_webhook_handler()
-            if not handler.verify_webhook_signature(request.body.decode('utf-8'), signature):
-                logger.warning("Invalid webhook signature")
-                return JsonResponse({'error': 'Invalid signature'}, status=401)
+        if signature and not handler.verify_webhook_signature(raw_body, signature):
+            logger.warning("Invalid webhook signature")
+            return ORJsonResponse({'error': 'Invalid signature'}, status=401)
+    except Exception as e:
+        logger.error(f"Webhook handling error: {e}")
+        return ORJsonResponse({'error': str(e)}, status=500)
+    
+    try:
+        webhook_data = _parse_webhook_body(request.content_type, raw_body)
+    except json.JSONDecodeError as e:
+        return _invalid_json_response(e, raw_body)
+    if webhook_data is None:
+        return ORJsonResponse({'error': 'Unsupported content type'}, status=400)
+    oversized = _oversized_webhook_response(request, webhook_data)
+    if oversized:
+        return oversized
+    
+    try:
+        logger.info(f"Step 3. *********Parsed webhook data received *********")
+        _log_webhook_preview(webhook_data)
         
-        # Process the webhook
-        handler = get_webhook_handler()
-        result = handler.process_contact_update(webhook_data)
+        contact_info = handler.extract_contact_info(webhook_data)
+        contact_id = contact_info.get('id') if contact_info else None
+        if not contact_id:
+            return ORJsonResponse({'status': 'error', 'message': 'No contact ID found'}, status=400)
         
-        logger.info(f"Webhook processing result: {result}")
+        # Acknowledge immediately; the Zoho fetch and processing run on a Celery worker
+        # (or a background thread without a broker) so slow API calls never push Zoho
+        # into retrying the webhook
+        queue_contact_update(webhook_data)
         
-        if result['status'] in ['success', 'skipped']:
-            return JsonResponse(result, status=200)
-        else:
-            logger.warning(f"Webhook processing failed: {result}")
-            return JsonResponse(result, status=400)
+        return ORJsonResponse({
+            'status': 'accepted',
+            'contact_id': contact_id,
+            'message': f'Contact {contact_id} webhook queued for processing'
+        }, status=202)
             
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON decode error: {e}")
-        logger.error(f"Raw body: {request.body.decode('utf-8')}")
-        return JsonResponse({'error': 'Invalid JSON payload'}, status=400)
     except Exception as e:
-        logger.error(f"Webhook handling error: {e}")
-        logger.error(f"Raw body: {request.body.decode('utf-8')}")
-        return JsonResponse({'error': str(e)}, status=500)
+        logger.exception("Webhook handling error")
+        _log_raw_body(raw_body)
+        return ORJsonResponse({'error': str(e)}, status=500)
 
 
 @csrf_exempt
 @require_http_methods(["POST"])
 def handle_account_webhook(request):
     """Handle Zoho account webhook notifications"""
+    oversized = _oversized_webhook_response(request)
+    if oversized:
+        return oversized
+    
+    # Read the body once; parsing, signature checks and error logs all reuse it
+    raw_body = request.body
+    logger.info(f"Step 1. *********Webhook account trigger received *********")
+    
+    # Zoho sends account notifications form-encoded only
+    webhook_data = _parse_webhook_body(request.content_type, raw_body, allow_json=False)
+    if webhook_data is None:
+        return ORJsonResponse({'error': 'Unsupported content type'}, status=400)
+    oversized = _oversized_webhook_response(request, webhook_data)
+    if oversized:
+        return oversized
+    
     try:
-        logger.info(f"Step 1. *********Webhook account trigger received *********")
-        
-        # Parse request body based on content type
-        webhook_data = None
-        if request.content_type.startswith('application/x-www-form-urlencoded'):
-            # Parse form-encoded data from Zoho
-            from urllib.parse import parse_qs, unquote
-            raw_data = request.body.decode('utf-8')
-            parsed_data = parse_qs(raw_data)
-            
-            # Convert to single values and decode URL encoding
-            webhook_data = {}
-            for key, values in parsed_data.items():
-                webhook_data[key] = unquote(values[0]) if values else ''
-            
-            logger.info(f"Step 2. *********Parsed form data received *********")
-        else:
-            logger.error(f"Unsupported content type: {request.content_type}")
-            return JsonResponse({'error': 'Unsupported content type'}, status=400)
-        
         logger.info(f"Step 3. *********Parsed webhook data received *********")
-        logger.info(f"data: {json.dumps(webhook_data, indent=2)[:500]}...")
+        _log_webhook_preview(webhook_data)
         
         # Extract account ID from webhook data
         account_id = webhook_data.get('id')
@@ -1437,7 +2116,7 @@ def handle_account_webhook(request):
         
         if not account_id:
             logger.error("No account ID found in webhook data")
-            return JsonResponse({'error': 'No account ID provided'}, status=400)
+            return ORJsonResponse({'error': 'No account ID provided'}, status=400)
         
         logger.info(f"Step 4. *********Processing account webhook for ID: {account_id}, Name: {account_name} *********")
         
@@ -1448,50 +2127,42 @@ def handle_account_webhook(request):
         logger.info(f"Account webhook processing result: {result}")
         
         if result['status'] == 'success':
-            return JsonResponse(result, status=200)
+            return ORJsonResponse(result, status=200)
         else:
             logger.warning(f"Account webhook processing failed: {result}")
-            return JsonResponse(result, status=400)
+            return ORJsonResponse(result, status=400)
             
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON decode error: {e}")
-        logger.error(f"Raw body: {request.body.decode('utf-8')}")
-        return JsonResponse({'error': 'Invalid JSON payload'}, status=400)
     except Exception as e:
-        logger.error(f"Account webhook handling error: {e}")
-        logger.error(f"Raw body: {request.body.decode('utf-8')}")
-        return JsonResponse({'error': str(e)}, status=500)
+        logger.exception("Account webhook handling error")
+        _log_raw_body(raw_body)
+        return ORJsonResponse({'error': str(e)}, status=500)
 
 
 @csrf_exempt
 @require_http_methods(["POST"])
 def handle_intern_role_webhook(request):
     """Handle Zoho intern role webhook notifications"""
+    oversized = _oversized_webhook_response(request)
+    if oversized:
+        return oversized
+    
+    # Read the body once; parsing, signature checks and error logs all reuse it
+    raw_body = request.body
+    logger.info(f"Step 1. *********Webhook intern role trigger received *********")
+    
+    try:
+        webhook_data = _parse_webhook_body(request.content_type, raw_body)
+    except json.JSONDecodeError as e:
+        return _invalid_json_response(e, raw_body)
+    if webhook_data is None:
+        return ORJsonResponse({'error': 'Unsupported content type'}, status=400)
+    oversized = _oversized_webhook_response(request, webhook_data)
+    if oversized:
+        return oversized
+    
     try:
-        logger.info(f"Step 1. *********Webhook intern role trigger received *********")
-
-        # Parse request body based on content type
-        webhook_data = None
-        if request.content_type.startswith('application/x-www-form-urlencoded'):
-            # Parse form-encoded data from Zoho
-            from urllib.parse import parse_qs, unquote
-            raw_data = request.body.decode('utf-8')
-            parsed_data = parse_qs(raw_data)
-            
-            # Convert to single values and decode URL encoding
-            webhook_data = {}
-            for key, values in parsed_data.items():
-                webhook_data[key] = unquote(values[0]) if values else ''
-            
-            logger.info(f"Step 2. *********Parsed form data received *********")
-        elif request.content_type == 'application/json':
-            webhook_data = json.loads(request.body.decode('utf-8'))
-        else:
-            logger.error(f"Unsupported content type: {request.content_type}")
-            return JsonResponse({'error': 'Unsupported content type'}, status=400)
-        
         logger.info(f"Step 3. *********Parsed webhook data received *********")
-        logger.info(f"data: {json.dumps(webhook_data, indent=2)[:500]}...")
+        _log_webhook_preview(webhook_data)
         
         # Extract intern role ID from webhook data
         intern_role_id = webhook_data.get('id')
@@ -1499,7 +2170,7 @@ def handle_intern_role_webhook(request):
         
         if not intern_role_id:
             logger.error("No intern role ID found in webhook data")
-            return JsonResponse({'error': 'No intern role ID provided'}, status=400)
+            return ORJsonResponse({'error': 'No intern role ID provided'}, status=400)
         
         logger.info(f"Step 4. *********Processing intern role webhook for ID: {intern_role_id}, Name: {intern_role_name} *********")
         
@@ -1510,19 +2181,146 @@ def handle_intern_role_webhook(request):
         logger.info(f"Intern role webhook processing result: {result}")
         
         if result['status'] == 'success':
-            return JsonResponse(result, status=200)
+            return ORJsonResponse(result, status=200)
         else:
             logger.warning(f"Intern role webhook processing failed: {result}")
-            return JsonResponse(result, status=400)
+            return ORJsonResponse(result, status=400)
             
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON decode error: {e}")
-        logger.error(f"Raw body: {request.body.decode('utf-8')}")
-        return JsonResponse({'error': 'Invalid JSON payload'}, status=400)
     except Exception as e:
-        logger.error(f"Intern role webhook handling error: {e}")
-        logger.error(f"Raw body: {request.body.decode('utf-8')}")
-        return JsonResponse({'error': str(e)}, status=500)
+        logger.exception("Intern role webhook handling error")
+        _log_raw_body(raw_body)
+        return ORJsonResponse({'error': str(e)}, status=500)
+
+_contact_sync_queue = None
+
+
+def get_contact_sync_queue():
+    """
+    Get the Redis client holding pending contact syncs
+    
+    Returns:
+        Redis client, or None when Redis is not configured (contacts are then synced one by one)
+    """
+    global _contact_sync_queue
+    redis_url = getattr(settings, 'CONTACT_SYNC_REDIS_URL', None)
+    if _contact_sync_queue is None and REDIS_AVAILABLE and redis_url:
+        _contact_sync_queue = redis.Redis.from_url(redis_url)
+    return _contact_sync_queue
+
+
+def enqueue_contact_sync(contact_id: str, dedup_key: str = None) -> bool:
+    """
+    Add a contact to the pending sync batch and schedule the batch if none is pending
+    
+    Args:
+        contact_id: Zoho contact ID
+        dedup_key: Webhook dedup claim to release if the sync fails
+        
+    Returns:
+        True if queued, False if batching is unavailable
+    """
+    queue = get_contact_sync_queue()
+    if queue is None:
+        return False
+    
+    try:
+        queue.rpush(CONTACT_SYNC_QUEUE_KEY, json_dumps({'id': contact_id, 'dedup_key': dedup_key}))
+    except redis.RedisError as e:
+        logger.warning(f"Could not queue contact {contact_id} for batch sync: {e}")
+        return False
+    
+    schedule_contact_sync_batch()
+    return True
+
+
+def schedule_contact_sync_batch():
+    """Schedule one batch run per CONTACT_SYNC_BATCH_WINDOW, however many contacts arrive"""
+    window = settings.CONTACT_SYNC_BATCH_WINDOW
+    if cache.add(f"{CONTACT_SYNC_QUEUE_KEY}:scheduled", '1', window):
+        sync_contact_batch_task.apply_async(countdown=window)
+
+
+def map_contact_row(contact_data: dict) -> dict:
+    """
+    Map a full Zoho contact record to a Contact row for bulk upserts
+    
+    Unlike sync_single_contact, empty Zoho values are kept as None so every row in a
+    batch has the same columns.
+    
+    Args:
+        contact_data: Contact record from the Zoho API
+        
+    Returns:
+        Dictionary of Contact field values including 'id'
+    """
+    row = {
+        'id': contact_data['id'],
+        'placement_automation': contact_data.get('Placement_Automation') or contact_data.get('placement_automation'),
+    }
+    row.update(map_zoho_fields(contact_data, CONTACT_FIELD_MAP))
+    return row
+
+
+def sync_queued_contacts() -> dict:
+    """
+    Sync up to CONTACT_SYNC_BATCH_SIZE queued contacts with one Zoho call per 100 IDs and one bulk upsert
+    
+    Returns:
+        Batch summary dictionary
+    """
+    queue = get_contact_sync_queue()
+    if queue is None:
+        return {'status': 'skipped', 'message': 'Contact sync queue is not configured'}
+    
+    # Pop the batch atomically so concurrent runs never sync the same entries
+    pipe = queue.pipeline()
+    pipe.lrange(CONTACT_SYNC_QUEUE_KEY, 0, CONTACT_SYNC_BATCH_SIZE - 1)
+    pipe.ltrim(CONTACT_SYNC_QUEUE_KEY, CONTACT_SYNC_BATCH_SIZE, -1)
+    entries, _ = pipe.execute()
+    
+    dedup_keys = {}
+    for entry in entries:
+        item = json_loads(entry)
+        dedup_keys.setdefault(item['id'], []).append(item.get('dedup_key'))
+    contact_ids = list(dedup_keys)
+    
+    try:
+        fetched, failed = ZohoClient().get_records_by_ids('Contacts', contact_ids) if contact_ids else ({}, [])
+        batch = {contact_id: map_contact_row(record) for contact_id, record in fetched.items()}
+        written = flush_sync_batch(Contact, batch, 'contact')
+        if written < len(batch):
+            # The row-by-row fallback does not say which rows failed, so redo the whole batch
+            failed = failed + list(batch)
+    except Exception as e:
+        logger.error(f"Error syncing contact batch of {len(contact_ids)}: {e}")
+        fetched, failed, written = {}, contact_ids, 0
+    
+    # The webhooks were already acknowledged, so Zoho will not resend contacts that
+    # failed here; sync them one by one instead of dropping them
+    for contact_id in failed:
+        dedup_key = next((key for key in dedup_keys[contact_id] if key), None)
+        sync_single_contact_task.delay(contact_id, dedup_key)
+    
+    # Contacts Zoho does not know about can be retried by Zoho
+    missing = [contact_id for contact_id in contact_ids if contact_id not in fetched and contact_id not in failed]
+    stale_keys = [key for contact_id in missing for key in dedup_keys[contact_id] if key]
+    if stale_keys:
+        cache.delete_many(stale_keys)
+    
+    logger.info(
+        f"Synced {written} of {len(contact_ids)} queued contacts "
+        f"({len(missing)} not found, {len(failed)} handed to single syncs)"
+    )
+    
+    # Contacts queued while this batch ran still need a run
+    if queue.llen(CONTACT_SYNC_QUEUE_KEY):
+        schedule_contact_sync_batch()
+    
+    return {
+        'status': 'success', 'requested': len(contact_ids), 'synced': written,
+        'missing': missing, 'retried': failed
+    }
+
 
 def sync_single_contact(contact_id):
     """
@@ -1535,8 +2333,6 @@ def sync_single_contact(contact_id):
         dict: Result dictionary with status and message
     """
     try:
-        from etl.pipeline import parse_datetime_field, extract_nested_name, list_to_json_string
-        
         logger.info(f"Starting sync for contact {contact_id}")
         
         # Initialize Zoho client
@@ -1552,204 +2348,36 @@ def sync_single_contact(contact_id):
         
         logger.info(f"Fetched contact data from Zoho for {contact_id}")
         
-        # Map contact fields to model fields (using the same mapping logic as the ETL pipeline)
-        with transaction.atomic():
-            contact_fields_mapped = {
-                # Core fields
-                'id': contact_data.get('id'),
-                'email': contact_data.get('Email'),
-                'first_name': contact_data.get('First_Name'),
-                'last_name': contact_data.get('Last_Name'),
-                'phone': contact_data.get('Phone'),
-                'account_id': contact_data.get('Account_Name', {}).get('id') if isinstance(contact_data.get('Account_Name'), dict) else None,
-                'account_name': extract_nested_name(contact_data.get('Account_Name')),
-                'title': contact_data.get('Title'),
-                'department': contact_data.get('Department'),
-                'updated_time': parse_datetime_field(contact_data.get('Modified_Time')),
-                'created_time': parse_datetime_field(contact_data.get('Created_Time')),
-                'placement_automation': contact_data.get('Placement_Automation') or contact_data.get('placement_automation'),
-                'full_name': contact_data.get('Full_Name'),
-                
-                # Location and Industry fields
-                'location': contact_data.get('Location'),
-                'industry': contact_data.get('Industry'),
-                'industry_choice_1': contact_data.get('Industry_Choice_1'),
-                'industry_choice_2': contact_data.get('Industry_choice_2'),
-                'industry_choice_3': contact_data.get('Industry_Choice_3'),
-                'industry_1_areas': contact_data.get('Industry_1_Areas'),
-                'industry_2_areas': contact_data.get('Industry_2_Areas'),
-                'current_location_v2': contact_data.get('Current_Location_V2'),
-                'location_other': contact_data.get('Location_Other'),
-                'alternative_location1': contact_data.get('Alternative_Location1'),
-                'country_city_of_residence': contact_data.get('Country_city_of_residence'),
-                
-                # Student and Academic fields
-                'skills': contact_data.get('Skills'),
-                'student_status': contact_data.get('Student_Status'),
-                'university_name': contact_data.get('University_Name'),
-                'graduation_date': parse_datetime_field(contact_data.get('Graduation_Date')),
-                'student_bio': contact_data.get('Student_Bio'),
-                'uni_start_date': parse_datetime_field(contact_data.get('Uni_Start_Date')),
-                'english_level': contact_data.get('English_Level'),
-                'age_on_start_date': contact_data.get('Age_on_Start_Date'),
-                'date_of_birth': parse_datetime_field(contact_data.get('Date_of_Birth')),
-                
-                # Placement and Role fields
-                'placement_status': contact_data.get('Placement_status'),
-                'start_date': parse_datetime_field(contact_data.get('Start_date')),
-                'end_date': parse_datetime_field(contact_data.get('End_date')),
-                'role_success_stage': contact_data.get('Role_Success_Stage'),
-                'role_owner': extract_nested_name(contact_data.get('Role_Owner')),
-                'role_success_notes': contact_data.get('Role_Success_Notes'),
-                'role_confirmed_date': parse_datetime_field(contact_data.get('Role_confirmed_date')),
-                'paid_role': contact_data.get('Paid_Role'),
-                'likelihood_to_convert': contact_data.get('Likelihood_to_convert'),
-                'job_title': contact_data.get('Job_Title'),
-                'job_offered_after': contact_data.get('Job_offered_after'),
-                
-                # Contact and Communication fields
-                'link_to_cv': contact_data.get('Link_to_CV'),
-                'contact_email': contact_data.get('Contact_Email'),
-                'secondary_email': contact_data.get('Secondary_Email'),
-                'do_not_contact': contact_data.get('Do_Not_Contact', False),
-                'email_opt_out': contact_data.get('Email_Opt_Out', False),
-                'unsubscribed_time': parse_datetime_field(contact_data.get('Unsubscribed_Time')),
-                'follow_up_date': parse_datetime_field(contact_data.get('Follow_up_Date')),
-                
-                # Personal Information
-                'gender': contact_data.get('Gender'),
-                'nationality': contact_data.get('Nationality'),
-                'timezone': contact_data.get('Timezone'),
-                'contact_last_name': contact_data.get('Contact_Last_Name'),
-                
-                # Visa and Travel fields
-                'visa_eligible': contact_data.get('Visa_Eligible'),
-                'requires_a_visa': contact_data.get('Requires_a_visa'),
-                'visa_type_exemption': contact_data.get('Visa_Type_Exemption'),
-                'visa_successful': contact_data.get('Visa_successful'),
-                'visa_alt_options': list_to_json_string(contact_data.get('Visa_Alt_Options')),
-                'visa_notes': contact_data.get('Visa_Note_s'),
-                'visa_owner': extract_nested_name(contact_data.get('Visa_Owner')),
-                'visa_f_u_date': parse_datetime_field(contact_data.get('Visa_F_U_Date')),
-                'arrival_date_time': parse_datetime_field(contact_data.get('Arrival_date_time')),
-                'departure_date_time': parse_datetime_field(contact_data.get('Departure_date_time')),
-                'departure_flight_number': contact_data.get('Departure_flight_number'),
-                'arrival_drop_off_address': contact_data.get('Arrival_drop_off_address'),
-                
-                # Additional fields to complete the mapping
-                'interview': contact_data.get('Interview'),
-                'interview_successful': contact_data.get('Interview_successful'),
-                'interviewer': contact_data.get('Interviewer'),
-                'myinterview_url': contact_data.get('MyInterview_URL'),
-                'intro_call_date': parse_datetime_field(contact_data.get('Intro_Call_Date')),
-                'call_scheduled_date_time': parse_datetime_field(contact_data.get('Call_Scheduled_Date_Time')),
-                'call_booked_date_time': parse_datetime_field(contact_data.get('Call_Booked_Date_Time')),
-                'call_to_conversion_time_days': contact_data.get('Call_to_Conversion_Time_days'),
-                'enrolment_to_intro_call_lead_time': contact_data.get('Enrolment_to_Intro_Call_Lead_Time'),
-                'process_flow': contact_data.get('$process_flow'),
-                'approval': contact_data.get('$approval'),
-                'approval_date': parse_datetime_field(contact_data.get('Approval_date')),
-                'approval_state': contact_data.get('$approval_state'),
-                'review_process': contact_data.get('$review_process'),
-                'admission_member': extract_nested_name(contact_data.get('Admission_Member')),
-                'lead_created_time': parse_datetime_field(contact_data.get('Lead_Created_Time')),
-                'last_activity_time': parse_datetime_field(contact_data.get('Last_Activity_Time')),
-                'layout_id': contact_data.get('Layout', {}).get('id') if isinstance(contact_data.get('Layout'), dict) else None,
-                'layout_display_label': contact_data.get('Layout', {}).get('display_label') if isinstance(contact_data.get('Layout'), dict) else None,
-                'layout_name': contact_data.get('Layout', {}).get('name') if isinstance(contact_data.get('Layout'), dict) else None,
-                'field_states': contact_data.get('$field_states'),
-                'student_decision': contact_data.get('Student_decision'),
-                'company_decision': contact_data.get('Company_decision'),
-                'rating_new': contact_data.get('Rating_New'),
-                'rating': contact_data.get('Rating'),
-                'warm_call': contact_data.get('Warm_Call'),
-                'other_industry': contact_data.get('Other_industry'),
-                'alternative_location1': contact_data.get('Alternative_Location1'),
-                'review': contact_data.get('$review'),
-                'reason_for_cancellation': contact_data.get('Reason_for_Cancellation'),
-                'cancelled_date_time': parse_datetime_field(contact_data.get('Cancelled_Date_Time')),
-                'notes1': contact_data.get('Notes1'),
-                'partner_organisation': contact_data.get('Partner_Organisation'),
-                'date_of_cancellation': parse_datetime_field(contact_data.get('Date_of_Cancellation')),
-                'in_merge': contact_data.get('$in_merge'),
-                'duration': contact_data.get('Duration'),
-                'utm_campaign': contact_data.get('UTM_Campaign'),
-                'utm_medium': contact_data.get('UTM_Medium'),
-                'utm_content': contact_data.get('UTM_Content'),
-                'utm_gclid': contact_data.get('UTM_GCLID'),
-                'description': contact_data.get('Description'),
-                'industry_2_areas': contact_data.get('Industry_2_Areas'),
-                'locked_for_me': contact_data.get('$locked_for_me'),
-                'from_university_partner': contact_data.get('From_University_partner'),
-                'placement_urgency': contact_data.get('Placement_Urgency'),
-                'enrich_status': contact_data.get('Enrich_Status__s'),
-                'cohort_start_date': parse_datetime_field(contact_data.get('Cohort_Start_Date')),
-                'is_duplicate': contact_data.get('$is_duplicate'),
-                'signed_agreement': contact_data.get('Signed_Agreement'),
-                'accommodation_finalised': contact_data.get('Accommodation_finalised'),
-                'send_mail2': contact_data.get('Send_Mail2'),
-                't_c_link': contact_data.get('T_C_Link'),
-                'number_of_days': contact_data.get('Number_of_Days'),
-                'agreement_finalised': contact_data.get('Agreement_finalised'),
-                'end_date_auto_populated': parse_datetime_field(contact_data.get('End_date_Auto_populated')),
-                'total': contact_data.get('Total'),
-                'visa_owner': extract_nested_name(contact_data.get('Visa_Owner')),
-                'house_rules': contact_data.get('House_rules'),
-                'other_payment_status': contact_data.get('Other_Payment_Status'),
-                'days_since_conversion': contact_data.get('Days_Since_Conversion'),
-                'name1': contact_data.get('Name1'),
-                'average_no_of_days': contact_data.get('Average_no_of_days'),
-                'placement_lead_time_days': contact_data.get('Placement_Lead_Time_days'),
-                'placement_deadline': parse_datetime_field(contact_data.get('Placement_Deadline')),
-                'change_log_time': parse_datetime_field(contact_data.get('Change_Log_Time__s')),
-                'community_owner': extract_nested_name(contact_data.get('Community_Owner')),
-                'created_by_email': contact_data.get('Created_By', {}).get('email') if isinstance(contact_data.get('Created_By'), dict) else None,
-                'decision_date': parse_datetime_field(contact_data.get('Decision_Date')),
-                'last_enriched_time': parse_datetime_field(contact_data.get('Last_Enriched_Time__s')),
-                'refund_date': parse_datetime_field(contact_data.get('Refund_date')),
-                'ps_assigned_date': parse_datetime_field(contact_data.get('PS_Assigned_Date')),
-                'books_cust_id': contact_data.get('books_cust_id'),
-                'days_count': contact_data.get('Days_Count'),
-                'record_status': contact_data.get('Record_Status__s'),
-                'type': contact_data.get('Type'),
-                'cancellation_notes': contact_data.get('Cancellation_Notes'),
-                'locked': contact_data.get('Locked__s'),
-                'tag': contact_data.get('Tag'),
-                'additional_information': contact_data.get('Additional_Information'),
-                'token': contact_data.get('Token'),
-                'partnership_specialist_id': extract_nested_name(contact_data.get('Partnership_Specialist')) if contact_data.get('Partnership_Specialist') else None,
-            }
-            
-            # Clean None values and convert boolean fields
-            cleaned_fields = {}
-            for key, value in contact_fields_mapped.items():
-                if value is not None:
-                    # Handle boolean fields
-                    if key in ['process_flow', 'do_not_contact', 'email_opt_out', 'in_merge', 'locked_for_me', 'is_duplicate', 'send_mail2', 'locked']:
-                        cleaned_fields[key] = bool(value) if value in [True, False, 'true', 'false', 1, 0] else False
-                    else:
-                        cleaned_fields[key] = value
-            
-            # Update or create contact record
-            contact, created = Contact.objects.update_or_create(
-                id=contact_id,
-                defaults=cleaned_fields
-            )
-            
-            action = "created" if created else "updated"
-            logger.info(f"Successfully {action} contact {contact_id} in database")
-            
-            return {
-                'status': 'success',
-                'contact_id': contact_id,
-                'action': action,
-                'message': f'Contact {contact_id} successfully {action} in database'
-            }
+        # Map contact fields to model fields in one pass over CONTACT_FIELD_MAP,
+        # skipping values Zoho left empty
+        cleaned_fields = {'id': contact_id}
+        placement_automation = contact_data.get('Placement_Automation') or contact_data.get('placement_automation')
+        if placement_automation is not None:
+            cleaned_fields['placement_automation'] = placement_automation
+        
+        get = contact_data.get
+        for field_name, zoho_key, converter in CONTACT_FIELD_MAP:
+            value = get(zoho_key)
+            if value is not None and converter:
+                value = converter(value)
+            if value is not None:
+                cleaned_fields[field_name] = value
+        
+        # Single UPDATE for an existing contact, INSERT only when it is new
+        created = save_local_record(Contact, cleaned_fields, 'contact')
+        
+        action = "created" if created else "updated"
+        logger.info(f"Successfully {action} contact {contact_id} in database")
+        
+        return {
+            'status': 'success',
+            'contact_id': contact_id,
+            'action': action,
+            'message': f'Contact {contact_id} successfully {action} in database'
+        }
             
     except Exception as e:
-        logger.error(f"Error syncing contact {contact_id}: {str(e)}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception(f"Error syncing contact {contact_id}: {e}")
         return {
             'status': 'error',
             'contact_id': contact_id,
@@ -1760,81 +2388,179 @@ def sync_single_contact(contact_id):
 @require_http_methods(["POST"])
 def contact_sync_webhook(request):
     """Handle Zoho contact sync webhook notifications and sync contact data"""
+    oversized = _oversized_webhook_response(request)
+    if oversized:
+        return oversized
+    
+    # Read the body once; parsing, signature checks and error logs all reuse it
+    raw_body = request.body
+    logger.info(f"Step 1. *********Webhook contact sync trigger received *********")
+    
+    try:
+        webhook_data = _parse_webhook_body(request.content_type, raw_body)
+    except json.JSONDecodeError as e:
+        return _invalid_json_response(e, raw_body)
+    if webhook_data is None:
+        return ORJsonResponse({'error': 'Unsupported content type'}, status=400)
+    oversized = _oversized_webhook_response(request, webhook_data)
+    if oversized:
+        return oversized
+    
     try:
-        logger.info(f"Step 1. *********Webhook contact sync trigger received *********")
-
-        # Parse request body based on content type
-        webhook_data = None
-        if request.content_type.startswith('application/x-www-form-urlencoded'):
-            # Parse form-encoded data from Zoho
-            from urllib.parse import parse_qs, unquote
-            raw_data = request.body.decode('utf-8')
-            parsed_data = parse_qs(raw_data)
-            
-            # Convert to single values and decode URL encoding
-            webhook_data = {}
-            for key, values in parsed_data.items():
-                webhook_data[key] = unquote(values[0]) if values else ''
-            
-            logger.info(f"Step 2. *********Parsed form data received *********")
-        elif request.content_type.startswith('application/json'):
-            # Parse JSON data
-            webhook_data = json.loads(request.body.decode('utf-8'))
-            logger.info(f"Step 2. *********Parsed JSON data received *********")
-        else:
-            logger.error(f"Unsupported content type: {request.content_type}")
-            return JsonResponse({'error': 'Unsupported content type'}, status=400)
-        
         logger.info(f"Step 3. *********Parsed webhook data received *********")
-        logger.info(f"data: {json.dumps(webhook_data, indent=2)[:500]}...")
+        _log_webhook_preview(webhook_data)
         
         # Extract contact ID from webhook data
         contact_id = webhook_data.get('id')
         if not contact_id:
             logger.error("No contact ID found in webhook data")
-            return JsonResponse({'error': 'No contact ID found in webhook data'}, status=400)
+            return ORJsonResponse({'error': 'No contact ID found in webhook data'}, status=400)
+        
+        # Zoho retries deliveries; an identical payload already synced is acknowledged without work
+        dedup_key = get_webhook_handler().acquire_webhook_dedup_key('contact_sync', contact_id, webhook_data)
+        if not dedup_key:
+            return ORJsonResponse({'status': 'skipped', 'contact_id': contact_id, 'reason': 'duplicate'})
+        
+        # Respond right away and sync in the background; bursts are batched through Redis
+        # when it is configured. ?sync=1 keeps the inline path for debugging
+        if request.GET.get('sync') != '1':
+            if not enqueue_contact_sync(contact_id, dedup_key):
+                sync_single_contact_task.delay(contact_id, dedup_key)
+            logger.info(f"Step 4. *********Contact sync queued for ID: {contact_id} *********")
+            return ORJsonResponse({'status': 'accepted', 'contact_id': contact_id}, status=202)
         
         logger.info(f"Step 4. *********Starting contact sync for ID: {contact_id} *********")
         
         # Sync the contact record
-        result = sync_single_contact(contact_id)
+        try:
+            result = sync_single_contact(contact_id)
+        except Exception:
+            cache.delete(dedup_key)
+            raise
         
         if result['status'] == 'success':
             logger.info(f"Step 5. *********Contact sync completed successfully for {contact_id} *********")
-            return JsonResponse(result)
+            return ORJsonResponse(result)
         else:
+            # Let a Zoho retry of this delivery run again
+            cache.delete(dedup_key)
             logger.error(f"Contact sync failed for {contact_id}: {result['message']}")
-            return JsonResponse(result, status=500)
+            return ORJsonResponse(result, status=500)
             
     except Exception as e:
-        logger.error(f"Contact sync webhook handling error: {e}")
-        logger.error(f"Raw body: {request.body.decode('utf-8')}")
-        return JsonResponse({'error': str(e)}, status=500)
+        logger.exception("Contact sync webhook handling error")
+        _log_raw_body(raw_body)
+        return ORJsonResponse({'error': str(e)}, status=500)
+
+
+# Health check payload never changes, so it is serialized once at import
+HEALTH_CHECK_BODY = json_dumps({
+    'status': 'healthy',
+    'service': 'zoho-job-automation',
+    'version': '1.0.0'
+})
 
 
 @require_http_methods(["GET"])
 def health_check(request):
     """Health check endpoint"""
-    return JsonResponse({
-        'status': 'healthy',
-        'service': 'zoho-job-automation',
-        'version': '1.0.0'
-    })
+    return HttpResponse(HEALTH_CHECK_BODY, content_type='application/json')
 
 
 
 
+def get_job_match_cache_key(contact_id: str) -> str:
+    """
+    Build the job match cache key for a contact from everything JobMatcher scores
+    
+    The key covers the contact's skills, its industry and location preferences and
+    a version of the intern role set (count and latest modification), so new or
+    closed roles and changed preferences are matched again instead of served stale.
+    
+    Args:
+        contact_id: Contact ID
+        
+    Returns:
+        Cache key that changes whenever the matching inputs change
+    """
+    skills = Skill.objects.filter(contact_id=contact_id).values_list('skill_name', 'proficiency_level')
+    preferences = Contact.objects.filter(id=contact_id).values_list(*JOB_MATCH_CONTACT_FIELDS).first()
+    roles = InternRole.objects.aggregate(count=Count('id'), modified=Max('modified_time'))
+    fingerprint = json.dumps([
+        sorted(f"{name}:{level}" for name, level in skills),
+        preferences,
+        [roles['count'], roles['modified']],
+    ], default=str)
+    digest = hashlib.blake2b(fingerprint.encode('utf-8'), digest_size=8).hexdigest()
+    return f"matches:{contact_id}:{digest}"
+
+
+def match_jobs_for_contact_cached(contact_id: str) -> dict:
+    """
+    Run job matching for a contact, reusing the last result while its matching inputs are unchanged
+    
+    Args:
+        contact_id: Contact ID
+        
+    Returns:
+        Job matching result dictionary
+    """
+    cache_key = get_job_match_cache_key(contact_id)
+    result = cache.get(cache_key)
+    if result is not None:
+        logger.info(f"Using cached job matches for contact {contact_id}")
+        return result
+    
+    result = match_jobs_for_contact(contact_id)
+    if result.get('status') != 'error':
+        cache.set(cache_key, result, JOB_MATCH_CACHE_TTL)
+    return result
+
+
 @csrf_exempt
 @require_http_methods(["POST"])
 def trigger_job_matching(request, contact_id):
     """Trigger job matching for a specific contact"""
     try:
-        result = match_jobs_for_contact(contact_id)
-        return JsonResponse(result)
+        result = match_jobs_for_contact_cached(contact_id)
+        return ORJsonResponse(result)
         
     except Exception as e:
         logger.error(f"Job matching trigger error: {e}")
-        return JsonResponse({'error': str(e)}, status=500)
+        return ORJsonResponse({'error': str(e)}, status=500)
+
+
+def build_job_matches_body(contact_id: str, limit: int) -> bytes:
+    """
+    Query a contact's active job matches and serialize the get_job_matches payload
+    
+    Args:
+        contact_id: Contact ID
+        limit: Maximum number of matches to return
+        
+    Returns:
+        Encoded JSON response body
+    """
+    # Matched lists are JSON columns, so rows come back as plain dicts with native lists
+    matches_data = list(JobMatch.objects.filter(
+        contact_id=contact_id,
+        status='active'
+    ).order_by('-match_score').values(
+        'intern_role_id', 'match_score', 'industry_match', 'location_match',
+        'work_policy_match', 'skill_match', 'matched_industry_1', 'matched_industry_2',
+        'matched_skills', 'match_reason', 'created_at'
+    )[:limit])
+    
+    for match in matches_data:
+        match['matched_industry_1'] = match['matched_industry_1'] or []
+        match['matched_industry_2'] = match['matched_industry_2'] or []
+        match['matched_skills'] = match['matched_skills'] or []
+    
+    return json_dumps({
+        'contact_id': contact_id,
+        'matches': matches_data,
+        'count': len(matches_data)
+    })
 
 
 @require_http_methods(["GET"])
@@ -1843,35 +2569,18 @@ def get_job_matches(request, contact_id):
     try:
         limit = int(request.GET.get('limit', 10))
         
-        matches = JobMatch.objects.filter(
-            contact_id=contact_id,
-            status='active'
-        ).order_by('-match_score')[:limit]
-        
-        matches_data = []
-        for match in matches:
-            matches_data.append({
-                'intern_role_id': match.intern_role_id,
-                'match_score': float(match.match_score),
-                'industry_match': match.industry_match,
-                'location_match': match.location_match,
-                'work_policy_match': match.work_policy_match,
-                'skill_match': match.skill_match,
-                # 'matched_industries': json.loads(match.matched_industries or '[]'),
-                'matched_skills': json.loads(match.matched_skills or '[]'),
-                'match_reason': match.match_reason,
-                'created_at': match.created_at.isoformat()
-            })
-        
-        return JsonResponse({
-            'contact_id': contact_id,
-            'matches': matches_data,
-            'count': len(matches_data)
-        })
+        # Serialized bodies are cached briefly; match_jobs_for_contact bumps the version on writes
+        version = get_job_matches_cache_version(contact_id)
+        body = cache.get_or_set(
+            f"jm:{contact_id}:{version}:{limit}",
+            lambda: build_job_matches_body(contact_id, limit),
+            JOB_MATCHES_RESPONSE_TTL
+        )
+        return HttpResponse(body, content_type='application/json')
         
     except Exception as e:
         logger.error(f"Get job matches error: {e}")
-        return JsonResponse({'error': str(e)}, status=500)
+        return ORJsonResponse({'error': str(e)}, status=500)
 
 
 
@@ -1885,49 +2594,52 @@ def manual_cv_extraction(request, contact_id):
             contact = Contact.objects.get(id=contact_id)
             contact_name = contact.full_name or contact.email or 'Unknown'
         except Contact.DoesNotExist:
-            return JsonResponse({'error': f'Contact {contact_id} not found'}, status=404)
-        
-        handler = get_webhook_handler()
+            return ORJsonResponse({'error': f'Contact {contact_id} not found'}, status=404)
         
-        # Process CV files
-        downloaded_files = handler.process_cv_files(contact_id, contact_name)
+        # Queue CV download -> skill extraction -> job matching as one chain
+        result = cv_processing_chain(contact_id, contact_name).apply_async()
         
-        # Extract skills
-        skills_extracted = handler.extract_skills_from_cvs(contact_id, downloaded_files)
-        
-        # Match jobs
-        match_result = match_jobs_for_contact(contact_id)
-        
-        return JsonResponse({
-            'status': 'success',
+        response_data = {
+            'status': 'queued',
             'contact_id': contact_id,
             'contact_name': contact_name,
-            'cv_files_processed': len(downloaded_files),
-            'skills_extracted': skills_extracted,
-            'job_matches': match_result.get('matches_created', 0),
-            'match_details': match_result
-        })
+            'task_id': result.id
+        }
+        
+        # Without a broker the chain runs eagerly, so the result is already available
+        if result.ready():
+            payload = result.get()
+            match_result = payload.get('match_result', {})
+            response_data.update({
+                'status': 'success',
+                'cv_files_processed': len(payload.get('downloaded_files', [])),
+                'skills_extracted': payload.get('skills_extracted', 0),
+                'job_matches': match_result.get('matches_created', 0),
+                'match_details': match_result
+            })
+            return ORJsonResponse(response_data)
+        
+        return ORJsonResponse(response_data, status=202)
         
     except Exception as e:
         logger.error(f"Manual CV extraction error: {e}")
+        return ORJsonResponse({'error': str(e)}, status=500)
+
+
 @require_http_methods(["GET"])
 def get_contact_skills(request, contact_id):
     """Get extracted skills for a specific contact"""
     try:
-        skills = Skill.objects.filter(contact_id=contact_id).order_by('-created_at')
-        
-        skills_data = []
-        for skill in skills:
-            skills_data.append({
-                'skill_name': skill.skill_name,
-                'skill_category': skill.skill_category,
-                'proficiency_level': skill.proficiency_level,
-                'confidence_score': float(skill.confidence_score) if skill.confidence_score else None,
-                'extraction_method': skill.extraction_method,
-                'created_at': skill.created_at.isoformat()
-            })
+        # Rows come straight from the cursor as dicts; created_at is serialized by json_dumps
+        skills_data = list(Skill.objects.filter(contact_id=contact_id).order_by('-created_at').values(
+            'skill_name', 'skill_category', 'proficiency_level',
+            'confidence_score', 'extraction_method', 'created_at'
+        ))
+        
+        for skill in skills_data:
+            skill['confidence_score'] = skill['confidence_score'] or None
         
-        return JsonResponse({
+        return ORJsonResponse({
             'contact_id': contact_id,
             'skills': skills_data,
             'count': len(skills_data)
@@ -1935,7 +2647,249 @@ def get_contact_skills(request, contact_id):
         
     except Exception as e:
         logger.error(f"Get contact skills error: {e}")
-        return JsonResponse({'error': str(e)}, status=500)
+        return ORJsonResponse({'error': str(e)}, status=500)
+
+
+# Celery task running the full ETL sync for each entity type
+ETL_SYNC_TASKS = {
+    'contacts': sync_contacts_task,
+    'accounts': sync_accounts_task,
+    'intern_roles': sync_intern_roles_task,
+}
+ETL_SYNC_ENTITIES = frozenset(ETL_SYNC_TASKS) | {'all'}
+ETL_SYNC_TYPES = frozenset({'incremental', 'full'})
+
+
+def get_etl_sync_lock_key(entity: str) -> str:
+    """Cache key holding the task ID of the running ETL sync for an entity type"""
+    return f"zoho-sync:{entity}"
+
+
+def release_etl_sync_lock(entity: str, task_id: str):
+    """
+    Release an entity's ETL sync lock if it is still held by the given task
+    
+    Args:
+        entity: Key of ETL_SYNC_TASKS
+        task_id: Celery task ID that claimed the lock
+    """
+    key = get_etl_sync_lock_key(entity)
+    if cache.get(key) == task_id:
+        cache.delete(key)
+
+
+def queue_etl_syncs(entity_types: list, incremental: bool) -> Tuple[Dict[str, AsyncResult], Dict[str, str]]:
+    """
+    Queue the ETL sync tasks for the given entity types as one Celery group
+    
+    The entities hit independent Zoho modules and tables, so the group lets separate
+    workers run them at the same time. Each entity is locked in the cache under the
+    ID of its task until the task finishes, so overlapping triggers do not pull the
+    same module twice; nothing is queued if any entity is already syncing.
+    
+    Args:
+        entity_types: Keys of ETL_SYNC_TASKS to sync
+        incremental: Only sync records modified since the last sync
+        
+    Returns:
+        Tuple of (entity type -> task result, entity type -> task ID of a sync already running)
+    """
+    if not entity_types:
+        return {}, {}
+    
+    task_ids = {}
+    busy = {}
+    for entity in entity_types:
+        task_id = str(uuid.uuid4())
+        if cache.add(get_etl_sync_lock_key(entity), task_id, ETL_SYNC_LOCK_TIMEOUT):
+            task_ids[entity] = task_id
+        else:
+            busy[entity] = cache.get(get_etl_sync_lock_key(entity))
+    
+    if busy:
+        for entity, task_id in task_ids.items():
+            release_etl_sync_lock(entity, task_id)
+        logger.info("ETL sync already running for %s; nothing queued", ', '.join(busy))
+        return {}, busy
+    
+    try:
+        group_result = group(
+            ETL_SYNC_TASKS[entity].s(incremental).set(task_id=task_ids[entity]) for entity in entity_types
+        ).apply_async()
+    except Exception:
+        for entity, task_id in task_ids.items():
+            release_etl_sync_lock(entity, task_id)
+        raise
+    
+    jobs = dict(zip(entity_types, group_result.results))
+    logger.info(
+        "Queued %s sync (incremental=%s) as group %s", ', '.join(entity_types), incremental, group_result.id,
+        extra={'entities': entity_types, 'incremental': incremental, 'group_id': group_result.id}
+    )
+    return jobs, {}
+
+
+def get_etl_last_run_key(entity: str) -> str:
+    """Cache key holding the time the last ETL sync for an entity type finished"""
+    return f"zoho-sync:{entity}:finished"
+
+
+def record_etl_sync_run(entity: str):
+    """
+    Record that an ETL sync for an entity type just finished, whether or not it wrote anything
+    
+    Args:
+        entity: Key of ETL_SYNC_TASKS
+    """
+    cache.set(get_etl_last_run_key(entity), timezone.now(), ETL_INCREMENTAL_MIN_INTERVAL)
+
+
+def get_recently_synced_entities(entity_types: list) -> Dict[str, Any]:
+    """
+    Get the entity types whose last sync finished within ETL_INCREMENTAL_MIN_INTERVAL seconds
+    
+    An incremental sync right after another one would find nothing new in Zoho, so
+    trigger_etl_sync skips these instead of making the round-trip. The finish times
+    are kept in the cache rather than read from SyncTracker, which a sync that
+    found nothing new never touches.
+    
+    Args:
+        entity_types: Keys of ETL_SYNC_TASKS
+        
+    Returns:
+        Dictionary of entity type -> time its last sync finished
+    """
+    keys = {get_etl_last_run_key(entity): entity for entity in entity_types}
+    return {keys[key]: finished for key, finished in cache.get_many(list(keys)).items()}
+
+
+def get_running_etl_syncs() -> Dict[str, str]:
+    """
+    Get the ETL syncs currently holding their entity lock
+    
+    Returns:
+        Dictionary of entity type -> task ID of its running sync
+    """
+    keys = {get_etl_sync_lock_key(entity): entity for entity in ETL_SYNC_TASKS}
+    return {keys[key]: task_id for key, task_id in cache.get_many(list(keys)).items()}
+
+
+def etl_sync_busy_response(busy: Dict[str, str]):
+    """Build the 409 response for a trigger that overlaps running ETL syncs"""
+    return ORJsonResponse({
+        'status': 'busy',
+        'message': f"ETL sync already running for: {', '.join(busy)}",
+        'running': busy
+    }, status=409)
+
+
+def describe_etl_job(result: AsyncResult) -> dict:
+    """
+    Describe an ETL sync task for API responses
+    
+    Args:
+        result: Celery task result
+        
+    Returns:
+        Dictionary with the task ID, its state and the error if it failed
+    """
+    job = {'task_id': result.id, 'state': result.state}
+    if result.failed():
+        job['error'] = str(result.result)
+    return job
+
+
+def acquire_etl_stream_slot() -> bool:
+    """
+    Claim one of the ETL_STREAM_MAX_SUBSCRIBERS stream slots shared by all workers
+    
+    Returns:
+        True if a slot was claimed; release it with release_etl_stream_slot
+    """
+    # Streams last at most ETL_STREAM_MAX_DURATION, so the counter can safely expire shortly after
+    ttl = ETL_STREAM_MAX_DURATION * 2
+    try:
+        cache.add(ETL_STREAM_SUBSCRIBERS_KEY, 0, ttl)
+        count = cache.incr(ETL_STREAM_SUBSCRIBERS_KEY)
+        cache.touch(ETL_STREAM_SUBSCRIBERS_KEY, ttl)
+    except ValueError:
+        # Counter expired between add and incr
+        return acquire_etl_stream_slot()
+    except Exception as e:
+        logger.warning(f"Stream slot counter unavailable, allowing the stream: {e}")
+        return True
+    if count > ETL_STREAM_MAX_SUBSCRIBERS:
+        release_etl_stream_slot()
+        return False
+    return True
+
+
+def release_etl_stream_slot():
+    """Release a slot claimed by acquire_etl_stream_slot"""
+    try:
+        cache.decr(ETL_STREAM_SUBSCRIBERS_KEY)
+    except ValueError:
+        # Counter already expired
+        pass
+    except Exception as e:
+        logger.warning(f"Could not release stream slot: {e}")
+
+
+def etl_event_stream_response(events) -> StreamingHttpResponse:
+    """
+    Serve an SSE generator, releasing its stream slot when the stream ends or the client disconnects
+    
+    Args:
+        events: Generator of SSE frames; the caller must hold a stream slot
+        
+    Returns:
+        StreamingHttpResponse for the events
+    """
+    def counted_events():
+        try:
+            yield from events
+        finally:
+            release_etl_stream_slot()
+    
+    response = StreamingHttpResponse(counted_events(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+def etl_job_event_stream(jobs: Dict[str, AsyncResult]):
+    """
+    Yield Server-Sent Events for queued ETL sync tasks as each one finishes
+    
+    Args:
+        jobs: Dictionary of entity type to its task result, from queue_etl_syncs
+        
+    Yields:
+        SSE frames: a ``queued`` event per entity, then ``done`` or ``failed`` as tasks complete
+    """
+    yield "retry: 5000\n\n"
+    for entity, result in jobs.items():
+        payload = {'entity': entity, 'status': 'queued', 'task_id': result.id}
+        yield f"event: queued\ndata: {json_dumps(payload).decode('utf-8')}\n\n"
+    
+    pending = dict(jobs)
+    deadline = time.monotonic() + ETL_STREAM_MAX_DURATION
+    while pending and time.monotonic() < deadline:
+        finished = [entity for entity, result in pending.items() if result.ready()]
+        for entity in finished:
+            job = describe_etl_job(pending.pop(entity))
+            status = 'failed' if 'error' in job else 'done'
+            payload = {'entity': entity, 'status': status, **job}
+            yield f"event: {status}\ndata: {json_dumps(payload).decode('utf-8')}\n\n"
+        
+        if pending and not finished:
+            yield ": keep-alive\n\n"
+            time.sleep(ETL_STREAM_POLL_INTERVAL)
+    
+    if pending:
+        # Stream expired; the tasks keep running and can be polled via etl_job_status
+        payload = {'pending': {entity: result.id for entity, result in pending.items()}}
+        yield f"event: timeout\ndata: {json_dumps(payload).decode('utf-8')}\n\n"
 
 
 @csrf_exempt
@@ -1951,117 +2905,238 @@ def trigger_etl_sync(request):
         incremental_mode = not full_sync  # If full_sync=True, then incremental=False
         sync_mode_description = "FULL" if full_sync else "INCREMENTAL"
         
-        # Track start time
-        from django.utils import timezone
+        if entity_type not in ETL_SYNC_ENTITIES:
+            return ORJsonResponse({
+                'status': 'error',
+                'message': 'Invalid entity type. Use: all, contacts, accounts, or intern_roles'
+            }, status=400)
+        entity_types = list(ETL_SYNC_TASKS) if entity_type == 'all' else [entity_type]
+        
+        # Track start time; the duration is measured on the monotonic clock
         start_time = timezone.now()
+        started = time.perf_counter()
         
-        logger.info(f"ETL sync triggered via API - Entity: {entity_type}, Mode: {sync_mode_description} (incremental={incremental_mode})")
+        logger.info(
+            "ETL sync triggered via API - Entity: %s, Mode: %s", entity_type, sync_mode_description,
+            extra={'entity': entity_type, 'mode': sync_mode_description}
+        )
+        
+        # Repeated incremental triggers (e.g. dashboard polling) skip entities that just synced
+        skipped = get_recently_synced_entities(entity_types) if incremental_mode else {}
+        if skipped:
+            logger.info(
+                "Skipping incremental sync for %s; synced in the last %ss", ', '.join(skipped), ETL_INCREMENTAL_MIN_INTERVAL,
+                extra={'entities': list(skipped)}
+            )
+            entity_types = [entity for entity in entity_types if entity not in skipped]
+        
+        # Each entity sync runs as its own Celery task; poll /api/etl/job/<task_id>/status/ for progress
+        jobs, busy = queue_etl_syncs(entity_types, incremental_mode)
+        if busy:
+            return etl_sync_busy_response(busy)
+        
+        # Every requested entity synced recently, so nothing was queued
+        if not jobs:
+            return ORJsonResponse({
+                'status': 'skipped',
+                'message': f"{sync_mode_description} ETL sync skipped; all entities synced in the last {ETL_INCREMENTAL_MIN_INTERVAL}s",
+                'entity_type': entity_type,
+                'full_sync': full_sync,
+                'incremental_mode': incremental_mode,
+                'sync_mode': sync_mode_description,
+                'results': {
+                    entity: {'state': 'skipped_recent', 'last_synced': last_synced}
+                    for entity, last_synced in skipped.items()
+                }
+            }, status=200)
+        
+        # ?stream=true reports each entity as it finishes instead of returning right away;
+        # when every stream slot is taken the normal response is returned instead
+        if request.GET.get('stream', 'false').lower() == 'true' and acquire_etl_stream_slot():
+            return etl_event_stream_response(etl_job_event_stream(jobs))
         
         results = {
-            'status': 'success',
-            'start_time': start_time.isoformat(),
+            'status': 'queued',
+            'start_time': start_time,
             'entity_type': entity_type,
             'full_sync': full_sync,
             'incremental_mode': incremental_mode,
             'sync_mode': sync_mode_description,
-            'results': {}
+            'results': {entity: describe_etl_job(result) for entity, result in jobs.items()}
         }
-        
-        try:
-            if entity_type == 'all':
-                # Sync all entities
-                logger.info(f"Starting {sync_mode_description} ETL sync for all entities...")
-                
-                # Sync contacts
-                logger.info(f"Syncing contacts ({sync_mode_description})...")
-                sync_contacts(incremental=incremental_mode)
-                results['results']['contacts'] = 'completed'
-                
-                # Sync accounts  
-                logger.info(f"Syncing accounts ({sync_mode_description})...")
-                sync_accounts(incremental=incremental_mode)
-                results['results']['accounts'] = 'completed'
-                
-                # Sync intern roles
-                logger.info(f"Syncing intern roles ({sync_mode_description})...")
-                sync_intern_roles(incremental=incremental_mode)
-                results['results']['intern_roles'] = 'completed'
-                
-            elif entity_type == 'contacts':
-                logger.info(f"Syncing contacts only ({sync_mode_description})...")
-                sync_contacts(incremental=incremental_mode)
-                results['results']['contacts'] = 'completed'
-                
-            elif entity_type == 'accounts':
-                logger.info(f"Syncing accounts only ({sync_mode_description})...")
-                sync_accounts(incremental=incremental_mode)
-                results['results']['accounts'] = 'completed'
-                
-            elif entity_type == 'intern_roles':
-                logger.info(f"Syncing intern roles only ({sync_mode_description})...")
-                sync_intern_roles(incremental=incremental_mode)
-                results['results']['intern_roles'] = 'completed'
-                
-            else:
-                return JsonResponse({
-                    'status': 'error',
-                    'message': 'Invalid entity type. Use: all, contacts, accounts, or intern_roles'
-                }, status=400)
-            
-            # Calculate duration
-            end_time = timezone.now()
-            duration = end_time - start_time
-            
-            results['end_time'] = end_time.isoformat()
-            results['duration'] = str(duration)
-            results['message'] = f"{sync_mode_description} ETL sync completed successfully in {duration}"
-            
-            logger.info(f"ETL sync completed successfully - Duration: {duration}")
-            
-            return JsonResponse(results, status=200)
-            
-        except Exception as sync_error:
-            logger.error(f"ETL sync failed: {sync_error}")
-            return JsonResponse({
+        for entity, last_synced in skipped.items():
+            results['results'][entity] = {'state': 'skipped_recent', 'last_synced': last_synced}
+        
+        # Without a broker the tasks run eagerly, so their outcome is already known
+        if not all(result.ready() for result in jobs.values()):
+            results['message'] = f"{sync_mode_description} ETL sync queued"
+            return ORJsonResponse(results, status=202)
+        
+        failed = {entity: job['error'] for entity, job in results['results'].items() if 'error' in job}
+        if failed:
+            logger.error(f"ETL sync failed: {failed}")
+            return ORJsonResponse({
                 'status': 'error',
-                'message': f'ETL sync failed: {str(sync_error)}',
+                'message': f'ETL sync failed: {failed}',
                 'entity_type': entity_type,
                 'full_sync': full_sync
             }, status=500)
+        
+        # Calculate duration
+        end_time = timezone.now()
+        duration_seconds = time.perf_counter() - started
+        
+        results['status'] = 'success'
+        results['end_time'] = end_time
+        results['duration_seconds'] = round(duration_seconds, 3)
+        results['message'] = f"{sync_mode_description} ETL sync completed successfully in {duration_seconds:.2f}s"
+        
+        logger.info(
+            "ETL sync completed successfully - Duration: %.2fs", duration_seconds,
+            extra={'entity': entity_type, 'duration_seconds': duration_seconds}
+        )
+        
+        return ORJsonResponse(results, status=200)
             
     except Exception as e:
         logger.error(f"ETL trigger error: {e}")
-        return JsonResponse({'error': str(e)}, status=500)
+        return ORJsonResponse({'error': str(e)}, status=500)
+
 
+@require_http_methods(["GET"])
+def etl_job_status(request, task_id):
+    """Get the state of an ETL sync task queued by trigger_etl_sync"""
+    try:
+        return ORJsonResponse(describe_etl_job(AsyncResult(task_id)))
+        
+    except Exception as e:
+        logger.error(f"ETL job status error: {e}")
+        return ORJsonResponse({'error': str(e)}, status=500)
 
-@require_http_methods(["GET"])  
+
+def get_table_row_counts(models) -> Dict[Any, int]:
+    """
+    Get row counts for several models in a single metadata query where possible
+    
+    On PostgreSQL, pg_class.reltuples gives an approximate count without scanning
+    the table. Other backends, or tables without statistics yet, fall back to
+    exact COUNT(*) subqueries combined into one SELECT. MySQL's TABLE_ROWS is not
+    used: on InnoDB it is a rough estimate that MySQL 8 caches for up to a day,
+    so counts would stop moving after syncs.
+    
+    Args:
+        models: Iterable of Django model classes
+        
+    Returns:
+        Dictionary of model class -> row count
+    """
+    tables = {model._meta.db_table: model for model in models}
+    placeholders = ', '.join(['%s'] * len(tables))
+    estimates = {}
+    
+    if connection.vendor == 'postgresql':
+        sql = f"SELECT relname, reltuples::bigint FROM pg_class WHERE relname IN ({placeholders})"
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql, list(tables))
+                estimates = dict(cursor.fetchall())
+        except Exception as e:
+            logger.warning(f"Could not read table statistics, using exact counts: {e}")
+    
+    counts = {}
+    for table, model in tables.items():
+        estimate = estimates.get(table)
+        # reltuples is -1 for tables that have never been analysed
+        if estimate is not None and estimate >= 0:
+            counts[model] = int(estimate)
+    
+    uncounted = [table for table in tables if tables[table] not in counts]
+    if uncounted:
+        quote = connection.ops.quote_name
+        subqueries = ', '.join(f"(SELECT COUNT(*) FROM {quote(table)})" for table in uncounted)
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT {subqueries}")
+            row = cursor.fetchone()
+        for table, count in zip(uncounted, row):
+            counts[tables[table]] = count
+    return counts
+
+
+def get_row_count_cache_key(model) -> str:
+    """Cache key for the row count of a model reported by etl_status"""
+    return f"zoho:{model.__name__}:count"
+
+
+def get_cached_row_counts(models) -> Dict[Any, int]:
+    """
+    Get row counts for several models, reusing counts cached in the last ROW_COUNT_CACHE_TTL seconds
+    
+    The ETL sync tasks delete their entity's key when they finish, so a completed
+    sync shows up on the next poll.
+    
+    Args:
+        models: Iterable of Django model classes
+        
+    Returns:
+        Dictionary of model class -> row count
+    """
+    keys = {get_row_count_cache_key(model): model for model in models}
+    cached = cache.get_many(list(keys))
+    counts = {keys[key]: count for key, count in cached.items()}
+    
+    missing = [model for key, model in keys.items() if key not in cached]
+    if missing:
+        fresh = get_table_row_counts(missing)
+        cache.set_many({get_row_count_cache_key(model): count for model, count in fresh.items()}, ROW_COUNT_CACHE_TTL)
+        counts.update(fresh)
+    return counts
+
+
+def etl_status_etag(request) -> str:
+    """
+    Build the etl_status ETag from the latest tracker update, the entity counts and the running syncs
+    
+    Everything here is one aggregate query plus cache reads, so a matching If-None-Match
+    is answered with 304 before the trackers are loaded and serialized.
+    
+    Args:
+        request: Django request
+        
+    Returns:
+        ETag value (unquoted; Django adds the quotes)
+    """
+    latest = SyncTracker.objects.aggregate(latest=Max('updated_at'))['latest']
+    counts = get_cached_row_counts([Contact, Account, InternRole])
+    state = [
+        latest.timestamp() if latest else None,
+        [counts[Contact], counts[Account], counts[InternRole]],
+        sorted(get_running_etl_syncs().items()),
+    ]
+    return hashlib.blake2b(json_dumps(state), digest_size=8).hexdigest()
+
+
+@require_http_methods(["GET"])
+@cache_control(max_age=ETL_STATUS_MAX_AGE, public=True)
+@condition(etag_func=etl_status_etag)
 def etl_status(request):
     """Get current ETL sync status and statistics"""
     try:
-        from zoho_app.models import SyncTracker, Contact, Account, InternRole
-        
-        # Get sync tracker information
-        sync_trackers = SyncTracker.objects.all()
-        trackers_data = []
-        
-        for tracker in sync_trackers:
-            trackers_data.append({
-                'entity_type': tracker.entity_type,
-                'last_sync_timestamp': tracker.last_sync_timestamp.isoformat() if tracker.last_sync_timestamp else None,
-                'records_synced': tracker.records_synced,
-                'created_at': tracker.created_at.isoformat(),
-                'updated_at': tracker.updated_at.isoformat()
-            })
+        # Get sync tracker information; rows come back as dicts and datetimes are serialized by json_dumps
+        trackers_data = list(SyncTracker.objects.values(
+            'entity_type', 'last_sync_timestamp', 'records_synced', 'created_at', 'updated_at'
+        ))
         
         # Get current data counts
+        counts = get_cached_row_counts([Contact, Account, InternRole])
         stats = {
-            'contacts_count': Contact.objects.count(),
-            'accounts_count': Account.objects.count(), 
-            'intern_roles_count': InternRole.objects.count(),
-            'sync_trackers': trackers_data
+            'contacts_count': counts[Contact],
+            'accounts_count': counts[Account], 
+            'intern_roles_count': counts[InternRole],
+            'sync_trackers': trackers_data,
+            'running_syncs': get_running_etl_syncs()
         }
         
-        return JsonResponse({
+        return ORJsonResponse({
             'status': 'success',
             'statistics': stats,
             'message': 'ETL status retrieved successfully'
@@ -2069,7 +3144,58 @@ def etl_status(request):
         
     except Exception as e:
         logger.error(f"ETL status error: {e}")
-        return JsonResponse({'error': str(e)}, status=500)
+        return ORJsonResponse({'error': str(e)}, status=500)
+
+
+@require_http_methods(["GET"])
+def etl_status_stream(request):
+    """
+    Stream ETL sync progress and completion as Server-Sent Events
+    
+    Clients subscribe once instead of polling etl_status. A ``progress`` event is
+    emitted each time a sync checkpoints a batch to its SyncTracker row, a ``done``
+    event once the sync task itself finishes (including syncs that found nothing
+    new), and a comment heartbeat keeps idle connections open until the stream expires.
+    """
+    def event_stream():
+        last_seen = timezone.now()
+        # Completions recorded before the client subscribed are not reported
+        last_finished = get_recently_synced_entities(list(ETL_SYNC_TASKS))
+        deadline = time.monotonic() + ETL_STREAM_MAX_DURATION
+        yield "retry: 5000\n\n"
+        
+        while time.monotonic() < deadline:
+            changed = SyncTracker.objects.filter(updated_at__gt=last_seen).order_by('updated_at')
+            sent = False
+            for tracker in changed:
+                last_seen = tracker.updated_at
+                payload = {
+                    'state': 'progress',
+                    'entity': tracker.entity_type,
+                    'records_synced': tracker.records_synced,
+                    'last_sync_timestamp': tracker.last_sync_timestamp,
+                    'updated_at': tracker.updated_at
+                }
+                yield f"event: progress\ndata: {json_dumps(payload).decode('utf-8')}\n\n"
+                sent = True
+            
+            finished = get_recently_synced_entities(list(ETL_SYNC_TASKS))
+            for entity, finished_at in finished.items():
+                if last_finished.get(entity) != finished_at:
+                    payload = {'state': 'done', 'entity': entity, 'finished_at': finished_at}
+                    yield f"event: done\ndata: {json_dumps(payload).decode('utf-8')}\n\n"
+                    sent = True
+            last_finished = finished
+            
+            if not sent:
+                yield ": keep-alive\n\n"
+            time.sleep(ETL_STREAM_POLL_INTERVAL)
+    
+    if not acquire_etl_stream_slot():
+        response = ORJsonResponse({'error': 'Too many open ETL status streams; poll etl_status instead'}, status=503)
+        response['Retry-After'] = str(ETL_STREAM_MAX_DURATION)
+        return response
+    return etl_event_stream_response(event_stream())
 
 
 @csrf_exempt
@@ -2084,86 +3210,99 @@ def trigger_comprehensive_sync(request):
         sync_type = request.GET.get('type', 'incremental')  # incremental or full
         entities = request.GET.get('entities', 'all')  # all, contacts, accounts, intern_roles
         
+        if sync_type not in ETL_SYNC_TYPES:
+            return ORJsonResponse({
+                'status': 'error',
+                'message': 'Invalid sync type. Use: incremental or full'
+            }, status=400)
+        if entities not in ETL_SYNC_ENTITIES:
+            return ORJsonResponse({
+                'status': 'error',
+                'message': 'Invalid entities. Use: all, contacts, accounts, or intern_roles'
+            }, status=400)
+        
         # Parse request body for specific IDs if provided
         specific_ids = None
         if request.content_type == 'application/json' and request.body:
-            data = json.loads(request.body.decode('utf-8'))
+            data = json_loads(request.body)
             specific_ids = data.get('ids', None)  # List of specific IDs to sync
         
-        # Track start time
+        # Track start time; the duration is measured on the monotonic clock
         start_time = timezone.now()
+        started = time.perf_counter()
         
-        logger.info(f"=== COMPREHENSIVE SYNC STARTED ===")
-        logger.info(f"Sync Type: {sync_type}")
-        logger.info(f"Entities: {entities}")
-        logger.info(f"Specific IDs: {specific_ids}")
+        logger.info(
+            "Comprehensive sync started - Type: %s, Entities: %s, Specific IDs: %s", sync_type, entities, specific_ids,
+            extra={'sync_type': sync_type, 'entities': entities}
+        )
         
         results = {
             'status': 'success',
             'sync_type': sync_type,
             'entities': entities,
-            'start_time': start_time.isoformat(),
+            'start_time': start_time,
             'results': {},
             'sync_summary': {}
         }
         
         handler = get_webhook_handler()
+        incremental = sync_type == 'incremental'
         
-        # Sync specific entities or all
+        # Specific IDs are synced inline; full entity syncs are queued as Celery tasks
+        queued_entities = []
         if entities in ['all', 'contacts']:
-            logger.info("Syncing contacts...")
             if specific_ids and 'contact_ids' in specific_ids:
-                # Sync specific contacts
                 contact_results = handler.sync_specific_contacts(specific_ids['contact_ids'])
                 results['results']['contacts'] = contact_results
             else:
-                # Sync all contacts
-                incremental = sync_type == 'incremental'
-                sync_contacts(incremental=incremental)
-                results['results']['contacts'] = 'completed'
+                queued_entities.append('contacts')
         
         if entities in ['all', 'accounts']:
-            logger.info("Syncing accounts...")
             if specific_ids and 'account_ids' in specific_ids:
-                # Sync specific accounts
                 account_results = handler.sync_specific_accounts(specific_ids['account_ids'])
                 results['results']['accounts'] = account_results
             else:
-                # Sync all accounts
-                incremental = sync_type == 'incremental'
-                sync_accounts(incremental=incremental)
-                results['results']['accounts'] = 'completed'
+                queued_entities.append('accounts')
         
         if entities in ['all', 'intern_roles']:
-            logger.info("Syncing intern roles...")
-            incremental = sync_type == 'incremental'
-            sync_intern_roles(incremental=incremental)
-            results['results']['intern_roles'] = 'completed'
+            queued_entities.append('intern_roles')
+        
+        jobs, busy = queue_etl_syncs(queued_entities, incremental)
+        if busy:
+            return etl_sync_busy_response(busy)
+        for entity, result in jobs.items():
+            results['results'][entity] = describe_etl_job(result)
+        
+        if not all(result.ready() for result in jobs.values()):
+            results['status'] = 'queued'
+            results['message'] = "Comprehensive sync queued"
+            return ORJsonResponse(results, status=202)
         
         # Calculate duration and provide summary
         end_time = timezone.now()
-        duration = end_time - start_time
+        duration_seconds = time.perf_counter() - started
         
-        results['end_time'] = end_time.isoformat()
-        results['duration'] = str(duration)
-        results['message'] = f"Comprehensive sync completed in {duration}"
+        results['end_time'] = end_time
+        results['duration_seconds'] = round(duration_seconds, 3)
+        results['message'] = f"Comprehensive sync completed in {duration_seconds:.2f}s"
         
         # Get current data counts for summary
-        from zoho_app.models import Contact, Account, InternRole
+        counts = get_table_row_counts([Contact, Account, InternRole])
         results['sync_summary'] = {
-            'total_contacts': Contact.objects.count(),
-            'total_accounts': Account.objects.count(),
-            'total_intern_roles': InternRole.objects.count(),
-            'sync_completed_at': end_time.isoformat()
+            'total_contacts': counts[Contact],
+            'total_accounts': counts[Account],
+            'total_intern_roles': counts[InternRole],
+            'sync_completed_at': end_time
         }
         
-        logger.info(f"=== COMPREHENSIVE SYNC COMPLETED ===")
-        logger.info(f"Duration: {duration}")
-        logger.info(f"Summary: {results['sync_summary']}")
+        logger.info(
+            "Comprehensive sync completed - Duration: %.2fs, Summary: %s", duration_seconds, results['sync_summary'],
+            extra={'sync_type': sync_type, 'entities': entities, 'duration_seconds': duration_seconds}
+        )
         
-        return JsonResponse(results, status=200)
+        return ORJsonResponse(results, status=200)
         
     except Exception as e:
         logger.error(f"Comprehensive sync error: {e}")
-        return JsonResponse({'error': str(e)}, status=500)
+        return ORJsonResponse({'error': str(e)}, status=500)
 
@@ -0,0 +1,16 @@
+"""
+Celery application for background processing
+"""
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'zoho_job_automation.settings')
+
+app = Celery('zoho_job_automation')
+
+# Read CELERY_* settings from Django settings
+app.config_from_object('django.conf:settings', namespace='CELERY')
+
+# Discover tasks.py modules in installed apps
+app.autodiscover_tasks()
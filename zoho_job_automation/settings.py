@@ -104,6 +104,23 @@ else:
     }
 
 
+# Cache
+# Shared Redis cache when REDIS_URL is set, otherwise a per-process memory cache
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -153,9 +170,35 @@ CORS_ALLOWED_ORIGINS = [
 
 CORS_ALLOW_ALL_ORIGINS = DEBUG
 
+# Celery settings
+# Tasks are queued on CELERY_BROKER_URL (or REDIS_URL); without a broker they run inline
+CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', os.getenv('REDIS_URL'))
+CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', CELERY_BROKER_URL)
+CELERY_TASK_ALWAYS_EAGER = not CELERY_BROKER_URL
+CELERY_TASK_SERIALIZER = 'json'
+CELERY_RESULT_SERIALIZER = 'json'
+CELERY_ACCEPT_CONTENT = ['json']
+CELERY_TASK_ROUTES = {
+    # Webhook-triggered CV processing runs on its own queue:
+    # celery -A zoho_job_automation worker -Q zoho_webhooks -c 8
+    'zoho_app.tasks.process_contact_async': {'queue': 'zoho_webhooks'},
+    'zoho_app.tasks.sync_single_contact_task': {'queue': 'zoho_webhooks'},
+    'zoho_app.tasks.sync_contact_batch_task': {'queue': 'zoho_webhooks'},
+}
+
+# Contact sync webhooks are collected in a Redis list for this many seconds and
+# then synced together (only when REDIS_URL is set)
+CONTACT_SYNC_REDIS_URL = os.getenv('REDIS_URL')
+CONTACT_SYNC_BATCH_WINDOW = int(os.getenv('CONTACT_SYNC_BATCH_WINDOW', 2))
+
 # Webhook settings
 WEBHOOK_SECRET = os.getenv('WEBHOOK_SECRET', 'your_webhook_secret_key_here')
 
+# Zoho webhook payloads are a few KB; anything far larger is rejected before parsing
+WEBHOOK_MAX_BODY_SIZE = int(os.getenv('WEBHOOK_MAX_BODY_SIZE', 256 * 1024))
+WEBHOOK_MAX_FIELDS = int(os.getenv('WEBHOOK_MAX_FIELDS', 500))
+DATA_UPLOAD_MAX_MEMORY_SIZE = WEBHOOK_MAX_BODY_SIZE
+
 # File upload settings
 CV_DOWNLOAD_DIR = os.getenv('CV_DOWNLOAD_DIR', os.path.join(BASE_DIR, 'downloads'))
 
@@ -163,6 +206,10 @@ CV_DOWNLOAD_DIR = os.getenv('CV_DOWNLOAD_DIR', os.path.join(BASE_DIR, 'downloads
 os.makedirs(CV_DOWNLOAD_DIR, exist_ok=True)
 
 # Logging configuration
+# Set APP_LOG_LEVEL=WARNING in production to drop the per-record INFO lines of the
+# zoho_app, etl and zoho loggers
+APP_LOG_LEVEL = os.getenv('APP_LOG_LEVEL', 'INFO')
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -201,17 +248,17 @@ LOGGING = {
         },
         'zoho_app': {
             'handlers': ['console', 'file'],
-            'level': 'INFO',
+            'level': APP_LOG_LEVEL,
             'propagate': False,
         },
         'etl': {
             'handlers': ['console', 'file'],
-            'level': 'INFO',
+            'level': APP_LOG_LEVEL,
             'propagate': False,
         },
         'zoho': {
             'handlers': ['console', 'file'],
-            'level': 'INFO',
+            'level': APP_LOG_LEVEL,
             'propagate': False,
         },
     },